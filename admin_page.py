@@ -0,0 +1,751 @@
+import os
+from pathlib import Path
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit, QGridLayout,
+    QMessageBox, QFileDialog, QTextEdit, QTableView, QDialog, QStyledItemDelegate,
+    QHeaderView, QProgressBar, QAbstractItemView, QCheckBox
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QRect, QEvent, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, pyqtSignal
+)
+from PyQt5.QtGui import QFont, QColor, QPainter
+from config import GAMES_DIR, TRASH_DIR
+from library import catalog, get_blob_store
+from thumbnails import get_loader, thumbnail_key
+from importer import ImportJob
+from copier import copy_file
+from trash import move_to_trash
+
+
+# ==================== Edit Game Dialog ====================
+class EditGameDialog(QDialog):
+    def __init__(self, parent, game):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Game")
+        self.game = game
+        self.original_name = game["name"]
+        self.original_folder = game["folder"]
+        self.original_thumbnail = game.get("thumbnail", "")
+        self.original_desc = game.get("description", "")
+        self.new_thumb_path = ""  # hanya diisi jika user upload baru
+        self.setModal(True)
+        # Dialog dibuat per edit; tanpa ini dialog (dan koneksi ke loader) menumpuk
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(500, 400)
+        self.init_ui()
+
+    def init_ui(self):
+        self.setObjectName("editGameDialog")
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(24, 24, 24, 24)
+        layout.setSpacing(16)
+
+        # ===== TITLE =====
+        title = QLabel("✏️ Edit Data Game")
+        title.setAlignment(Qt.AlignCenter)
+        title.setObjectName("dialogTitle")
+        layout.addWidget(title)
+
+        # ===== NAMA GAME =====
+        layout.addWidget(QLabel("Nama Game"))
+        self.name_edit = QLineEdit(self.original_name)
+        layout.addWidget(self.name_edit)
+
+        # ===== FOLDER =====
+        layout.addWidget(QLabel("Folder Game"))
+        self.folder_label = QLabel(self.original_folder)
+        self.folder_label.setObjectName("folderPath")
+        layout.addWidget(self.folder_label)
+
+        # ===== THUMBNAIL =====
+        layout.addWidget(QLabel("Thumbnail"))
+
+        thumb_layout = QHBoxLayout()
+
+        self.current_thumb_label = QLabel()
+        self.current_thumb_label.setFixedSize(90, 90)
+        self.current_thumb_label.setObjectName("thumbPreview")
+        self.current_thumb_label.setAlignment(Qt.AlignCenter)
+
+        self.thumb_key = ""
+        get_loader().ready.connect(self.on_thumbnail_ready)
+        if self.original_thumbnail and os.path.exists(self.original_thumbnail):
+            self.show_thumbnail(self.original_thumbnail, 90, Qt.KeepAspectRatioByExpanding)
+
+        self.change_thumb_btn = QPushButton("Ganti Thumbnail")
+        self.change_thumb_btn.clicked.connect(self.select_new_thumbnail)
+
+        thumb_layout.addWidget(self.current_thumb_label)
+        thumb_layout.addWidget(self.change_thumb_btn)
+        thumb_layout.addStretch()
+
+        layout.addLayout(thumb_layout)
+
+        # ===== DESKRIPSI =====
+        layout.addWidget(QLabel("Deskripsi"))
+        self.desc_edit = QTextEdit(self.original_desc)
+        self.desc_edit.setMaximumHeight(110)
+        layout.addWidget(self.desc_edit)
+
+        # ===== TOMBOL BAWAH =====
+        btn_layout = QHBoxLayout()
+
+        cancel_btn = QPushButton("Batal")
+        cancel_btn.setObjectName("danger")
+        cancel_btn.clicked.connect(self.reject)
+
+        save_btn = QPushButton("Simpan")
+        save_btn.clicked.connect(self.validate_and_accept)
+
+        btn_layout.addStretch()
+        btn_layout.addWidget(cancel_btn)
+        btn_layout.addWidget(save_btn)
+
+        layout.addLayout(btn_layout)
+
+        self.setLayout(layout)
+
+
+    def select_new_thumbnail(self):
+        file, _ = QFileDialog.getOpenFileName(self, "Pilih Thumbnail Baru", "", "Image Files (*.png *.jpg *.jpeg)")
+        if file:
+            self.new_thumb_path = file
+            # Update preview
+            self.show_thumbnail(file, 60, Qt.KeepAspectRatio)
+
+    def show_thumbnail(self, path, size, mode):
+        self.thumb_key = thumbnail_key(path, QSize(size, size), mode)
+        pixmap = get_loader().request(path, size, mode)
+        if pixmap is not None:
+            self.current_thumb_label.setPixmap(pixmap)
+
+    def on_thumbnail_ready(self, key, pixmap):
+        if key == self.thumb_key and not pixmap.isNull():
+            self.current_thumb_label.setPixmap(pixmap)
+
+    def done(self, result):
+        # Sinyal loader berhenti di sini, bukan menunggu deleteLater
+        try:
+            get_loader().ready.disconnect(self.on_thumbnail_ready)
+        except TypeError:
+            pass  # sudah diputus (done dipanggil dua kali)
+        super().done(result)
+
+    def validate_and_accept(self):
+        new_name = self.name_edit.text().strip()
+        if not new_name:
+            QMessageBox.warning(self, "Error", "Nama game tidak boleh kosong!")
+            return
+
+        # Deteksi perubahan
+        name_changed = (new_name != self.original_name)
+        desc_changed = (self.desc_edit.toPlainText() != self.original_desc)
+        thumb_changed = (self.new_thumb_path != "")
+
+        if not (name_changed or desc_changed or thumb_changed):
+            # Tidak ada perubahan → tutup saja
+            self.reject()
+            return
+
+        game = self.game
+        changes = {}
+
+        # 1. Rename folder jika nama berubah
+        if name_changed:
+            old_folder = Path(self.original_folder)
+            new_folder = GAMES_DIR / new_name
+            if old_folder.exists():
+                try:
+                    old_folder.rename(new_folder)
+                    changes["folder"] = str(new_folder)
+                except Exception as e:
+                    QMessageBox.critical(self, "Error", f"Gagal rename folder:\n{str(e)}")
+                    return
+            # Folder tidak ada → biarkan saja (mungkin sudah dihapus manual)
+            changes["name"] = new_name
+
+        # 2. Ganti thumbnail jika ada yang baru
+        if thumb_changed:
+            ext = Path(self.new_thumb_path).suffix
+            new_thumb_name = f"thumbnail{ext}"
+            new_thumb_dest = Path(changes.get("folder", game["folder"])) / new_thumb_name
+            try:
+                old_thumb = game.get("thumbnail", "")
+                copy_file(self.new_thumb_path, new_thumb_dest)
+                changes["thumbnail"] = str(new_thumb_dest)
+                # Versi kecil dari cover lama tidak boleh dipakai lagi
+                for path in {old_thumb, str(new_thumb_dest)}:
+                    if path:
+                        get_loader().invalidate(path)
+            except Exception as e:
+                QMessageBox.warning(self, "Peringatan", f"Gagal mengganti thumbnail:\n{str(e)}")
+
+        # 3. Perbarui deskripsi
+        if desc_changed:
+            changes["description"] = self.desc_edit.toPlainText()
+
+        # Simpan ke katalog (hanya baris game ini yang ditulis)
+        try:
+            catalog.update(game["id"], changes)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Gagal menyimpan data:\n{str(e)}")
+            return
+
+        self.accept()
+
+
+# ==================== Admin Game Table ====================
+class GameTableModel(QAbstractTableModel):
+    """Daftar game untuk tabel admin; baris ditambah/dihapus satu per satu
+    mengikuti sinyal katalog, tanpa membangun ulang tabel.
+
+    Pengurutan dikerjakan di sini (satu list.sort dengan key), bukan oleh
+    proxy yang membandingkan baris lewat data() satu per satu.
+    """
+    HEADERS = ["No", "Nama Game", "Deskripsi", "Aksi"]
+    ACTIONS_COLUMN = 3
+    SORT_KEYS = (
+        lambda game: game["id"],
+        lambda game: game.get("name", "").lower(),
+        lambda game: game.get("description", "").lower(),
+        lambda game: game["id"],
+    )
+
+    def __init__(self, games, parent=None):
+        super().__init__(parent)
+        self.games = list(games)
+        self.sort_column = 0
+        self.sort_order = Qt.AscendingOrder
+        self.keys = []  # sort_key per baris, sejajar dengan self.games
+        self.key_of = {}  # id game → sort_key
+        self.sort(self.sort_column, self.sort_order)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.games)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        game = self.games[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return game.get("name", "")
+            if column == 2:
+                # Dipotong view (elide) sesuai lebar kolom; baris baru diratakan
+                return " ".join(game.get("description", "").split())
+        elif role == Qt.ToolTipRole and column == 2:
+            return game.get("description", "")
+        elif role == Qt.UserRole:
+            return game["id"]
+        return None
+
+    def sort_key(self, game):
+        # id sebagai pemutus seri → setiap game punya posisi unik (bisa dicari biner)
+        return self.SORT_KEYS[self.sort_column](game), game["id"]
+
+    def position(self, key):
+        """Indeks pertama di self.keys yang tidak mendahului key (bisect untuk dua arah urut)"""
+        descending = self.sort_order == Qt.DescendingOrder
+        low, high = 0, len(self.keys)
+        while low < high:
+            middle = (low + high) // 2
+            if (self.keys[middle] > key) if descending else (self.keys[middle] < key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def row_of(self, game):
+        key = self.key_of.get(game["id"])
+        if key is None:
+            return -1
+        return self.position(key)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column, self.sort_order = column, order
+        self.layoutAboutToBeChanged.emit()
+        # Seleksi dll. (persistent index) ikut pindah bersama game-nya
+        persistent = self.persistentIndexList()
+        tracked = [self.games[index.row()] for index in persistent]
+        self.key_of = {game["id"]: self.sort_key(game) for game in self.games}
+        self.games.sort(key=lambda game: self.key_of[game["id"]], reverse=order == Qt.DescendingOrder)
+        self.keys = [self.key_of[game["id"]] for game in self.games]
+        rows = {id(game): row for row, game in enumerate(self.games)}
+        self.changePersistentIndexList(
+            persistent, [self.index(rows[id(game)], index.column()) for game, index in zip(tracked, persistent)]
+        )
+        self.layoutChanged.emit()
+
+    # Perubahan satu game hanya menyentuh barisnya sendiri (cari posisi dengan
+    # bisect), bukan mengurutkan ulang seluruh tabel: proxy cukup memfilter
+    # baris itu saja. Nomor di kolom "No" ikut bergeser karena view menggambar
+    # ulang setelah baris ditambah/dihapus/dipindah.
+    def insert_game(self, game):
+        if game["id"] in self.key_of:
+            self.update_game(game)
+            return
+        key = self.sort_key(game)
+        row = self.position(key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.games.insert(row, game)
+        self.keys.insert(row, key)
+        self.key_of[game["id"]] = key
+        self.endInsertRows()
+
+    def update_game(self, game):
+        row = self.row_of(game)
+        if row < 0:
+            return
+        key = self.sort_key(game)
+        if key == self.keys[row]:
+            self.games[row] = game
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+            return
+        # Posisi urut berubah (misal nama diganti): hapus lalu sisipkan di posisi
+        # barunya. Sengaja bukan beginMoveRows, karena QSortFilterProxyModel
+        # memperlakukan pindah baris sebagai perubahan layout dan memfilter
+        # ulang semua baris.
+        self.remove_game(game)
+        self.insert_game(game)
+
+    def remove_game(self, game):
+        row = self.row_of(game)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.games[row]
+        del self.keys[row]
+        del self.key_of[game["id"]]
+        self.endRemoveRows()
+
+
+class GameFilterProxy(QSortFilterProxyModel):
+    """Filter nama game; urutan diteruskan ke GameTableModel.sort"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.needle = ""
+
+    def set_needle(self, text):
+        self.needle = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, row, parent):
+        return not self.needle or self.needle in self.sourceModel().games[row].get("name", "").lower()
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Nomor urut baris yang tampil (1..n), bukan baris di model sumber
+        if index.isValid() and index.column() == 0 and role == Qt.DisplayRole:
+            return index.row() + 1
+        return super().data(index, role)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
+class GameActionsDelegate(QStyledItemDelegate):
+    """Menggambar tombol Edit/Hapus di kolom Aksi (tanpa widget per baris)"""
+    edit_clicked = pyqtSignal(int)    # id game
+    delete_clicked = pyqtSignal(int)  # id game
+
+    BUTTON_SIZE = QSize(100, 28)
+    MARGIN = 6
+    BUTTONS = (
+        # nama, label, warna, warna saat hover
+        ("edit", "Edit ✏️", "#2563eb", "#1d4ed8"),
+        ("delete", "Hapus 🗑️", "#dc2626", "#b91c1c"),
+    )
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.hover = None  # (baris, nama tombol)
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def button_rects(self, cell):
+        size = self.BUTTON_SIZE
+        top = cell.top() + (cell.height() - size.height()) // 2
+        left = cell.left() + self.MARGIN
+        rects = []
+        for name, *_ in self.BUTTONS:
+            rects.append((name, QRect(left, top, size.width(), size.height())))
+            left += size.width() + self.MARGIN
+        return rects
+
+    def button_at(self, index, pos):
+        if not index.isValid() or index.column() != GameTableModel.ACTIONS_COLUMN:
+            return None
+        for name, rect in self.button_rects(self.view.visualRect(index)):
+            if rect.contains(pos):
+                return name
+        return None
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        rects = dict(self.button_rects(option.rect))
+        for name, label, color, hover_color in self.BUTTONS:
+            hovered = self.hover == (index.row(), name)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(hover_color if hovered else color))
+            painter.drawRoundedRect(rects[name], 6, 6)
+            painter.setPen(Qt.white)
+            painter.drawText(rects[name], Qt.AlignCenter, label)
+        painter.restore()
+
+    @classmethod
+    def width(cls):
+        return len(cls.BUTTONS) * (cls.BUTTON_SIZE.width() + cls.MARGIN) + cls.MARGIN
+
+    def sizeHint(self, option, index):
+        return QSize(self.width(), self.BUTTON_SIZE.height() + 2 * self.MARGIN)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            name = self.button_at(index, event.pos())
+            if name is not None:
+                game_id = index.data(Qt.UserRole)
+                (self.edit_clicked if name == "edit" else self.delete_clicked).emit(game_id)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def eventFilter(self, obj, event):
+        # Hover dilacak di viewport supaya warna kembali normal saat kursor keluar tombol
+        if event.type() in (QEvent.MouseMove, QEvent.Leave):
+            hover = None
+            if event.type() == QEvent.MouseMove:
+                index = self.view.indexAt(event.pos())
+                name = self.button_at(index, event.pos())
+                hover = (index.row(), name) if name is not None else None
+            if hover != self.hover:
+                previous, self.hover = self.hover, hover
+                for state in (previous, hover):
+                    if state is not None:
+                        cell = self.view.model().index(state[0], GameTableModel.ACTIONS_COLUMN)
+                        self.view.viewport().update(self.view.visualRect(cell))
+                self.view.viewport().setCursor(Qt.PointingHandCursor if hover else Qt.ArrowCursor)
+        return False
+
+
+# ==================== Admin Window ====================
+class AdminWindow(QWidget):
+    def __init__(self, parent):
+        super().__init__()
+        self.parent = parent
+        self.folder_path = ""
+        self.thumb_path = ""
+        self.import_job = None
+        self.import_game = None
+        self.init_ui()
+
+    def init_ui(self):
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(20)
+
+        # Header
+        header_layout = QHBoxLayout()
+        title = QLabel("🛠️ Panel Admin")
+        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setObjectName("pageTitle")
+        home_btn = QPushButton("🏠 Home")
+        home_btn.clicked.connect(self.go_to_home)
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+        header_layout.addWidget(home_btn)
+        main_layout.addLayout(header_layout)
+
+        # Form
+        form_layout = QGridLayout()
+        form_layout.setSpacing(10)
+
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Nama Game")
+        self.folder_btn = QPushButton("📁 Pilih Folder Game")
+        self.folder_btn.clicked.connect(self.select_folder)
+        self.thumb_btn = QPushButton("🖼️ Upload Thumbnail")
+        self.thumb_btn.clicked.connect(self.select_thumbnail)
+        self.desc_edit = QTextEdit()
+        self.desc_edit.setPlaceholderText("Deskripsi game...")
+        self.desc_edit.setMaximumHeight(80)
+        self.dedup_check = QCheckBox("♻️ Hemat ruang (file yang sama disimpan sekali)")
+        self.dedup_check.setToolTip(
+            "File disimpan di data/games/.store dan folder game berisi hardlink.\n"
+            "Edisi lain / impor ulang dengan isi sama hampir tidak memakan ruang."
+        )
+        self.save_btn = QPushButton("💾 Simpan Game")
+        self.save_btn.setObjectName("primary")
+        self.save_btn.clicked.connect(self.save_game)
+
+        # Progress impor (hanya tampil saat menyalin)
+        self.import_status = QLabel()
+        self.import_bar = QProgressBar()
+        self.import_bar.setTextVisible(True)
+        self.cancel_import_btn = QPushButton("Batal")
+        self.cancel_import_btn.clicked.connect(self.cancel_import)
+        import_layout = QHBoxLayout()
+        import_layout.addWidget(self.import_bar)
+        import_layout.addWidget(self.cancel_import_btn)
+
+        form_layout.addWidget(QLabel("Nama Game:"), 0, 0)
+        form_layout.addWidget(self.name_edit, 0, 1)
+        form_layout.addWidget(QLabel("Folder Game:"), 1, 0)
+        form_layout.addWidget(self.folder_btn, 1, 1)
+        form_layout.addWidget(QLabel("Thumbnail:"), 2, 0)
+        form_layout.addWidget(self.thumb_btn, 2, 1)
+        form_layout.addWidget(QLabel("Deskripsi:"), 3, 0)
+        form_layout.addWidget(self.desc_edit, 3, 1)
+        form_layout.addWidget(self.dedup_check, 4, 1, Qt.AlignLeft)
+        form_layout.addWidget(self.save_btn, 4, 1, Qt.AlignRight)
+        form_layout.addWidget(self.import_status, 5, 1)
+        form_layout.addLayout(import_layout, 6, 1)
+        self.set_importing(False)
+        self.import_status.hide()
+
+        # Table
+        table_label = QLabel("📋 Daftar Game yang Tersimpan")
+        table_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        table_label.setObjectName("sectionTitle")
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("🔍 Filter nama game...")
+        self.filter_edit.setMaximumWidth(280)
+        # Debounce: filter baru diterapkan setelah user berhenti mengetik sebentar
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+        table_header = QHBoxLayout()
+        table_header.addWidget(table_label)
+        table_header.addStretch()
+        table_header.addWidget(self.filter_edit)
+
+        self.table = QTableView()
+
+        main_layout.addLayout(form_layout)
+        main_layout.addLayout(table_header)
+        self.purge_status = QLabel()
+        self.purge_status.hide()
+        main_layout.addWidget(self.purge_status)
+        main_layout.addWidget(self.table)
+        self.setLayout(main_layout)
+        self.load_game_table()
+
+    def go_to_home(self):
+        self.parent.stack.setCurrentWidget(self.parent.home)
+
+    def show_purge_progress(self, done, total):
+        self.purge_status.setText(f"🗑️ Membersihkan game yang dihapus... {done}/{total} file")
+        self.purge_status.show()
+
+    def hide_purge_progress(self):
+        self.purge_status.hide()
+
+    def select_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Pilih Folder Game")
+        if folder:
+            self.folder_path = folder
+            self.folder_btn.setText(f"📁 {os.path.basename(folder)}")
+
+    def select_thumbnail(self):
+        file, _ = QFileDialog.getOpenFileName(self, "Pilih Thumbnail", "", "Image Files (*.png *.jpg *.jpeg)")
+        if file:
+            self.thumb_path = file
+            self.thumb_btn.setText(f"🖼️ {os.path.basename(file)}")
+
+    def save_game(self):
+        name = self.name_edit.text().strip()
+        if not name or not self.folder_path:
+            QMessageBox.warning(self, "Error", "Nama game dan folder wajib diisi!")
+            return
+
+        if self.import_job is not None:
+            return
+
+        game_folder = GAMES_DIR / name
+        extra = []
+        thumb_dest = ""
+        if self.thumb_path:
+            ext = Path(self.thumb_path).suffix
+            extra.append((self.thumb_path, f"thumbnail{ext}"))
+            thumb_dest = str(game_folder / f"thumbnail{ext}")
+
+        # Game baru masuk katalog setelah semua file selesai disalin
+        self.import_game = {
+            "name": name,
+            "folder": str(game_folder),
+            "thumbnail": thumb_dest,
+            "description": self.desc_edit.toPlainText() or "Tidak ada deskripsi."
+        }
+        store = get_blob_store() if self.dedup_check.isChecked() else None
+        self.import_job = ImportJob(self.folder_path, game_folder, extra, store)
+        self.import_job.progress.connect(self.update_import_progress)
+        self.import_job.finished.connect(self.on_import_finished)
+        self.import_job.cancelled.connect(self.on_import_cancelled)
+        self.import_job.error.connect(self.on_import_error)
+
+        if self.import_job.resumed:
+            self.import_status.setText("Melanjutkan impor sebelumnya...")
+        else:
+            self.import_status.setText("Memindai folder...")
+        self.import_bar.setValue(0)
+        self.import_status.show()
+        self.set_importing(True)
+        self.import_job.start()
+
+    # ---------- Impor di background ----------
+    def set_importing(self, importing):
+        self.save_btn.setEnabled(not importing)
+        self.folder_btn.setEnabled(not importing)
+        self.dedup_check.setEnabled(not importing)
+        self.import_bar.setVisible(importing)
+        self.cancel_import_btn.setVisible(importing)
+
+    def update_import_progress(self, done_bytes, total_bytes, done_files, total_files):
+        self.import_bar.setMaximum(100)
+        self.import_bar.setValue(int(done_bytes * 100 / total_bytes) if total_bytes > 0 else 0)
+        format_bytes = self.parent.format_bytes
+        self.import_status.setText(
+            f"Menyalin... {format_bytes(done_bytes)} / {format_bytes(total_bytes)} "
+            f"({done_files}/{total_files} file)"
+        )
+
+    def finish_import_job(self):
+        self.import_job.wait()
+        self.import_job = None
+        self.set_importing(False)
+
+    def cancel_import(self, wait=False):
+        if self.import_job is None:
+            return
+        self.import_job.cancel()
+        if wait:
+            self.import_job.wait()
+
+    def on_import_cancelled(self):
+        self.finish_import_job()
+        self.import_status.setText("Impor dibatalkan. Klik Simpan lagi untuk melanjutkan.")
+
+    def on_import_error(self, error_msg):
+        self.finish_import_job()
+        self.import_status.setText("Impor gagal. Klik Simpan lagi untuk melanjutkan.")
+        QMessageBox.critical(self, "Error Impor", f"Gagal menyalin game:\n{error_msg}")
+
+    def on_import_finished(self, folder):
+        files = self.import_job.files
+        self.finish_import_job()
+        self.import_status.hide()
+        catalog.add(self.import_game, files)
+        self.import_game = None
+
+        msg = QMessageBox(self)
+        msg.setWindowTitle("✅ Berhasil")
+        msg.setText("🎮 Game berhasil ditambahkan!")
+        msg.setInformativeText("Game sekarang sudah tersedia di halaman Home.")
+        msg.setIcon(QMessageBox.Information)
+
+        msg.setProperty("tone", "info")
+
+        msg.exec_()
+
+        self.clear_form()
+        self.parent.go_to_home_main()
+
+    def clear_form(self):
+        self.name_edit.clear()
+        self.folder_path = ""
+        self.thumb_path = ""
+        self.folder_btn.setText("📁 Pilih Folder Game")
+        self.thumb_btn.setText("🖼️ Upload Thumbnail")
+        self.desc_edit.clear()
+
+    def load_game_table(self):
+        # Model/view: hanya baris yang terlihat yang digambar, jadi tetap ringan
+        # untuk puluhan ribu game
+        self.model = GameTableModel(catalog.games, self)
+        self.proxy = GameFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.table.setObjectName("adminGameTable")
+        self.table.setModel(self.proxy)
+        self.table.setAlternatingRowColors(True)  # ✅ biar lebih rapi
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(44)
+        self.table.setShowGrid(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setWordWrap(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(GameTableModel.ACTIONS_COLUMN, QHeaderView.Fixed)
+        self.actions_delegate = GameActionsDelegate(self.table)
+        self.actions_delegate.edit_clicked.connect(self.edit_game)
+        self.actions_delegate.delete_clicked.connect(self.delete_game)
+        self.table.setItemDelegateForColumn(GameTableModel.ACTIONS_COLUMN, self.actions_delegate)
+        self.table.setColumnWidth(GameTableModel.ACTIONS_COLUMN, GameActionsDelegate.width())
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
+
+        # Selanjutnya tabel cukup mengikuti perubahan katalog
+        catalog.game_added.connect(self.model.insert_game)
+        catalog.game_updated.connect(self.model.update_game)
+        catalog.game_removed.connect(self.model.remove_game)
+
+    def apply_filter(self):
+        self.proxy.set_needle(self.filter_edit.text().strip())
+
+    def edit_game(self, game_id):
+        game = catalog.get(game_id)
+        if game is None:
+            return
+        dialog = EditGameDialog(self, game)
+        if dialog.exec_() == QDialog.Accepted:
+            self.parent.go_to_home_main()
+
+    def delete_game(self, game_id):
+        game = catalog.get(game_id)
+        if game is None:
+            return
+        reply = QMessageBox.question(
+            self, "Konfirmasi Hapus",
+            f"Yakin ingin menghapus game '{game['name']}'?\nIni akan menghapus folder game dan data.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            # Folder cukup di-rename ke trash; isinya dihapus di background
+            folder_path = Path(game["folder"])
+            trash_dir = None
+            if folder_path.exists():
+                try:
+                    trash_dir = move_to_trash(folder_path, TRASH_DIR).parent
+                except OSError as e:
+                    QMessageBox.critical(
+                        self, "Error",
+                        f"Gagal menghapus folder game:\n{e}\n\n"
+                        "Tutup program yang memakai folder ini lalu coba lagi."
+                    )
+                    return
+
+            catalog.remove(game_id)
+            self.parent.purge_trash(trash_dir)
+
+            QMessageBox.information(self, "Sukses", "Game berhasil dihapus!")
+            self.parent.go_to_home_main()
@@ -0,0 +1,95 @@
+"""Benchmark tabel admin: biaya perubahan katalog satu per satu.
+
+Tabel (GameTableModel + GameFilterProxy + QTableView yang tampil) diisi
+--games game, diurutkan per nama, lalu diukur --changes kali tambah game,
+ubah nama (posisi urut berubah), ubah deskripsi (posisi tetap) dan hapus
+game, masing-masing lewat jalur yang sama dengan sinyal katalog. Jumlah
+panggilan filterAcceptsRow ikut dihitung.
+
+Jalankan dari root repo:
+    python benchmarks/bench_admin.py --games 20000 --changes 1000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from bench_search import make_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--changes", type=int, default=1000)
+    parser.add_argument("--filter", default="", help="teks filter nama yang aktif selama pengukuran")
+    args = parser.parse_args()
+
+    from PyQt5.QtWidgets import QApplication, QTableView
+    from PyQt5.QtCore import Qt
+    import admin_page
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    calls = [0]
+    accepts = admin_page.GameFilterProxy.filterAcceptsRow
+
+    def counted(self, row, parent):
+        calls[0] += 1
+        return accepts(self, row, parent)
+
+    admin_page.GameFilterProxy.filterAcceptsRow = counted
+
+    games = [{"id": i, "name": name, "folder": f"game-{i}", "thumbnail": "", "description": desc}
+             for i, name, desc in make_catalog(args.games + args.changes)]
+    model = admin_page.GameTableModel(games[:args.games])
+    proxy = admin_page.GameFilterProxy()
+    proxy.setSourceModel(model)
+    view = QTableView()
+    view.setModel(proxy)
+    view.setSortingEnabled(True)
+    view.sortByColumn(1, Qt.AscendingOrder)
+    view.resize(1000, 700)
+    view.show()
+    proxy.set_needle(args.filter)
+    app.processEvents()
+
+    rng = random.Random(2)
+    extra = games[args.games:]
+    existing = games[:args.games]
+
+    def renamed(game):
+        changed = dict(game)
+        changed["name"] = rng.choice(existing)["name"] + " X"
+        return changed
+
+    def redescribed(game):
+        changed = dict(game)
+        changed["description"] = game["description"][::-1]
+        return changed
+
+    phases = [
+        ("tambah", lambda: [model.insert_game(game) for game in extra]),
+        ("ubah nama", lambda: [model.update_game(renamed(game)) for game in rng.sample(existing, args.changes)]),
+        ("ubah deskripsi", lambda: [model.update_game(redescribed(game)) for game in rng.sample(existing, args.changes)]),
+        ("hapus", lambda: [model.remove_game(game) for game in rng.sample(existing, args.changes)]),
+    ]
+    print(f"{args.games} game, {args.changes} perubahan per fase, filter {args.filter!r}:")
+    for name, run in phases:
+        calls[0] = 0
+        started = time.perf_counter()
+        run()
+        app.processEvents()
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<15}: {elapsed * 1000:9.1f} ms  {elapsed / args.changes * 1e6:8.0f} us/perubahan  "
+              f"{calls[0]:>9} filterAcceptsRow")
+    ordered = [model.games[row]["name"].lower() for row in range(model.rowCount())]
+    assert ordered == sorted(ordered), "urutan tabel rusak"
+    assert model.rowCount() == args.games, "jumlah baris salah"
+
+
+if __name__ == "__main__":
+    main()
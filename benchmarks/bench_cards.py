@@ -0,0 +1,108 @@
+"""Benchmark GameCard: waktu konstruksi + polish stylesheet per kartu.
+
+Kartu dibuat di dalam satu widget induk dengan styles.qss terpasang di
+level aplikasi (seperti MainWindow), lalu per kartu diukur empat fase:
+konstruksi (GameCard(...)), polish (ensurePolished, di sinilah Qt
+mem-parse & mencocokkan CSS), render pertama (grab ke QPixmap) dan
+repaint (render ulang kartu yang sama, seperti saat grid di-scroll).
+
+Fase "scroll" meniru grid virtual: sekumpulan kecil kartu (--pool) diisi
+ulang dengan game lain lalu digambar, melewati semua game dua kali; putaran
+kedua ("scroll ulang") adalah game yang sudah pernah tampil. Dengan
+--bitmap kartu memakai bitmap yang di-cache (HomeWindow.CARD_BITMAPS).
+
+Jalankan dari root repo:
+    python benchmarks/bench_cards.py --cards 500
+    python benchmarks/bench_cards.py --cards 150 --bitmap
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from bench_search import make_catalog
+
+
+def measure(count, bitmap, pool_size):
+    from PyQt5.QtWidgets import QApplication, QWidget
+    from PyQt5.QtGui import QPixmap, QPixmapCache
+    import main
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    with open(main.STYLESHEET_PATH, "r", encoding="utf-8") as f:
+        app.setStyleSheet(f.read())
+    if bitmap:
+        QPixmapCache.setCacheLimit(QPixmapCache.cacheLimit() + main.CARD_FACE_CACHE_KB)
+
+    parent = QWidget()
+    parent.resize(1200, 800)
+    parent.show()
+    games = [{"id": i, "name": name, "folder": f"game-{i}", "thumbnail": "", "description": description}
+             for i, name, description in make_catalog(count)]
+
+    # Pemanasan: import & cache style pertama tidak ikut dihitung
+    warmup = main.GameCard(games[0], bitmap=bitmap)
+    warmup.setParent(parent)
+    warmup.ensurePolished()
+    warmup.grab()
+
+    phases = {"construct": [], "polish": [], "render": [], "repaint": [], "scroll": [], "scroll ulang": []}
+    target = QPixmap(parent.size())
+    cards = []
+    for game in games:
+        t0 = time.perf_counter()
+        card = main.GameCard(game, bitmap=bitmap)
+        card.setParent(parent)
+        t1 = time.perf_counter()
+        card.ensurePolished()
+        t2 = time.perf_counter()
+        card.grab()
+        t3 = time.perf_counter()
+        card.render(target)
+        t4 = time.perf_counter()
+        phases["construct"].append(t1 - t0)
+        phases["polish"].append(t2 - t1)
+        phases["render"].append(t3 - t2)
+        phases["repaint"].append(t4 - t3)
+        cards.append(card)
+
+    pool = cards[:pool_size]
+    for phase in ("scroll", "scroll ulang"):
+        for i, game in enumerate(games):
+            card = pool[i % len(pool)]
+            t0 = time.perf_counter()
+            card.set_game(game)
+            card.grab()
+            phases[phase].append(time.perf_counter() - t0)
+    return phases
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--bitmap", action="store_true", help="kartu dengan bitmap yang di-cache")
+    parser.add_argument("--pool", type=int, default=24, help="jumlah kartu yang dipakai ulang saat scroll")
+    args = parser.parse_args()
+
+    phases = measure(args.cards, args.bitmap, args.pool)
+    mode = "bitmap" if args.bitmap else "widget"
+    print(f"{args.cards} kartu, mode {mode} (median / p95 per kartu, total):")
+    total = 0.0
+    for name, samples in phases.items():
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        if name in ("construct", "polish", "render"):
+            total += sum(samples)
+        print(f"  {name:<12}: {statistics.median(samples) * 1e6:8.0f} us  {p95 * 1e6:8.0f} us  "
+              f"{sum(samples) * 1000:8.1f} ms")
+    per_card = (sum(phases["construct"]) + sum(phases["polish"])) / args.cards
+    print(f"  konstruksi+polish rata-rata: {per_card * 1e6:.0f} us/kartu, semua fase {total * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark salinan impor: shutil.copy2 satu per satu vs copier.copy_files.
+
+"copier + hash" adalah konfigurasi yang benar-benar dipakai impor
+(ImportJob.copy: checksum dihitung sambil menyalin). File besar tetap
+disalin lewat copy_file_range/sendfile dan sumbernya di-hash paralel di
+thread lain, jadi batas atasnya kecepatan SHA-256 satu core (dicetak di
+awal sebagai "sha256"); di mesin satu core hash & salinan berebut CPU.
+"copier" tanpa hasher sebagai pembanding.
+
+Dua bentuk folder sintetis dibuat di direktori sementara:
+  - banyak file kecil (aset game), terikat latensi per file
+  - sedikit file besar (pak/archive), terikat satu aliran data
+
+Jalankan dari root repo:
+    python benchmarks/bench_copy.py --small-files 20000 --large-files 2 --large-mb 512
+
+Catatan: file sumber baru saja ditulis sehingga biasanya masih di page
+cache; angka ini mengukur overhead salinan, bukan kecepatan baca disk dingin.
+"""
+import os
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import copier
+from importer import ImportJob
+
+MB = 1024 * 1024
+
+
+def make_small_tree(root, count, size):
+    # Struktur mirip folder game: beberapa level subfolder, file kecil
+    payload = os.urandom(size)
+    for i in range(count):
+        folder = root / f"assets{i % 16:02d}" / f"pack{i % 97:02d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"asset{i:06d}.dat").write_bytes(payload)
+
+
+def make_large_tree(root, count, size_mb):
+    root.mkdir(parents=True, exist_ok=True)
+    block = os.urandom(4 * MB)
+    for i in range(count):
+        with open(root / f"data{i}.pak", "wb") as f:
+            for _ in range(max(1, size_mb // 4)):
+                f.write(block)
+
+
+def list_files(source, dest):
+    files = []
+    for root, _, names in os.walk(source):
+        rel = Path(root).relative_to(source)
+        for name in names:
+            src = Path(root) / name
+            files.append((src, dest / rel / name, src.stat().st_size))
+    return files
+
+
+def copy_sequential(files):
+    for src, dst, _ in files:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dst)
+
+
+def copy_parallel(files):
+    copier.copy_files(files)
+
+
+def copy_import(files):
+    # Sama seperti ImportJob.run: copy_files dengan ImportJob.copy (MultiHash per file)
+    dest = os.path.commonpath([dst for _, dst, _ in files])
+    job = ImportJob(os.path.commonpath([src for src, _, _ in files]), dest)
+    copier.copy_files(files, copy=job.copy)
+
+
+def run(label, source, work, repeat):
+    files = list_files(source, work / "dest")
+    total_bytes = sum(size for _, _, size in files)
+    print(f"[{label}] {len(files)} file, {total_bytes / MB:.0f} MB")
+    for name, copy in (("shutil.copy2", copy_sequential), ("copier", copy_parallel), ("copier + hash", copy_import)):
+        best = None
+        for _ in range(repeat):
+            shutil.rmtree(work / "dest", ignore_errors=True)
+            started = time.perf_counter()
+            copy(files)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"  {name:<14}: {best:7.2f} s  {total_bytes / MB / best:8.1f} MB/s  {len(files) / best:9.0f} file/s")
+    shutil.rmtree(work / "dest", ignore_errors=True)
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--small-files", type=int, default=20000)
+    parser.add_argument("--small-kb", type=int, default=16)
+    parser.add_argument("--large-files", type=int, default=2)
+    parser.add_argument("--large-mb", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3, help="ambil waktu terbaik dari N kali")
+    parser.add_argument("--dir", default=None, help="direktori sementara (default: temp sistem)")
+    args = parser.parse_args()
+
+    print(f"workers          : {copier.WORKERS}")
+    print(f"kernel copy      : {'copy_file_range' if hasattr(os, 'copy_file_range') else 'sendfile' if hasattr(os, 'sendfile') else 'tidak ada (buffer)'}")
+    print(f"cpu              : {os.cpu_count()}")
+    data = os.urandom(64 * MB)
+    started = time.perf_counter()
+    hashlib.sha256(data).digest()
+    print(f"sha256           : {64 / (time.perf_counter() - started):.0f} MB/s per thread")
+    print()
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        tmp = Path(tmp)
+        make_small_tree(tmp / "small", args.small_files, args.small_kb * 1024)
+        run("file kecil", tmp / "small", tmp / "work-small", args.repeat)
+        shutil.rmtree(tmp / "small")
+
+        make_large_tree(tmp / "large", args.large_files, args.large_mb)
+        run("file besar", tmp / "large", tmp / "work-large", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
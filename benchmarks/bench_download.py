@@ -0,0 +1,115 @@
+"""Benchmark downloader: 1 koneksi vs beberapa segmen Range ke server lokal.
+
+Server pengganti (http.server) melayani payload acak dari memori, mendukung
+Range + If-Range (ETag), dan bisa dibatasi kecepatannya per koneksi
+(--conn-mbps) untuk meniru CDN yang membatasi tiap koneksi. --no-ranges meniru server yang
+tidak mendukung Range (downloader harus jatuh ke satu koneksi).
+
+Jalankan dari root repo:
+    python benchmarks/bench_download.py --mb 64 --conn-mbps 8
+"""
+import re
+import sys
+import time
+import hashlib
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from downloader import SegmentedDownload
+
+RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class PayloadHandler(BaseHTTPRequestHandler):
+    payload = b""
+    etag = '"0"'
+    ranges = True
+    conn_bytes_per_sec = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        total = len(self.payload)
+        start, end = 0, total - 1
+        match = RANGE_RE.match(self.headers.get("Range", "")) if self.ranges else None
+        if_range = self.headers.get("If-Range")
+        if match and (if_range is None or if_range == self.etag):
+            start = int(match.group(1))
+            end = min(int(match.group(2)), total - 1) if match.group(2) else total - 1
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{total}")
+        else:
+            self.send_response(200)
+        if self.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(end + 1 - start))
+        self.end_headers()
+        self.send_body(start, end)
+
+    def send_body(self, start, end):
+        block = 64 * 1024
+        started = time.perf_counter()
+        sent = 0
+        try:
+            for offset in range(start, end + 1, block):
+                chunk = self.payload[offset:min(offset + block, end + 1)]
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                if self.conn_bytes_per_sec:
+                    ahead = sent / self.conn_bytes_per_sec - (time.perf_counter() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def serve(payload, ranges, conn_mbps):
+    handler = type("Handler", (PayloadHandler,), {
+        "payload": payload, "ranges": ranges,
+        "etag": f'"{hashlib.sha1(payload).hexdigest()}"',
+        "conn_bytes_per_sec": int(conn_mbps * 1024 * 1024),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=64)
+    parser.add_argument("--conn-mbps", type=float, default=8, help="batas MB/s per koneksi (0 = tanpa batas)")
+    parser.add_argument("--segments", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--no-ranges", action="store_true")
+    args = parser.parse_args()
+
+    payload = bytes(range(256)) * (args.mb * 4096)
+    digest = hashlib.sha256(payload).hexdigest()
+    server = serve(payload, not args.no_ranges, args.conn_mbps)
+    url = f"http://127.0.0.1:{server.server_port}/installer.exe"
+    print(f"payload          : {args.mb} MB, range {'tidak ' if args.no_ranges else ''}didukung")
+    print(f"batas/koneksi    : {args.conn_mbps or 'tanpa batas'} MB/s")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for segments in args.segments:
+            path = Path(tmp) / f"installer-{segments}.exe"
+            download = SegmentedDownload(url, path, segments=segments, sha256=digest)
+            started = time.perf_counter()
+            download.run()
+            elapsed = time.perf_counter() - started
+            mode = "range" if download.ranged and segments > 1 else "stream"
+            print(f"segments={segments:<3} {mode:<7}: {elapsed:6.2f} s  {args.mb / elapsed:8.1f} MB/s  (sha256 ok)")
+            path.unlink()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark SearchIndex: latensi per ketikan pada katalog sintetis.
+
+Jalankan dari root repo:
+    python benchmarks/bench_search.py --games 50000
+"""
+import sys
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from search import SearchIndex
+
+# Frekuensi huruf kira-kira seperti teks Inggris
+LETTERS = "etaoinshrdlcumwfgypbvkjxqz"
+LETTER_WEIGHTS = [12.7, 9.1, 8.2, 7.5, 7.0, 6.7, 6.3, 6.1, 6.0, 4.3, 4.0, 2.8, 2.8,
+                  2.4, 2.4, 2.2, 2.0, 2.0, 1.9, 1.5, 1.0, 0.8, 0.2, 0.2, 0.1, 0.1]
+SUFFIXES = ["", "", "", " II", " III", " Remastered", " Online", " VR", " 2077", " Legends"]
+
+
+def make_word(rng, length):
+    return "".join(rng.choices(LETTERS, LETTER_WEIGHTS, k=length))
+
+
+def make_catalog(count, seed=1):
+    rng = random.Random(seed)
+    name_words = [make_word(rng, rng.randint(3, 9)).capitalize() for _ in range(8000)]
+    desc_words = [make_word(rng, rng.randint(2, 10)) for _ in range(20000)]
+    weights = [1.0 / (rank + 1) for rank in range(len(desc_words))]  # sebaran Zipf
+    games = []
+    for i in range(count):
+        name = " ".join(rng.choice(name_words) for _ in range(rng.randint(1, 3))) + rng.choice(SUFFIXES)
+        desc = " ".join(rng.choices(desc_words, weights, k=rng.randint(15, 40)))
+        games.append((i, name, desc))
+    return games
+
+
+def keystrokes(query):
+    return [query[:i] for i in range(1, len(query) + 1)]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=200, help="ukuran halaman untuk mode terbatas")
+    args = parser.parse_args()
+
+    games = make_catalog(args.games)
+    started = time.perf_counter()
+    index = SearchIndex(games)
+    build_time = time.perf_counter() - started
+
+    rng = random.Random(7)
+    queries = []
+    for _ in range(args.queries):
+        _, name, desc = rng.choice(games)
+        kind = rng.random()
+        if kind < 0.6:
+            queries.append(name.lower())                      # ketik nama game
+        elif kind < 0.8:
+            queries.append(rng.choice(desc.split()))          # kata dari deskripsi
+        else:
+            word = rng.choice(name.split()).lower()
+            i = rng.randrange(1, len(word))
+            queries.append(word[:i] + word[i + 1:])           # typo (huruf hilang)
+
+    print(f"games            : {args.games}")
+    print(f"build index      : {build_time:.2f} s")
+
+    for limit in (None, args.limit):
+        index.result_cache.clear()
+        index.prefix_cache.clear()
+        samples = []
+        results = 0
+        for query in queries:
+            for text in keystrokes(query):
+                started = time.perf_counter()
+                found = index.search(text, limit=limit)
+                samples.append((time.perf_counter() - started) * 1000)
+                results += len(found)
+
+        print()
+        print(f"[{'semua hasil' if limit is None else f'limit={limit}'}]")
+        print(f"keystrokes       : {len(samples)} ({args.queries} queries)")
+        print(f"avg results      : {results / len(samples):.0f}")
+        print(f"latency p50      : {statistics.median(samples):.3f} ms")
+        print(f"latency p95      : {percentile(samples, 95):.3f} ms")
+        print(f"latency p99      : {percentile(samples, 99):.3f} ms")
+        print(f"latency max      : {max(samples):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Benchmark startup & memori launcher untuk library sintetis besar.
+
+Untuk setiap ukuran katalog dibuat folder data sementara berisi
+data-games.json + thumbnail PNG, lalu MainWindow dijalankan di proses
+terpisah (QT_QPA_PLATFORM=offscreen, DEGAMES_DATA_DIR ke folder itu) dua
+kali: "cold" (migrasi JSON + cache thumbnail kosong) dan "warm". Yang
+diukur: waktu sampai frame pertama, sampai kartu tergambar, refresh_cards,
+latensi pencarian per ketikan, dan peak RSS. Hasilnya JSON, supaya bisa
+dibandingkan antar versi dengan --compare.
+
+Jalankan dari root repo:
+    python benchmarks/bench_startup.py --games 100 1000 10000 50000 --output hasil.json
+    python benchmarks/bench_startup.py --games 10000 --compare hasil.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_search import make_catalog, keystrokes, percentile
+
+RESULT_PREFIX = "BENCH_RESULT "
+# Metrik yang dibandingkan --compare (makin kecil makin baik)
+METRICS = ("first_frame_ms", "cards_painted_ms", "refresh_cards_ms", "search_p50_ms",
+           "search_p95_ms", "peak_rss_mb")
+
+
+# ==================== Data sintetis ====================
+def make_thumbnails(folder, count, seed=1):
+    from PyQt5.QtGui import QImage, QColor, QPainter, QLinearGradient
+
+    rng = random.Random(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        image = QImage(460, 215, QImage.Format_RGB32)
+        painter = QPainter(image)
+        gradient = QLinearGradient(0, 0, 460, 215)
+        gradient.setColorAt(0, QColor.fromHsv(rng.randrange(360), 200, 220))
+        gradient.setColorAt(1, QColor.fromHsv(rng.randrange(360), 160, 90))
+        painter.fillRect(image.rect(), gradient)
+        painter.end()
+        path = folder / f"thumb-{i}.png"
+        image.save(str(path))
+        paths.append(str(path))
+    return paths
+
+
+def make_data_dir(root, count, thumbs):
+    thumbnails = make_thumbnails(root / "thumbs", min(count, thumbs))
+    games = []
+    for i, name, description in make_catalog(count):
+        games.append({
+            "name": name,
+            "folder": str(root / "games" / f"game-{i}"),
+            "thumbnail": thumbnails[i % len(thumbnails)],
+            "description": description,
+        })
+    (root / "games").mkdir(exist_ok=True)
+    with open(root / "data-games.json", "w", encoding="utf-8") as f:
+        json.dump(games, f)
+    return [game["name"] for game in games]
+
+
+# ==================== Proses anak ====================
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 2 ** 20
+        except (ImportError, AttributeError):
+            return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: byte
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(args):
+    import main
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+
+    result = {}
+    load_library = main.MainWindow.load_library
+
+    def measure_after_load(window):
+        load_library(window)
+        QTimer.singleShot(0, lambda: measure(window))
+
+    def elapsed_ms():
+        return (time.perf_counter() - main._STARTED) * 1000
+
+    def measure(window):
+        app = QApplication.instance()
+        phases, total = {}, 0.0
+        for phase, seconds in main.startup.phases:
+            total += seconds
+            phases[phase] = round(total * 1000, 1)
+        result["phases_ms"] = phases
+        result["first_frame_ms"] = phases.get("frame pertama")
+        app.processEvents()
+        result["cards_painted_ms"] = round(elapsed_ms(), 1)
+
+        # refresh_cards dengan urutan bergantian supaya tidak dilewati (list sama)
+        games = main.catalog.games
+        samples = []
+        for i in range(args.repeat):
+            started = time.perf_counter()
+            window.home.refresh_cards(games[::-1] if i % 2 == 0 else games)
+            app.processEvents()
+            samples.append((time.perf_counter() - started) * 1000)
+        result["refresh_cards_ms"] = round(statistics.median(samples), 2)
+        window.home.refresh_cards(games)
+
+        # Pencarian: setiap ketikan langsung dijalankan (tanpa debounce) sampai hasilnya tampil
+        arrived = {}
+        window.search_worker.results.connect(lambda generation, *_: arrived.setdefault(generation, time.perf_counter()))
+
+        def search(text):
+            window.main_search.setText(text)
+            window.search_timer.stop()
+            started = time.perf_counter()
+            window.run_search()
+            generation = window.search_generation
+            while generation not in arrived:
+                app.processEvents()
+                time.sleep(0.0005)
+            return (arrived[generation] - started) * 1000
+
+        # Pencarian pertama juga membangun index
+        result["search_first_ms"] = round(search("a"), 2)
+        rng = random.Random(7)
+        latencies = []
+        for name in rng.sample(args.names, min(args.queries, len(args.names))):
+            for text in keystrokes(name.split()[0][:8].lower()):
+                latencies.append(search(text))
+        result["search_keystrokes"] = len(latencies)
+        result["search_p50_ms"] = round(percentile(latencies, 50), 2)
+        result["search_p95_ms"] = round(percentile(latencies, 95), 2)
+        result["search_max_ms"] = round(max(latencies), 2)
+        result["peak_rss_mb"] = round(peak_rss_mb() or 0, 1) or None
+        window.close()
+        app.quit()
+
+    main.MainWindow.load_library = measure_after_load
+    main.main()
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def child_process(data_dir, names_path, args):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", DEGAMES_DATA_DIR=str(data_dir))
+    command = [sys.executable, __file__, "--child", "--names", str(names_path),
+               "--queries", str(args.queries), "--repeat", str(args.repeat)]
+    output = subprocess.run(command, env=env, cwd=str(ROOT), capture_output=True, text=True)
+    for line in output.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"Benchmark gagal:\n{output.stderr[-2000:]}")
+
+
+# ==================== Laporan ====================
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(ROOT),
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(report, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    old = {(r["games"], r["run"]): r for r in baseline["results"]}
+    print(f"\nDibanding {baseline_path} ({baseline.get('revision')}):", file=sys.stderr)
+    for result in report["results"]:
+        previous = old.get((result["games"], result["run"]))
+        if previous is None:
+            continue
+        changes = []
+        for metric in METRICS:
+            if result.get(metric) and previous.get(metric):
+                changes.append(f"{metric} {100 * (result[metric] / previous[metric] - 1):+.0f}%")
+        print(f"  {result['games']:>6} game {result['run']:<5}: " + ", ".join(changes), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--thumbs", type=int, default=500, help="jumlah thumbnail berbeda (dipakai bergiliran)")
+    parser.add_argument("--queries", type=int, default=30, help="jumlah kata yang diketik per run")
+    parser.add_argument("--repeat", type=int, default=5, help="ulangan refresh_cards (diambil median)")
+    parser.add_argument("--output", help="tulis JSON ke file ini (default: stdout)")
+    parser.add_argument("--compare", help="JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--names", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with open(args.names, "r", encoding="utf-8") as f:
+            args.names = json.load(f)
+        run_child(args)
+        return
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    report = {
+        "revision": git_revision(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [],
+    }
+    for count in args.games:
+        with tempfile.TemporaryDirectory(prefix="degames-bench-") as tmp:
+            root = Path(tmp)
+            started = time.perf_counter()
+            names = make_data_dir(root / "data", count, args.thumbs)
+            names_path = root / "names.json"
+            with open(names_path, "w", encoding="utf-8") as f:
+                json.dump(names, f)
+            print(f"{count} game: data dibuat dalam {time.perf_counter() - started:.1f} s", file=sys.stderr)
+            for run in ("cold", "warm"):
+                result = {"games": count, "run": run}
+                result.update(child_process(root / "data", names_path, args))
+                report["results"].append(result)
+                print(f"  {run:<5} frame pertama {result['first_frame_ms']} ms, kartu {result['cards_painted_ms']} ms, "
+                      f"refresh {result['refresh_cards_ms']} ms, cari p95 {result['search_p95_ms']} ms, "
+                      f"RSS {result['peak_rss_mb']} MB", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
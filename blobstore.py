@@ -0,0 +1,159 @@
+import os
+import shutil
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from copier import BUFFER_SIZE, CopyCancelled, copy_file
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+"""
+
+
+# ==================== Blob Store ====================
+class BlobStore:
+    """Penyimpanan file game berdasarkan isi (content-addressed).
+
+    Setiap isi file disimpan sekali di blobs/<2 huruf>/<sha256>, folder game
+    hanya berisi hardlink ke blob. Jumlah referensi = st_nlink blob - 1,
+    jadi setelah folder game dihapus cukup buang blob yang st_nlink-nya 1.
+
+    Hash file sumber di-cache per (path, ukuran, mtime), sehingga impor ulang
+    dari folder yang sama hanya perlu stat + link. Jika hardlink tidak
+    didukung (misal beda drive / FAT32), file disalin biasa.
+
+    File hasil link berbagi isi dengan game lain: jangan ditulis di tempat,
+    ganti dengan file baru (copier.copy_file selalu membuat file baru).
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.tmp_dir = self.root / "tmp"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(exist_ok=True)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self.clean_tmp()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def blob_path(self, digest):
+        return self.blobs_dir / digest[:2] / digest
+
+    def clean_tmp(self):
+        # Sisa ingest yang terputus (crash saat impor)
+        for entry in os.scandir(self.tmp_dir):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    # ---------- Hash cache ----------
+    def cached_hash(self, path, st):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT sha256 FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (str(path), st.st_size, st.st_mtime_ns)
+            ).fetchone()
+        return row[0] if row else None
+
+    def remember_hash(self, path, st, digest):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                (str(path), st.st_size, st.st_mtime_ns, digest)
+            )
+
+    # ---------- Impor ----------
+    def materialize(self, src, dst, on_bytes=None, should_cancel=None):
+        """Taruh isi src di dst sebagai hardlink ke blob, kembalikan SHA-256-nya"""
+        st = os.stat(src)
+        digest = self.cached_hash(src, st)
+        if digest is not None:
+            blob = self.blob_path(digest)
+            # Cek & link di dalam lock supaya blob tidak ikut di-collect di antaranya
+            with self.lock:
+                if blob.exists():
+                    self.link(blob, dst)
+                    if on_bytes is not None:
+                        on_bytes(st.st_size)
+                    return digest
+        digest = self.ingest(src, dst, on_bytes, should_cancel)
+        self.remember_hash(src, st, digest)
+        return digest
+
+    def ingest(self, src, dst, on_bytes=None, should_cancel=None):
+        """Salin src ke blob sambil di-hash dalam satu kali baca, lalu link ke dst"""
+        hasher = hashlib.sha256()
+        tmp_path = self.tmp_dir / f"{threading.get_ident()}.tmp"
+        try:
+            buf = bytearray(BUFFER_SIZE)
+            view = memoryview(buf)
+            with open(src, "rb") as fsrc, open(tmp_path, "wb") as fdst:
+                while True:
+                    if should_cancel is not None and should_cancel():
+                        raise CopyCancelled()
+                    n = fsrc.readinto(buf)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+                    fdst.write(view[:n])
+                    if on_bytes is not None:
+                        on_bytes(n)
+            shutil.copystat(src, tmp_path)
+            digest = hasher.hexdigest()
+            blob = self.blob_path(digest)
+            with self.lock:
+                if blob.exists():
+                    # Isi yang sama sudah ada → salinan ini tidak diperlukan
+                    tmp_path.unlink()
+                else:
+                    blob.parent.mkdir(exist_ok=True)
+                    os.replace(tmp_path, blob)
+                self.link(blob, dst)
+            return digest
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def link(self, blob, dst):
+        if os.path.lexists(dst):
+            os.remove(dst)
+        try:
+            os.link(blob, dst)
+        except OSError:
+            copy_file(blob, dst)
+
+    # ---------- Referensi ----------
+    def collect(self, should_cancel=None):
+        """Hapus blob yang tidak dipakai game mana pun, kembalikan (jumlah, byte)"""
+        removed, freed = 0, 0
+        with self.lock:
+            for shard in os.scandir(self.blobs_dir):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if should_cancel is not None and should_cancel():
+                        return removed, freed
+                    try:
+                        # os.stat, bukan entry.stat(): di Windows st_nlink DirEntry selalu 0
+                        st = os.stat(entry.path)
+                        if st.st_nlink <= 1:
+                            os.remove(entry.path)
+                            removed += 1
+                            freed += st.st_size
+                    except OSError:
+                        pass
+        return removed, freed
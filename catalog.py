@@ -0,0 +1,414 @@
+import os
+import json
+import time
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from PyQt5.QtCore import QObject, pyqtSignal
+from utils import replace_atomic
+
+# Kolom tetap; field lain dari dict game disimpan di kolom "extra" (JSON)
+COLUMNS = ("name", "folder", "thumbnail", "description")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    folder TEXT NOT NULL DEFAULT '',
+    thumbnail TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    extra TEXT NOT NULL DEFAULT '{}',
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_name ON games (name COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS game_files (
+    game_id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    extra TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (game_id, path)
+);
+CREATE TABLE IF NOT EXISTS scan_dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class CatalogError(Exception):
+    pass
+
+
+# ==================== Catalog Store ====================
+class CatalogStore:
+    """Katalog game di SQLite: setiap perubahan hanya menulis satu baris.
+
+    Game dikembalikan sebagai dict biasa ({"id", "name", "folder",
+    "thumbnail", "description", ...}) supaya kode UI tetap sama. Checksum
+    file tiap game (hasil impor) ada di tabel game_files, terpisah supaya
+    tidak ikut dimuat bersama daftar game. mtime folder game dari scan
+    library terakhir ada di tabel scan_dirs (lihat scanner.py).
+
+    Mode WAL + synchronous=FULL: setiap commit cukup satu append + fsync ke
+    file -wal, dan transaksi yang belum selesai saat crash otomatis
+    di-rollback waktu dibuka lagi. Jika file ternyata rusak, file itu
+    disisihkan dan katalog dipulihkan dari backup terakhir (catalog.db.bak).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.backup_path = self.path.with_name(self.path.name + ".bak")
+        self.lock = threading.RLock()
+        self.recovered = False
+        self.conn = self._open()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = FULL")
+        with conn:
+            conn.executescript(SCHEMA)
+        return conn
+
+    def _open(self):
+        # Sisa backup yang terputus di tengah jalan tidak pernah dipakai
+        tmp_backup = self.backup_path.with_name(self.backup_path.name + ".tmp")
+        if tmp_backup.exists():
+            tmp_backup.unlink()
+
+        conn = None
+        try:
+            conn = self._connect()
+            if conn.execute("PRAGMA quick_check").fetchone()[0] == "ok":
+                return conn
+        except sqlite3.DatabaseError:
+            pass
+        if conn is not None:
+            conn.close()
+
+        self._recover()
+        return self._connect()
+
+    def _recover(self):
+        # File rusak disimpan (bukan dihapus) supaya masih bisa diperiksa
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        for suffix in ("", "-wal", "-shm"):
+            damaged = Path(str(self.path) + suffix)
+            if damaged.exists():
+                os.replace(damaged, damaged.with_name(f"{damaged.name}.corrupt-{stamp}"))
+        if self.backup_path.exists():
+            shutil.copy2(self.backup_path, self.path)
+        self.recovered = True
+
+    def backup(self):
+        """Salin katalog ke catalog.db.bak (atomik, dipakai saat pemulihan)"""
+        tmp_backup = self.backup_path.with_name(self.backup_path.name + ".tmp")
+        with self.lock:
+            target = sqlite3.connect(str(tmp_backup))
+            try:
+                self.conn.backup(target)
+            finally:
+                target.close()
+        replace_atomic(tmp_backup, self.backup_path)
+
+    # ---------- Baca ----------
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def all(self):
+        with self.lock:
+            rows = self.conn.execute("SELECT * FROM games ORDER BY id").fetchall()
+        return [self._to_game(row) for row in rows]
+
+    def get(self, game_id):
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM games WHERE id = ?", (game_id,)).fetchone()
+        return self._to_game(row) if row else None
+
+    def stamps(self):
+        """{id: updated_at} semua game, untuk mendeteksi perubahan dari proses lain"""
+        with self.lock:
+            rows = self.conn.execute("SELECT id, updated_at FROM games").fetchall()
+        return {row["id"]: row["updated_at"] for row in rows}
+
+    def stamp(self, game_id):
+        with self.lock:
+            row = self.conn.execute("SELECT updated_at FROM games WHERE id = ?", (game_id,)).fetchone()
+        return row["updated_at"] if row else None
+
+    def files(self, game_id):
+        """{path relatif: {"size", "sha256", ...}} yang dicatat saat impor"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT path, size, sha256, extra FROM game_files WHERE game_id = ?", (game_id,)
+            ).fetchall()
+        files = {}
+        for row in rows:
+            record = {"size": row["size"], "sha256": row["sha256"]}
+            record.update(json.loads(row["extra"]))
+            files[row["path"]] = record
+        return files
+
+    def find_by_name(self, name):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT * FROM games WHERE name = ? COLLATE NOCASE ORDER BY id LIMIT 1", (name,)
+            ).fetchone()
+        return self._to_game(row) if row else None
+
+    # ---------- Tulis ----------
+    def add(self, game, files=None):
+        """Simpan game baru (+ checksum file-nya), kembalikan dict game lengkap dengan "id" """
+        values, extra = self._split(game)
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO games (name, folder, thumbnail, description, extra, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (*(values.get(c, "") for c in COLUMNS), json.dumps(extra), time.time())
+            )
+            game_id = cursor.lastrowid
+            if files:
+                self._insert_files(game_id, files)
+        return self.get(game_id)
+
+    def add_many(self, games):
+        """Simpan banyak game baru dalam satu transaksi (hasil scan library)"""
+        now = time.time()
+        ids = []
+        with self.lock, self.conn:
+            for game in games:
+                values, extra = self._split(game)
+                cursor = self.conn.execute(
+                    "INSERT INTO games (name, folder, thumbnail, description, extra, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (*(values.get(c, "") for c in COLUMNS), json.dumps(extra), now)
+                )
+                ids.append(cursor.lastrowid)
+        return [self.get(game_id) for game_id in ids]
+
+    def set_files(self, game_id, files):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM game_files WHERE game_id = ?", (game_id,))
+            self._insert_files(game_id, files)
+
+    def _insert_files(self, game_id, files):
+        rows = []
+        for path, record in files.items():
+            extra = {k: v for k, v in record.items() if k not in ("size", "sha256")}
+            rows.append((game_id, path, record["size"], record["sha256"], json.dumps(extra)))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO game_files (game_id, path, size, sha256, extra) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def update(self, game_id, changes):
+        """Ubah sebagian field game, kembalikan dict game terbaru"""
+        values, extra = self._split(changes)
+        with self.lock, self.conn:
+            if extra:
+                row = self.conn.execute("SELECT extra FROM games WHERE id = ?", (game_id,)).fetchone()
+                if row is None:
+                    raise CatalogError(f"Game id {game_id} tidak ditemukan")
+                merged = json.loads(row["extra"])
+                merged.update(extra)
+                values["extra"] = json.dumps(merged)
+            values["updated_at"] = time.time()
+            assignments = ", ".join(f"{column} = ?" for column in values)
+            cursor = self.conn.execute(
+                f"UPDATE games SET {assignments} WHERE id = ?", (*values.values(), game_id)
+            )
+            if cursor.rowcount == 0:
+                raise CatalogError(f"Game id {game_id} tidak ditemukan")
+        return self.get(game_id)
+
+    def delete(self, game_id):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM games WHERE id = ?", (game_id,))
+            self.conn.execute("DELETE FROM game_files WHERE game_id = ?", (game_id,))
+
+    # ---------- State scan library ----------
+    def scan_state(self):
+        """{path folder game: mtime_ns} dari scan terakhir"""
+        with self.lock:
+            rows = self.conn.execute("SELECT path, mtime_ns FROM scan_dirs").fetchall()
+        return {row["path"]: row["mtime_ns"] for row in rows}
+
+    def save_scan_state(self, mtimes, removed=()):
+        """Tulis hanya folder yang berubah / hilang sejak scan sebelumnya"""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO scan_dirs (path, mtime_ns) VALUES (?, ?)", mtimes.items()
+            )
+            self.conn.executemany("DELETE FROM scan_dirs WHERE path = ?", ((path,) for path in removed))
+
+    # ---------- Migrasi ----------
+    def migrate_from_json(self, json_path):
+        """Impor data-games.json lama satu kali (ditandai di tabel meta)"""
+        json_path = Path(json_path)
+        with self.lock:
+            done = self.conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone()
+            if done or not json_path.exists():
+                return 0
+
+            with open(json_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if not isinstance(raw, list):
+                raise CatalogError(f"Format {json_path.name} tidak dikenal")
+
+            games = [game for game in raw if isinstance(game, dict) and game.get("name")]
+            now = time.time()
+            with self.conn:
+                for game in games:
+                    values, extra = self._split(game)
+                    self.conn.execute(
+                        "INSERT INTO games (name, folder, thumbnail, description, extra, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (*(values.get(c, "") for c in COLUMNS), json.dumps(extra), now)
+                    )
+                self.conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('migrated_json', ?)", (str(json_path),)
+                )
+            return len(games)
+
+    # ---------- Helper ----------
+    @staticmethod
+    def _split(game):
+        values = {c: game[c] for c in COLUMNS if c in game}
+        extra = {k: v for k, v in game.items() if k not in COLUMNS and k != "id"}
+        return values, extra
+
+    @staticmethod
+    def _to_game(row):
+        game = {"id": row["id"]}
+        game.update({c: row[c] for c in COLUMNS})
+        game.update(json.loads(row["extra"]))
+        return game
+
+
+# ==================== Game Catalog ====================
+class GameCatalog(QObject):
+    """Katalog di memori + CatalogStore, mengirim sinyal untuk setiap perubahan.
+
+    Dict game yang sama dipakai terus (update mengubah dict di tempat), jadi
+    UI cukup menerapkan delta tanpa membaca ulang dari disk. updated_at
+    setiap game yang ada di memori dicatat di self.stamps, sehingga sync()
+    bisa menerapkan perubahan catalog.db dari luar (proses lain) per game.
+    """
+    game_added = pyqtSignal(object)    # dict game
+    game_updated = pyqtSignal(object)  # dict game (objek yang sama, sudah diubah)
+    game_removed = pyqtSignal(object)  # dict game yang dihapus
+
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        self.store = None
+        self.games = []
+        self.by_id = {}
+        self.stamps = {}  # id -> updated_at versi di memori
+        if store is not None:
+            self.load(store)
+
+    @property
+    def loaded(self):
+        return self.store is not None
+
+    def load(self, store):
+        """Muat semua game dari store (boleh ditunda sampai jendela tampil)"""
+        self.store = store
+        self.games = store.all()
+        self.by_id = {game["id"]: game for game in self.games}
+        self.stamps = store.stamps()
+
+    def __len__(self):
+        return len(self.games)
+
+    def __iter__(self):
+        return iter(self.games)
+
+    def get(self, game_id):
+        return self.by_id.get(game_id)
+
+    def add(self, game, files=None):
+        game = self.store.add(game, files)
+        self.games.append(game)
+        self.by_id[game["id"]] = game
+        self.stamps[game["id"]] = self.store.stamp(game["id"])
+        self.game_added.emit(game)
+        return game
+
+    def add_many(self, games):
+        """Seperti add untuk banyak game sekaligus (satu transaksi), sinyal tetap per game"""
+        added = self.store.add_many(games)
+        for game in added:
+            self.games.append(game)
+            self.by_id[game["id"]] = game
+            self.stamps[game["id"]] = self.store.stamp(game["id"])
+            self.game_added.emit(game)
+        return added
+
+    def update(self, game_id, changes):
+        game = self.by_id[game_id]
+        if changes:
+            game.update(self.store.update(game_id, changes))
+            self.stamps[game_id] = self.store.stamp(game_id)
+            self.game_updated.emit(game)
+        return game
+
+    def remove(self, game_id):
+        game = self.by_id.pop(game_id, None)
+        if game is None:
+            return
+        self.store.delete(game_id)
+        self.games.remove(game)
+        self.stamps.pop(game_id, None)
+        self.game_removed.emit(game)
+
+    def sync(self):
+        """Samakan memori dengan catalog.db yang diubah dari luar.
+
+        Hanya game yang id / updated_at-nya berbeda yang dibaca ulang, dan
+        setiap perubahan dikirim lewat sinyal biasa (tanpa muat ulang semua).
+        Mengembalikan jumlah game yang berubah.
+        """
+        stamps = self.store.stamps()
+        removed = [game_id for game_id in self.by_id if game_id not in stamps]
+        for game_id in removed:
+            game = self.by_id.pop(game_id)
+            self.games.remove(game)
+            self.stamps.pop(game_id, None)
+            self.game_removed.emit(game)
+
+        changed = 0
+        for game_id, stamp in stamps.items():
+            if self.stamps.get(game_id) == stamp:
+                continue
+            fresh = self.store.get(game_id)
+            if fresh is None:
+                continue
+            self.stamps[game_id] = stamp
+            changed += 1
+            game = self.by_id.get(game_id)
+            if game is None:
+                self.games.append(fresh)
+                self.by_id[game_id] = fresh
+                self.game_added.emit(fresh)
+            else:
+                # Dict yang sama tetap dipakai (UI memegang referensinya)
+                game.clear()
+                game.update(fresh)
+                self.game_updated.emit(game)
+        return len(removed) + changed
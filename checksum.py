@@ -0,0 +1,90 @@
+import os
+import hashlib
+from pathlib import Path
+
+try:
+    import xxhash  # opsional, jauh lebih cepat dari SHA-256
+except ImportError:
+    xxhash = None
+
+# SHA-256 selalu dihitung; "blake2b" atau "xxh3_128" (jika xxhash terpasang) bisa ditambahkan
+DEFAULT_ALGORITHMS = ("sha256",)
+# Nama file manifest (format sha256sum: "<hex>  <path>") yang dicek saat impor
+MANIFEST_NAMES = ("SHA256SUMS", "SHA256SUMS.txt", "sha256sums.txt", "checksums.sha256")
+READ_SIZE = 4 * 1024 * 1024
+
+
+class ChecksumError(Exception):
+    pass
+
+
+def available_algorithms():
+    names = ["sha256", "blake2b"]
+    if xxhash is not None:
+        names.append("xxh3_128")
+    return names
+
+
+def new_hash(name):
+    if name.startswith("xxh"):
+        if xxhash is None:
+            raise ChecksumError(f"{name} butuh paket xxhash")
+        return getattr(xxhash, name)()
+    return hashlib.new(name)
+
+
+class MultiHash:
+    """Beberapa hash sekaligus dari satu aliran data (dibaca sekali)"""
+
+    def __init__(self, algorithms=DEFAULT_ALGORITHMS):
+        self.hashes = {name: new_hash(name) for name in algorithms}
+
+    def update(self, data):
+        for h in self.hashes.values():
+            h.update(data)
+
+    def hexdigests(self):
+        return {name: h.hexdigest() for name, h in self.hashes.items()}
+
+
+def file_digests(path, algorithms=DEFAULT_ALGORITHMS, should_cancel=None):
+    """Hash isi file (dipakai hanya jika belum di-hash saat disalin/diunduh)"""
+    hasher = MultiHash(algorithms)
+    buf = bytearray(READ_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb") as f:
+        while True:
+            if should_cancel is not None and should_cancel():
+                return None
+            n = f.readinto(buf)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return hasher.hexdigests()
+
+
+# ==================== Manifest ====================
+def find_manifest(folder):
+    for name in MANIFEST_NAMES:
+        path = Path(folder) / name
+        if path.is_file():
+            return path
+    return None
+
+
+def parse_manifest(path):
+    """{path relatif (pakai /): sha256} dari file format sha256sum"""
+    expected = {}
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split(None, 1)
+            if len(parts) != 2 or len(parts[0]) != 64:
+                continue
+            digest, name = parts
+            # "*" di depan nama = mode biner sha256sum
+            name = name.lstrip("*").replace("\\", "/")
+            expected[os.path.normpath(name).replace(os.sep, "/")] = digest.lower()
+    return expected
@@ -0,0 +1,19 @@
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.resolve()
+# DEGAMES_DATA_DIR memindahkan semua data (katalog, games, cache), misal untuk benchmark
+DATA_DIR = Path(os.environ.get("DEGAMES_DATA_DIR") or BASE_DIR / "data").resolve()
+GAMES_DIR = DATA_DIR / "games"
+JSON_PATH = DATA_DIR / "data-games.json"
+CATALOG_PATH = DATA_DIR / "catalog.db"
+ASSETS_DIR = BASE_DIR / "assets"
+THUMB_CACHE_DIR = DATA_DIR / "cache" / "thumbnails"
+STORE_DIR = GAMES_DIR / ".store"
+TRASH_DIR = GAMES_DIR / ".trash"
+STYLESHEET_PATH = BASE_DIR / "styles.qss"
+
+
+def ensure_dirs():
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    GAMES_DIR.mkdir(exist_ok=True)
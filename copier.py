@@ -0,0 +1,276 @@
+import os
+import errno
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+# File sebesar ini atau lebih disalin lewat kernel (copy_file_range/sendfile)
+LARGE_FILE = 8 * 1024 * 1024
+# Buffer untuk salinan biasa (Windows, atau jika salinan kernel tidak didukung)
+BUFFER_SIZE = 4 * 1024 * 1024
+# Potongan per panggilan salinan kernel, supaya pembatalan tetap cepat
+KERNEL_CHUNK = 64 * 1024 * 1024
+# Banyak file kecil terikat latensi per file, bukan bandwidth disk
+WORKERS = min(16, (os.cpu_count() or 2) * 2)
+# File kecil dikelompokkan per tugas supaya overhead antrean tidak dominan
+BATCH_FILES = 64
+BATCH_BYTES = 16 * 1024 * 1024
+# Interval callback progress dari thread pemanggil (detik)
+REPORT_INTERVAL = 0.1
+
+# errno yang berarti "salinan kernel tidak bisa dipakai di sini", bukan I/O error
+_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+
+
+class CopyCancelled(Exception):
+    pass
+
+
+def _copy_kernel(fsrc, fdst, on_bytes, should_cancel):
+    """Salin lewat kernel tanpa lewat memori Python.
+
+    Mengembalikan False jika tidak didukung sebelum ada byte yang tersalin,
+    supaya pemanggil bisa jatuh ke salinan buffer.
+    """
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    for name in ("copy_file_range", "sendfile"):
+        copy = getattr(os, name, None)
+        if copy is None:
+            continue
+        offset = 0
+        while True:
+            if should_cancel is not None and should_cancel():
+                raise CopyCancelled()
+            try:
+                if name == "copy_file_range":
+                    sent = copy(infd, outfd, KERNEL_CHUNK, offset, offset)
+                else:
+                    sent = copy(outfd, infd, offset, KERNEL_CHUNK)
+            except OSError as e:
+                if offset == 0 and e.errno in _UNSUPPORTED:
+                    break
+                raise
+            if sent == 0:
+                return True
+            offset += sent
+            if on_bytes is not None:
+                on_bytes(sent)
+    return False
+
+
+class _SourceHasher:
+    """Hash file sumber dari byte 0 di thread sendiri, tepat di belakang salinan kernel.
+
+    Salinan kernel tidak lewat memori Python, jadi hasher tidak bisa diberi
+    data yang sama. Thread ini membaca ulang sumber sampai posisi yang sudah
+    disalin (lihat advance()), selagi datanya masih di page cache, seperti
+    downloader.PrefixHasher untuk file .part.
+    """
+
+    def __init__(self, path, hasher, should_cancel=None):
+        self.path = path
+        self.hasher = hasher
+        self.should_cancel = should_cancel
+        self.pos = 0
+        self.frontier = 0
+        self.closed = False
+        self.error = None
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="copier-hash", daemon=True)
+        self.thread.start()
+
+    def advance(self, n):
+        with self.cond:
+            self.frontier += n
+            self.cond.notify()
+
+    def stop(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.thread.join()
+
+    def finish(self):
+        """Tunggu sampai semua byte yang sudah disalin ter-hash"""
+        self.stop()
+        if self.error is not None:
+            raise self.error
+        if self.pos != self.frontier:
+            if self.should_cancel is not None and self.should_cancel():
+                raise CopyCancelled()
+            raise OSError(f"Checksum hanya mencakup {self.pos} dari {self.frontier} byte: {self.path}")
+
+    def run(self):
+        buf = bytearray(BUFFER_SIZE)
+        view = memoryview(buf)
+        try:
+            with open(self.path, "rb", buffering=0) as f:
+                while True:
+                    with self.cond:
+                        while self.pos >= self.frontier and not self.closed:
+                            self.cond.wait()
+                        frontier = self.frontier
+                    if self.pos >= frontier:
+                        return  # closed & semua byte yang disalin sudah di-hash
+                    if self.should_cancel is not None and self.should_cancel():
+                        return
+                    n = f.readinto(view[:min(BUFFER_SIZE, frontier - self.pos)])
+                    if not n:
+                        return
+                    self.hasher.update(view[:n])
+                    self.pos += n
+        except OSError as e:
+            self.error = e
+
+
+def _copy_kernel_hashed(src, fsrc, fdst, on_bytes, should_cancel, hasher):
+    """_copy_kernel, dengan hasher (jika ada) diisi oleh _SourceHasher"""
+    if hasher is None:
+        return _copy_kernel(fsrc, fdst, on_bytes, should_cancel)
+    follower = _SourceHasher(src, hasher, should_cancel)
+
+    def copied(n):
+        follower.advance(n)
+        if on_bytes is not None:
+            on_bytes(n)
+
+    try:
+        if not _copy_kernel(fsrc, fdst, copied, should_cancel):
+            # Belum ada byte tersalin → belum ada yang di-hash; salinan buffer meng-hash sendiri
+            follower.stop()
+            return False
+    except BaseException:
+        follower.stop()
+        raise
+    follower.finish()
+    return True
+
+
+def _copy_buffered(fsrc, fdst, on_bytes, should_cancel, hasher=None):
+    buf = bytearray(BUFFER_SIZE)
+    view = memoryview(buf)
+    while True:
+        if should_cancel is not None and should_cancel():
+            raise CopyCancelled()
+        n = fsrc.readinto(buf)
+        if not n:
+            break
+        if hasher is not None:
+            hasher.update(view[:n])
+        fdst.write(view[:n])
+        if on_bytes is not None:
+            on_bytes(n)
+
+
+def copy_file(src, dst, on_bytes=None, should_cancel=None, hasher=None):
+    """Salin isi + metadata (seperti shutil.copy2), mtime diset paling akhir.
+
+    dst lama dihapus dulu: bisa jadi hardlink ke blob (lihat blobstore) yang
+    isinya tidak boleh ditimpa. Jika hasher (misal checksum.MultiHash)
+    diberikan, isi di-hash sambil disalin; untuk file besar salinan kernel
+    tetap dipakai dan sumbernya di-hash paralel oleh _SourceHasher.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if size <= BUFFER_SIZE:
+            # File kecil: satu read + satu write
+            data = fsrc.read()
+            if hasher is not None:
+                hasher.update(data)
+            fdst.write(data)
+            if on_bytes is not None:
+                on_bytes(len(data))
+        elif size < LARGE_FILE or not _copy_kernel_hashed(src, fsrc, fdst, on_bytes, should_cancel, hasher):
+            _copy_buffered(fsrc, fdst, on_bytes, should_cancel, hasher)
+    shutil.copystat(src, dst)
+
+
+# ==================== Parallel Copier ====================
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Thread pool bersama, dipakai ulang oleh semua impor"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(WORKERS, thread_name_prefix="copier")
+        return _pool
+
+
+def _batches(files):
+    """Kelompokkan file: file besar sendiri-sendiri, file kecil per batch"""
+    batch, batch_bytes = [], 0
+    for src, dst, size in sorted(files, key=lambda f: f[2], reverse=True):
+        if size >= LARGE_FILE:
+            yield [(src, dst)]
+            continue
+        batch.append((src, dst))
+        batch_bytes += size
+        if len(batch) >= BATCH_FILES or batch_bytes >= BATCH_BYTES:
+            yield batch
+            batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+def copy_files(files, report=None, should_cancel=None, copy=copy_file):
+    """Salin banyak file (src, dst, size) secara paralel.
+
+    File besar dijadwalkan lebih dulu supaya berjalan bersamaan dengan
+    aliran file kecil (yang dikirim ke pool per batch). report(byte, file) dipanggil dari thread pemanggil
+    kira-kira setiap REPORT_INTERVAL dengan total yang sudah selesai.
+    Melempar CopyCancelled jika should_cancel() menjadi True.
+
+    copy(src, dst, on_bytes, should_cancel) bisa diganti, misal dengan
+    BlobStore.materialize.
+    """
+    lock = threading.Lock()
+    done = {"bytes": 0, "files": 0}
+    cancelled = threading.Event()
+
+    def check_cancel():
+        if not cancelled.is_set() and should_cancel is not None and should_cancel():
+            cancelled.set()
+        return cancelled.is_set()
+
+    def on_bytes(n):
+        with lock:
+            done["bytes"] += n
+
+    def copy_batch(batch):
+        for src, dst in batch:
+            if check_cancel():
+                raise CopyCancelled()
+            copy(src, dst, on_bytes, check_cancel)
+            with lock:
+                done["files"] += 1
+
+    for parent in {os.path.dirname(dst) for _, dst, _ in files}:
+        os.makedirs(parent, exist_ok=True)
+
+    pool = get_pool()
+    futures = {pool.submit(copy_batch, batch) for batch in _batches(files)}
+    try:
+        pending = futures
+        while pending:
+            finished, pending = wait(pending, timeout=REPORT_INTERVAL, return_when=FIRST_EXCEPTION)
+            for future in finished:
+                future.result()  # lempar error pertama
+            if report is not None:
+                with lock:
+                    progress = done["bytes"], done["files"]
+                report(*progress)
+            check_cancel()
+    except BaseException:
+        # Hentikan sisa pekerjaan & tunggu yang sedang berjalan selesai
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        raise
+    if report is not None:
+        report(done["bytes"], done["files"])
@@ -0,0 +1,578 @@
+import os
+import re
+import json
+import math
+import time
+import socket
+import threading
+import http.client
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from utils import replace_atomic
+from checksum import DEFAULT_ALGORITHMS, MultiHash
+
+CHUNK_SIZE = 256 * 1024
+# Jumlah koneksi paralel per download
+SEGMENTS = 4
+# File lebih kecil dari 2x ini diunduh dengan satu koneksi saja
+MIN_SEGMENT = 4 * 1024 * 1024
+TIMEOUT = 30
+USER_AGENT = "DEGamesLauncher"
+# Percobaan ulang otomatis per request: jeda 1, 2, 4, 8, 16 detik
+RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+# Seberapa sering state .part disimpan ke disk (detik)
+STATE_INTERVAL = 1.0
+# Konstanta waktu rata-rata kecepatan (detik): makin besar makin halus
+SPEED_TAU = 2.0
+
+CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+# Jawaban 416 untuk file kosong: Range 0-0 tidak bisa dipenuhi
+EMPTY_RANGE_RE = re.compile(r"bytes\s+\*/0$")
+
+
+class DownloadError(Exception):
+    pass
+
+
+class DownloadCancelled(DownloadError):
+    pass
+
+
+class _Interrupted(Exception):
+    """Koneksi putus di tengah segmen (dicoba ulang dari posisi terakhir)"""
+
+
+class _RemoteChanged(Exception):
+    """File di server berubah sejak .part dibuat (If-Range tidak cocok)"""
+
+
+def is_transient(error):
+    """True untuk error jaringan sementara yang layak dicoba ulang"""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in (408, 429) or error.code >= 500
+    return isinstance(error, (_Interrupted, urllib.error.URLError, http.client.HTTPException,
+                              ConnectionError, TimeoutError, socket.timeout))
+
+
+def open_url(url, start=None, end=None, validator=None):
+    headers = {"User-Agent": USER_AGENT}
+    if start is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+        if validator:
+            headers["If-Range"] = validator
+    return urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=TIMEOUT)
+
+
+def probe(url, validator=None):
+    """Cek URL dengan Range 0-0.
+
+    Kembalikan dict: url (setelah redirect), total (None jika tidak
+    diketahui), ranged, etag, last_modified. Dengan validator (If-Range),
+    ranged False berarti file di server sudah berubah. File kosong
+    (416 dengan Content-Range bytes */0) menghasilkan total 0.
+    """
+    try:
+        resp = open_url(url, 0, 0, validator)
+    except urllib.error.HTTPError as e:
+        with e:
+            if e.code != 416 or not EMPTY_RANGE_RE.match(e.headers.get("Content-Range", "")):
+                raise
+            return {
+                "url": e.geturl(),
+                "total": 0,
+                "ranged": False,
+                "etag": e.headers.get("ETag"),
+                "last_modified": e.headers.get("Last-Modified"),
+            }
+    with resp:
+        info = {
+            "url": resp.geturl(),
+            "total": None,
+            "ranged": False,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        if resp.status == 206:
+            match = CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+            if match and match.group(3) != "*":
+                info["total"] = int(match.group(3))
+                info["ranged"] = True
+                return info
+        length = resp.headers.get("Content-Length")
+        info["total"] = int(length) if length else None
+        return info
+
+
+def validator_of(info):
+    # If-Range hanya boleh memakai ETag kuat; selain itu pakai Last-Modified
+    etag = info.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return info.get("last_modified")
+
+
+def split_ranges(total, segments):
+    """Bagi [0, total) jadi maksimal `segments` range inklusif (start, end)"""
+    segments = max(1, min(segments, total // MIN_SEGMENT))
+    size = -(-total // segments)
+    return [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+
+
+# ==================== Token Bucket ====================
+class TokenBucket:
+    """Batas bandwidth global (byte/detik) yang dipakai bersama semua download.
+
+    Token boleh minus (utang): setiap pemakai langsung mengurangi token lalu
+    tidur sebanding utangnya, jadi total kecepatan semua koneksi tetap di
+    sekitar rate walau chunk-nya besar. rate 0 = tanpa batas.
+    """
+
+    def __init__(self, rate=0):
+        self.rate = rate
+        self.tokens = 0.0
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def set_rate(self, rate):
+        with self.lock:
+            self.rate = rate
+            self.tokens = 0.0
+            self.stamp = time.monotonic()
+
+    def consume(self, n, should_cancel=None):
+        with self.lock:
+            if self.rate <= 0:
+                return
+            now = time.monotonic()
+            burst = max(self.rate / 2, CHUNK_SIZE)
+            self.tokens = min(burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= n
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        deadline = time.monotonic() + delay
+        while True:
+            if should_cancel is not None and should_cancel():
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(0.1, remaining))
+
+
+# ==================== Speed Meter ====================
+class SpeedMeter:
+    """Kecepatan saat ini (rata-rata bergerak eksponensial) + ETA.
+
+    update() boleh dipanggil dengan interval tidak teratur; bobot sampel
+    baru mengikuti lamanya interval, dan jika tidak ada data masuk
+    kecepatannya turun perlahan ke 0.
+    """
+
+    def __init__(self, tau=SPEED_TAU):
+        self.tau = tau
+        self.speed = 0.0  # byte/detik
+        self.last_bytes = None
+        self.last_time = None
+
+    def reset(self, done=None):
+        self.speed = 0.0
+        self.last_bytes = done
+        self.last_time = time.monotonic() if done is not None else None
+
+    def update(self, done, now=None):
+        now = time.monotonic() if now is None else now
+        if self.last_bytes is None:
+            # Sampel pertama hanya jadi titik awal (misal byte hasil resume)
+            self.last_bytes, self.last_time = done, now
+            return self.speed
+        elapsed = now - self.last_time
+        if elapsed <= 0:
+            return self.speed
+        current = max(0.0, (done - self.last_bytes) / elapsed)
+        if self.speed == 0.0 and done > self.last_bytes:
+            self.speed = current
+        else:
+            self.speed += (1 - math.exp(-elapsed / self.tau)) * (current - self.speed)
+        self.last_bytes, self.last_time = done, now
+        return self.speed
+
+    def eta(self, done, total):
+        """Sisa waktu (detik) atau None jika belum bisa diperkirakan"""
+        if not total or self.speed <= 1:
+            return None
+        return max(0.0, (total - done) / self.speed)
+
+
+# ==================== Prefix Hasher ====================
+class PrefixHasher:
+    """Hash file .part berurutan dari byte 0 sambil download berjalan.
+
+    Hash harus dihitung berurutan, sedangkan segmen selesai tidak berurutan.
+    Thread ini mengikuti "frontier" (akhir bagian awal file yang sudah
+    lengkap, lihat advance()) dan membaca balik data tepat di belakang
+    penulis, selagi masih di page cache; bagian segmen berikutnya yang
+    sudah terunduh dibaca begitu frontier sampai di sana. Saat download
+    selesai hanya sisa kecil yang perlu di-hash, bukan seluruh file.
+    """
+
+    def __init__(self, path, algorithms=DEFAULT_ALGORITHMS):
+        self.path = path
+        self.hasher = MultiHash(algorithms)
+        self.pos = 0
+        self.frontier = 0
+        self.closed = False
+        self.error = None
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="download-hash", daemon=True)
+        self.thread.start()
+
+    def advance(self, frontier):
+        with self.cond:
+            if frontier > self.frontier:
+                self.frontier = frontier
+                self.cond.notify()
+
+    def stop(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.thread.join()
+
+    def finish(self, total):
+        """Tunggu sampai byte ke-total ter-hash, kembalikan {algoritme: hex}"""
+        self.advance(total)
+        self.stop()
+        if self.error is not None:
+            raise DownloadError(f"Gagal membaca file untuk checksum: {self.error}")
+        if self.pos != total:
+            raise DownloadError(f"Checksum hanya mencakup {self.pos} dari {total} byte")
+        return self.hasher.hexdigests()
+
+    def run(self):
+        try:
+            with open(self.path, "rb", buffering=0) as f:
+                while True:
+                    with self.cond:
+                        while self.pos >= self.frontier and not self.closed:
+                            self.cond.wait()
+                        if self.pos >= self.frontier:
+                            return
+                        end = self.frontier
+                    f.seek(self.pos)
+                    data = f.read(min(end - self.pos, CHUNK_SIZE * 4))
+                    if not data:
+                        return
+                    self.hasher.update(data)
+                    self.pos += len(data)
+        except OSError as e:
+            self.error = e
+
+
+# ==================== Segmented Download ====================
+class SegmentedDownload:
+    """Unduh satu file lewat beberapa koneksi HTTP Range sekaligus.
+
+    Data ditulis ke <path>.part (dialokasikan penuh di awal, tiap segmen
+    menulis ke offset-nya sendiri) dan posisinya dicatat di <path>.part.json
+    bersama URL dan ETag/Last-Modified. Download yang dibatalkan, putus, atau
+    terhenti karena aplikasi ditutup dilanjutkan dari posisi itu; If-Range
+    memastikan potongan lama masih milik file yang sama di server.
+    Checksum (self.digests) dihitung oleh PrefixHasher selama download,
+    jadi file tidak perlu dibaca ulang dari awal setelah selesai.
+
+    Error jaringan sementara dicoba ulang otomatis dengan jeda eksponensial.
+    Jika server tidak mendukung Range, jatuh ke satu koneksi biasa (tanpa
+    resume). Setelah selesai, ukuran dan (jika diberikan) SHA-256 diverifikasi
+    lalu .part di-rename ke path tujuan.
+
+    on_bytes(n) dipanggil dari thread segmen setiap ada data masuk;
+    done_bytes selalu berisi jumlah byte yang sudah ada di .part. bucket
+    (TokenBucket) opsional untuk membatasi bandwidth.
+    """
+
+    def __init__(self, url, path, segments=SEGMENTS, sha256=None, on_bytes=None, should_cancel=None,
+                 bucket=None, algorithms=DEFAULT_ALGORITHMS):
+        self.url = url
+        self.path = str(path)
+        self.part_path = self.path + ".part"
+        self.state_path = self.path + ".part.json"
+        self.segments = segments
+        self.sha256 = sha256.lower() if sha256 else None
+        self.on_bytes = on_bytes
+        self.should_cancel = should_cancel
+        self.bucket = bucket
+        self.algorithms = tuple(algorithms) if "sha256" in algorithms else ("sha256", *algorithms)
+        self.hasher = None
+        self.digests = None
+        self.total = None
+        self.ranged = False
+        self.resumed_bytes = 0  # byte yang sudah ada dari percobaan sebelumnya
+        self.done_bytes = 0
+        self.bytes_lock = threading.Lock()
+        self.state = None
+        self.state_lock = threading.Lock()
+        self.save_lock = threading.Lock()  # satu penulisan .part.json pada satu waktu
+        self.state_saved = 0.0
+
+    def run(self):
+        try:
+            try:
+                self.download()
+            except _RemoteChanged:
+                # File di server diganti di tengah download → mulai dari nol sekali
+                self.discard_partial()
+                self.download()
+            self.verify()
+        finally:
+            self.stop_hasher()
+        os.replace(self.part_path, self.path)
+        self.remove_state()
+        return self.path
+
+    def download(self):
+        info = None
+        self.state = self.load_state()
+        if self.state:
+            info = self.retry(probe, self.url, validator_of(self.state))
+            if not (info["ranged"] and info["total"] == self.state["total"]):
+                self.discard_partial()
+                info = None
+        if info is None:
+            info = self.retry(probe, self.url)
+        self.total, self.ranged = info["total"], info["ranged"]
+
+        if self.total == 0:
+            # File kosong: tidak ada yang perlu diunduh
+            open(self.part_path, "wb").close()
+            self.start_hasher()
+        elif self.ranged and self.total:
+            if self.state is None:
+                self.state = self.new_state(info)
+            self.resumed_bytes = sum(pos - start for start, _, pos in self.state["segments"])
+            self.done_bytes = self.resumed_bytes
+            # Potongan hasil resume ikut di-hash di background selagi segmen lain berjalan
+            self.start_hasher()
+            self.hasher.advance(self.contiguous())
+            self.download_segments(info["url"])
+        else:
+            self.download_stream(info["url"])
+
+    def add_bytes(self, n):
+        with self.bytes_lock:
+            self.done_bytes += n
+        if self.on_bytes is not None:
+            self.on_bytes(n)
+
+    def start_hasher(self):
+        self.stop_hasher()
+        self.hasher = PrefixHasher(self.part_path, self.algorithms)
+
+    def stop_hasher(self):
+        if self.hasher is not None:
+            self.hasher.stop()
+            self.hasher = None
+
+    def contiguous(self):
+        """Jumlah byte di awal .part yang sudah lengkap tanpa celah"""
+        frontier = 0
+        for start, end, pos in self.state["segments"]:
+            frontier = pos
+            if pos <= end:
+                break
+        return frontier
+
+    def check_cancel(self, cancelled=None):
+        cancelled = cancelled or self.should_cancel
+        if cancelled is not None and cancelled():
+            raise DownloadCancelled("Download dibatalkan")
+
+    def retry(self, fn, *args, cancelled=None):
+        """Jalankan fn, ulangi dengan jeda eksponensial untuk error sementara.
+
+        cancelled menggantikan should_cancel saat mengecek pembatalan, misal
+        untuk segmen yang harus berhenti begitu segmen lain gagal.
+        """
+        for attempt in range(RETRIES + 1):
+            self.check_cancel(cancelled)
+            try:
+                return fn(*args)
+            except (DownloadError, _RemoteChanged):
+                raise
+            except Exception as e:
+                if attempt == RETRIES or not is_transient(e):
+                    raise DownloadError(f"Gagal mengunduh: {e}") from e
+                self.sleep(min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt), cancelled)
+
+    def sleep(self, seconds, cancelled=None):
+        deadline = time.monotonic() + seconds
+        while True:
+            self.check_cancel(cancelled)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(0.2, remaining))
+
+    # ---------- State .part ----------
+    def new_state(self, info):
+        with open(self.part_path, "wb") as f:
+            f.truncate(self.total)  # prealokasi
+        state = {
+            "url": self.url,
+            "total": self.total,
+            "etag": info["etag"],
+            "last_modified": info["last_modified"],
+            # [start, end inklusif, posisi berikutnya yang belum terisi]
+            "segments": [[start, end, start] for start, end in split_ranges(self.total, self.segments)],
+        }
+        self.save_state(state, force=True)
+        return state
+
+    def load_state(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("url") != self.url or not os.path.exists(self.part_path):
+            return None
+        return state
+
+    def save_state(self, state=None, force=False):
+        state = state or self.state
+        now = time.monotonic()
+        with self.state_lock:
+            if not force and now - self.state_saved < STATE_INTERVAL:
+                return
+            self.state_saved = now
+            # Posisi segmen diambil SEBELUM fsync: byte sampai posisi ini sudah
+            # ditulis ke .part, jadi ikut tersimpan oleh fsync di bawah. Posisi
+            # yang maju setelah snapshot baru dicatat pada save berikutnya.
+            snapshot = dict(state, segments=[list(segment) for segment in state["segments"]])
+        # fsync di luar state_lock supaya thread segmen tidak ikut menunggu disk;
+        # save berkala yang bertabrakan dengan save lain cukup dilewati
+        if not self.save_lock.acquire(blocking=force):
+            return
+        try:
+            fd = os.open(self.part_path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            replace_atomic(tmp_path, self.state_path)
+        finally:
+            self.save_lock.release()
+
+    def remove_state(self):
+        for path in (self.state_path, self.state_path + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def discard_partial(self):
+        self.stop_hasher()
+        self.state = None
+        self.resumed_bytes = self.done_bytes = 0
+        self.remove_state()
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    # ---------- Banyak koneksi ----------
+    def download_segments(self, url):
+        validator = validator_of(self.state)
+        pending = [segment for segment in self.state["segments"] if segment[2] <= segment[1]]
+        if not pending:
+            return
+        failed = threading.Event()
+
+        def cancelled():
+            return failed.is_set() or (self.should_cancel is not None and self.should_cancel())
+
+        try:
+            with ThreadPoolExecutor(len(pending), thread_name_prefix="download") as pool:
+                futures = [
+                    pool.submit(self.retry, self.fetch_range, url, segment, validator, cancelled,
+                                cancelled=cancelled)
+                    for segment in pending
+                ]
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                errors = [f.exception() for f in done if f.exception() is not None]
+                if errors:
+                    # Hentikan segmen lain secepatnya, lalu laporkan error pertama
+                    failed.set()
+                    wait(futures)
+                    self.check_cancel()
+                    raise errors[0]
+        finally:
+            # Posisi terakhir selalu dicatat, supaya bisa dilanjutkan
+            if os.path.exists(self.part_path):
+                self.save_state(force=True)
+
+    def fetch_range(self, url, segment, validator, cancelled):
+        start, end, pos = segment
+        if pos > end:
+            return
+        with open(self.part_path, "r+b", buffering=0) as f, open_url(url, pos, end, validator) as resp:
+            if resp.status != 206:
+                if validator:
+                    raise _RemoteChanged()
+                raise DownloadError("Server mengabaikan permintaan Range")
+            f.seek(pos)
+            while pos <= end:
+                if cancelled():
+                    raise DownloadCancelled("Download dibatalkan")
+                try:
+                    chunk = resp.read(min(CHUNK_SIZE, end + 1 - pos))
+                except (OSError, http.client.HTTPException) as e:
+                    raise _Interrupted(str(e)) from e
+                if not chunk:
+                    break
+                f.write(chunk)
+                pos += len(chunk)
+                segment[2] = pos
+                self.hasher.advance(self.contiguous())
+                self.add_bytes(len(chunk))
+                self.save_state()
+                if self.bucket is not None:
+                    self.bucket.consume(len(chunk), cancelled)
+        if pos != end + 1:
+            raise _Interrupted(f"Koneksi terputus di byte {pos} (segmen {start}-{end})")
+
+    # ---------- Satu koneksi ----------
+    def download_stream(self, url):
+        # Tanpa Range tidak bisa dilanjutkan; putus = ulang dari awal
+        def fetch():
+            self.done_bytes = 0
+            with open(self.part_path, "wb", buffering=0) as f, open_url(url) as resp:
+                self.start_hasher()
+                while True:
+                    self.check_cancel()
+                    try:
+                        chunk = resp.read(CHUNK_SIZE)
+                    except (OSError, http.client.HTTPException) as e:
+                        raise _Interrupted(str(e)) from e
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    self.add_bytes(len(chunk))
+                    self.hasher.advance(self.done_bytes)
+                    if self.bucket is not None:
+                        self.bucket.consume(len(chunk), self.should_cancel)
+        self.retry(fetch)
+
+    # ---------- Verifikasi ----------
+    def verify(self):
+        size = os.path.getsize(self.part_path)
+        if self.total is not None and size != self.total:
+            self.discard_partial()
+            raise DownloadError(f"Ukuran file tidak sesuai: {size} dari {self.total} byte")
+        self.digests = self.hasher.finish(size)
+        self.hasher = None
+        if self.sha256 and self.digests["sha256"] != self.sha256:
+            # Potongan yang rusak tidak boleh dipakai untuk resume
+            self.discard_partial()
+            raise DownloadError("Checksum SHA-256 tidak cocok, file rusak")
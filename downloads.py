@@ -0,0 +1,263 @@
+import os
+import time
+import itertools
+import threading
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
+from downloader import SegmentedDownload, DownloadCancelled, TokenBucket, SpeedMeter
+
+# Download yang berjalan bersamaan (sisanya antre)
+MAX_ACTIVE = 3
+# Progress ke UI maksimal 10x per detik, berapa pun cepatnya koneksi
+PROGRESS_INTERVAL = 0.1
+# Interval hitung ulang kecepatan per job & total (ms)
+STATS_INTERVAL = 100
+
+
+# ==================== Download Worker ====================
+class DownloadWorker(QThread):
+    """Jalankan satu SegmentedDownload di thread sendiri.
+
+    Data masuk per chunk dari beberapa thread segmen; progress hanya
+    dikirim paling sering tiap PROGRESS_INTERVAL (ditambah sekali di akhir)
+    supaya event loop tidak kebanjiran sinyal lintas thread. Kecepatan & ETA
+    dihitung DownloadManager.update_stats dari byte yang dilaporkan di sini.
+    """
+    progress = pyqtSignal("qint64", "qint64")  # downloaded, total
+    finished = pyqtSignal(str)  # path file hasil download
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, url, save_path, sha256=None, bucket=None):
+        super().__init__()
+        self.url = url
+        self.save_path = save_path
+        self.sha256 = sha256
+        self.bucket = bucket
+        self.digests = None  # {algoritme: hex} setelah selesai
+        self._canceled = False
+        self.progress_lock = threading.Lock()
+        self.last_progress = 0.0
+
+    def cancel(self):
+        self._canceled = True
+
+    def run(self):
+        # Beberapa koneksi Range paralel + resume dari .part, lihat downloader.SegmentedDownload
+        download = SegmentedDownload(
+            self.url, self.save_path, sha256=self.sha256,
+            on_bytes=lambda n: self.on_bytes(download),
+            should_cancel=lambda: self._canceled,
+            bucket=self.bucket
+        )
+        try:
+            download.run()
+            self.digests = download.digests
+            self.emit_progress(download, force=True)
+            self.finished.emit(self.save_path)
+        except DownloadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def on_bytes(self, download):
+        self.emit_progress(download)
+
+    def emit_progress(self, download, force=False):
+        now = time.monotonic()
+        with self.progress_lock:
+            if not force and now - self.last_progress < PROGRESS_INTERVAL:
+                return
+            self.last_progress = now
+        self.progress.emit(download.done_bytes, download.total or 0)
+
+
+# ==================== Download Job ====================
+class DownloadJob:
+    QUEUED = "queued"
+    RUNNING = "running"
+    PAUSED = "paused"
+    DONE = "done"
+    FAILED = "failed"
+
+    _ids = itertools.count(1)
+
+    def __init__(self, url, path, sha256=None):
+        self.id = next(self._ids)
+        self.url = url
+        self.path = str(path)
+        self.sha256 = sha256
+        self.digests = None
+        self.status = self.QUEUED
+        self.done_bytes = 0
+        self.total = 0
+        self.speed = 0.0  # byte/detik (EMA), dihitung ulang oleh manager
+        self.eta = None  # detik
+        self.meter = SpeedMeter()
+        self.error = ""
+        self.worker = None
+        self.remove_requested = False
+        self.delete_partial = False
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+
+# ==================== Download Manager ====================
+class DownloadManager(QObject):
+    """Antrean download: maksimal max_active berjalan, sisanya menunggu.
+
+    Semua job berbagi satu TokenBucket untuk batas bandwidth global.
+    Kecepatan per job (job.speed, rata-rata bergerak), ETA (job.eta) dan
+    total (total_speed) dihitung ulang setiap STATS_INTERVAL lalu
+    diumumkan lewat stats_updated, jadi UI diperbarui dengan laju tetap
+    (juga saat koneksi macet dan tidak ada progress masuk). Job yang
+    dijeda menyimpan .part-nya dan dilanjutkan dari sana.
+    """
+    job_added = pyqtSignal(object)
+    job_changed = pyqtSignal(object)  # status berubah
+    job_removed = pyqtSignal(object)
+    job_finished = pyqtSignal(object)
+    job_failed = pyqtSignal(object)
+    stats_updated = pyqtSignal()
+
+    def __init__(self, max_active=MAX_ACTIVE, limit=0, parent=None):
+        super().__init__(parent)
+        self.jobs = []
+        self.max_active = max_active
+        self.bucket = TokenBucket(limit)
+        self.total_speed = 0.0
+        self.timer = QTimer(self)
+        self.timer.setInterval(STATS_INTERVAL)
+        self.timer.timeout.connect(self.update_stats)
+
+    # ---------- API ----------
+    def add(self, url, path, sha256=None):
+        # Satu path = satu job: job lama (termasuk yang dijeda / gagal) memegang .part yang sama
+        for job in self.jobs:
+            if job.path == str(path) and job.status != DownloadJob.DONE:
+                if job.remove_requested:
+                    # Batal dihapus: worker lama sedang berhenti, job dijalankan lagi setelahnya
+                    job.remove_requested = False
+                    self.set_status(job, DownloadJob.PAUSED)
+                self.resume(job)
+                return job
+        job = DownloadJob(url, path, sha256)
+        self.jobs.append(job)
+        self.job_added.emit(job)
+        self.schedule()
+        return job
+
+    def pause(self, job):
+        if job.status == DownloadJob.RUNNING:
+            job.worker.cancel()
+        if job.status in (DownloadJob.QUEUED, DownloadJob.RUNNING):
+            self.set_status(job, DownloadJob.PAUSED)
+
+    def resume(self, job):
+        if job.status in (DownloadJob.PAUSED, DownloadJob.FAILED):
+            job.error = ""
+            self.set_status(job, DownloadJob.QUEUED)
+            self.schedule()
+
+    def remove(self, job, delete_partial=True):
+        """Buang job dari daftar (dibatalkan jika masih berjalan)"""
+        job.remove_requested = True
+        job.delete_partial = delete_partial
+        if job.worker is not None:
+            job.worker.cancel()  # dilanjutkan di on_worker_done
+        else:
+            self.drop(job)
+
+    def set_max_active(self, count):
+        self.max_active = max(1, count)
+        self.schedule()
+
+    def set_limit(self, bytes_per_sec):
+        self.bucket.set_rate(bytes_per_sec)
+
+    def running(self):
+        return [job for job in self.jobs if job.worker is not None]
+
+    def shutdown(self):
+        """Hentikan semua download; .part disimpan untuk dilanjutkan nanti"""
+        self.timer.stop()
+        workers = [job.worker for job in self.jobs if job.worker is not None]
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            worker.wait()
+
+    # ---------- Internal ----------
+    def set_status(self, job, status):
+        job.status = status
+        self.job_changed.emit(job)
+
+    def schedule(self):
+        active = len(self.running())
+        for job in self.jobs:
+            if active >= self.max_active:
+                break
+            if job.status == DownloadJob.QUEUED and job.worker is None:
+                self.start(job)
+                active += 1
+        if active and not self.timer.isActive():
+            self.timer.start()
+
+    def start(self, job):
+        worker = DownloadWorker(job.url, job.path, job.sha256, self.bucket)
+        worker.progress.connect(lambda done, total: self.on_progress(job, done, total))
+        worker.finished.connect(lambda _path: self.on_worker_done(job, DownloadJob.DONE))
+        worker.cancelled.connect(lambda: self.on_worker_done(job, None))
+        worker.error.connect(lambda message: self.on_worker_done(job, DownloadJob.FAILED, message))
+        job.worker = worker
+        job.meter.reset()
+        self.set_status(job, DownloadJob.RUNNING)
+        worker.start()
+
+    def on_progress(self, job, done, total):
+        job.done_bytes = done
+        job.total = total
+
+    def on_worker_done(self, job, status, message=""):
+        job.worker.wait()
+        job.digests = job.worker.digests
+        job.worker = None
+        job.speed = 0.0
+        job.eta = None
+        if job.remove_requested:
+            self.drop(job)
+        elif status == DownloadJob.DONE:
+            job.done_bytes = job.total = max(job.total, job.done_bytes)
+            self.set_status(job, DownloadJob.DONE)
+            self.job_finished.emit(job)
+        elif status == DownloadJob.FAILED:
+            job.error = message
+            self.set_status(job, DownloadJob.FAILED)
+            self.job_failed.emit(job)
+        self.schedule()
+        self.total_speed = sum(j.speed for j in self.running())
+        self.stats_updated.emit()
+
+    def drop(self, job):
+        if job.delete_partial:
+            for path in (job.path + ".part", job.path + ".part.json"):
+                if os.path.exists(path):
+                    os.remove(path)
+        if job in self.jobs:
+            self.jobs.remove(job)
+            self.job_removed.emit(job)
+
+    def update_stats(self):
+        now = time.monotonic()
+        total = 0.0
+        for job in self.jobs:
+            if job.worker is None:
+                continue
+            job.speed = job.meter.update(job.done_bytes, now)
+            job.eta = job.meter.eta(job.done_bytes, job.total)
+            total += job.speed
+        self.total_speed = total
+        if not self.running():
+            self.timer.stop()
+        self.stats_updated.emit()
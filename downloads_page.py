@@ -0,0 +1,176 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem,
+    QHeaderView, QProgressBar, QAbstractItemView, QSpinBox
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from downloads import DownloadJob
+
+
+# ==================== Downloads Page ====================
+class DownloadsPage(QWidget):
+    """Daftar download (tidak modal): antrean tetap jalan saat user pindah halaman"""
+    STATUS_TEXT = {
+        DownloadJob.QUEUED: "⏳ Antre",
+        DownloadJob.RUNNING: "📥 Mengunduh",
+        DownloadJob.PAUSED: "⏸️ Dijeda",
+        DownloadJob.DONE: "✅ Selesai",
+        DownloadJob.FAILED: "❌ Gagal",
+    }
+
+    def __init__(self, parent, manager):
+        super().__init__()
+        self.parent = parent
+        self.manager = manager
+        self.rows = {}  # job id -> (job, progress bar, tombol jeda/lanjut)
+        self.init_ui()
+        manager.job_added.connect(self.on_job_added)
+        manager.job_changed.connect(self.on_job_changed)
+        manager.job_removed.connect(self.on_job_removed)
+        manager.stats_updated.connect(self.on_stats_updated)
+        for job in manager.jobs:
+            self.on_job_added(job)
+
+    def init_ui(self):
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+
+        # Header
+        header_layout = QHBoxLayout()
+        title = QLabel("📥 Unduhan")
+        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setObjectName("pageTitle")
+        self.total_label = QLabel("Total: -")
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+        header_layout.addWidget(self.total_label)
+        main_layout.addLayout(header_layout)
+
+        # Pengaturan antrean
+        settings_layout = QHBoxLayout()
+        self.active_spin = QSpinBox()
+        self.active_spin.setRange(1, 8)
+        self.active_spin.setValue(self.manager.max_active)
+        self.active_spin.valueChanged.connect(self.manager.set_max_active)
+        self.limit_spin = QSpinBox()
+        self.limit_spin.setRange(0, 1000000)
+        self.limit_spin.setSingleStep(256)
+        self.limit_spin.setSuffix(" KB/s")
+        self.limit_spin.setSpecialValueText("Tanpa batas")
+        self.limit_spin.valueChanged.connect(lambda kb: self.manager.set_limit(kb * 1024))
+        settings_layout.addWidget(QLabel("Download bersamaan:"))
+        settings_layout.addWidget(self.active_spin)
+        settings_layout.addSpacing(20)
+        settings_layout.addWidget(QLabel("Batas kecepatan:"))
+        settings_layout.addWidget(self.limit_spin)
+        settings_layout.addStretch()
+        main_layout.addLayout(settings_layout)
+
+        self.table = QTableWidget()
+        self.table.setObjectName("downloadTable")
+        self.table.setColumnCount(5)
+        self.table.setHorizontalHeaderLabels(["File", "Status", "Progress", "Kecepatan · Sisa", "Aksi"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setShowGrid(False)
+        main_layout.addWidget(self.table)
+        self.setLayout(main_layout)
+
+    def row_of(self, job):
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).data(Qt.UserRole) == job.id:
+                return row
+        return -1
+
+    def on_job_added(self, job):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        name_item = QTableWidgetItem(job.name)
+        name_item.setData(Qt.UserRole, job.id)
+        name_item.setToolTip(job.path)
+        self.table.setItem(row, 0, name_item)
+        self.table.setItem(row, 1, QTableWidgetItem())
+        self.table.setItem(row, 3, QTableWidgetItem())
+
+        bar = QProgressBar()
+        bar.setRange(0, 1000)
+        bar.setTextVisible(True)
+        self.table.setCellWidget(row, 2, bar)
+
+        toggle_btn = QPushButton()
+        toggle_btn.clicked.connect(lambda _, j=job: self.toggle(j))
+        remove_btn = QPushButton("Hapus")
+        remove_btn.clicked.connect(lambda _, j=job: self.manager.remove(j, delete_partial=j.status != DownloadJob.DONE))
+        actions = QWidget()
+        actions_layout = QHBoxLayout(actions)
+        actions_layout.setContentsMargins(0, 0, 0, 0)
+        actions_layout.addWidget(toggle_btn)
+        actions_layout.addWidget(remove_btn)
+        self.table.setCellWidget(row, 4, actions)
+
+        self.rows[job.id] = (job, bar, toggle_btn)
+        self.on_job_changed(job)
+
+    def on_job_changed(self, job):
+        row = self.row_of(job)
+        if row < 0:
+            return
+        _, bar, toggle_btn = self.rows[job.id]
+        status = self.STATUS_TEXT.get(job.status, job.status)
+        status_item = self.table.item(row, 1)
+        status_item.setText(status)
+        tooltip = job.error
+        if job.status == DownloadJob.DONE and job.digests:
+            # Checksum dihitung saat mengunduh, bisa dicocokkan manual dengan situs resminya
+            tooltip = "\n".join(f"{name.upper()}: {digest}" for name, digest in job.digests.items())
+        status_item.setToolTip(tooltip)
+        toggle_btn.setText("Lanjut" if job.status in (DownloadJob.PAUSED, DownloadJob.FAILED) else "Jeda")
+        toggle_btn.setEnabled(job.status != DownloadJob.DONE)
+        self.update_row(row, job, bar)
+
+    def on_job_removed(self, job):
+        row = self.row_of(job)
+        if row >= 0:
+            self.table.removeRow(row)
+        self.rows.pop(job.id, None)
+
+    def toggle(self, job):
+        if job.status in (DownloadJob.PAUSED, DownloadJob.FAILED):
+            self.manager.resume(job)
+        else:
+            self.manager.pause(job)
+
+    def update_row(self, row, job, bar):
+        format_bytes = self.parent.format_bytes
+        if job.total > 0:
+            bar.setValue(int(job.done_bytes * 1000 / job.total))
+            bar.setFormat(f"{format_bytes(job.done_bytes)} / {format_bytes(job.total)}")
+        else:
+            bar.setValue(0)
+            bar.setFormat(format_bytes(job.done_bytes))
+        speed = "-"
+        if job.status == DownloadJob.RUNNING:
+            speed = f"{format_bytes(job.speed)}/s"
+            if job.eta is not None:
+                speed += f" · {self.format_eta(job.eta)}"
+        self.table.item(row, 3).setText(speed)
+
+    @staticmethod
+    def format_eta(seconds):
+        seconds = int(seconds)
+        if seconds >= 3600:
+            return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+        return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+    def on_stats_updated(self):
+        for row in range(self.table.rowCount()):
+            job, bar, _ = self.rows[self.table.item(row, 0).data(Qt.UserRole)]
+            self.update_row(row, job, bar)
+        running = len(self.manager.running())
+        self.total_label.setText(
+            f"Total: {self.parent.format_bytes(self.manager.total_speed)}/s · {running} berjalan"
+        )
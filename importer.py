@@ -0,0 +1,170 @@
+import os
+import json
+import time
+from pathlib import Path
+from PyQt5.QtCore import QThread, pyqtSignal
+from copier import CopyCancelled, copy_file, copy_files
+from checksum import (DEFAULT_ALGORITHMS, ChecksumError, MultiHash, file_digests,
+                      find_manifest, parse_manifest)
+
+# FAT/exFAT menyimpan mtime dengan resolusi 2 detik
+MTIME_TOLERANCE = 2.0
+# Penanda di folder tujuan selama impor belum selesai
+MARKER_NAME = ".importing.json"
+
+
+def plan_import(source, dest, extra=()):
+    """Folder tujuan & list (src, dst, size) semua file yang diimpor.
+
+    Folder ikut dicatat supaya subfolder kosong (misal saves/) tetap dibuat.
+    extra: pasangan (path sumber, nama di folder tujuan), misal thumbnail.
+    """
+    source, dest = Path(source), Path(dest)
+    folders = []
+    files = []
+    for root, dirs, names in os.walk(source):
+        dirs.sort()
+        rel = Path(root).relative_to(source)
+        folders.append(dest / rel)
+        for name in sorted(names):
+            src = Path(root) / name
+            try:
+                size = src.stat().st_size
+            except OSError:
+                continue
+            files.append((src, dest / rel / name, size))
+    for src, name in extra:
+        src = Path(src)
+        files.append((src, dest / name, src.stat().st_size))
+    return folders, files
+
+
+def is_copied(src, dst):
+    """True jika dst sudah salinan lengkap src (ukuran & mtime sama)"""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    return (src_stat.st_size == dst_stat.st_size
+            and abs(src_stat.st_mtime - dst_stat.st_mtime) <= MTIME_TOLERANCE)
+
+
+def read_marker(dest):
+    """Info impor yang terputus di folder ini (None jika tidak ada)"""
+    try:
+        with open(Path(dest) / MARKER_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# ==================== Import Job ====================
+class ImportJob(QThread):
+    """Salin folder game ke GAMES_DIR di background.
+
+    File yang ukuran & mtime-nya sudah sama di tujuan dilewati, jadi impor
+    yang dibatalkan atau terputus cukup dijalankan ulang untuk melanjutkan.
+    mtime baru disalin (copystat) setelah isi file lengkap, sehingga file
+    setengah jadi tidak pernah dianggap selesai. Penyalinan sendiri
+    dikerjakan paralel oleh copier.copy_files; jika store (BlobStore)
+    diberikan, file di-dedup lewat hardlink ke blob.
+
+    Checksum setiap file dihitung sambil disalin (dengan store: SHA-256
+    blob, tanpa baca ulang; tanpa store lewat copier.copy_file, yang tetap
+    memakai salinan kernel untuk file besar) dan hasilnya ada di self.files
+    ({path relatif: {"size", "sha256", ...}}) untuk disimpan di katalog.
+    Jika folder sumber punya manifest (SHA256SUMS dll.), file yang tidak
+    cocok dihapus dari tujuan dan impor gagal; impor ulang menyalinnya lagi.
+    """
+    progress = pyqtSignal("qint64", "qint64", int, int)  # byte selesai, total byte, file selesai, total file
+    finished = pyqtSignal(str)  # folder tujuan
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, source, dest, extra=(), store=None, algorithms=DEFAULT_ALGORITHMS):
+        super().__init__()
+        self.source = Path(source)
+        self.dest = Path(dest)
+        self.extra = list(extra)
+        self.store = store
+        self.algorithms = algorithms
+        self.files = {}
+        self.resumed = read_marker(self.dest) is not None
+        self._canceled = False
+
+    def cancel(self):
+        self._canceled = True
+
+    def run(self):
+        try:
+            folders, files = plan_import(self.source, self.dest, self.extra)
+            self.dest.mkdir(parents=True, exist_ok=True)
+            self.write_marker()
+            for folder in folders:
+                folder.mkdir(parents=True, exist_ok=True)
+
+            total_bytes = sum(size for _, _, size in files)
+            pending = [f for f in files if not is_copied(f[0], f[1])]
+            skipped_bytes = total_bytes - sum(size for _, _, size in pending)
+            skipped_files = len(files) - len(pending)
+
+            def report(done_bytes, done_files):
+                self.progress.emit(skipped_bytes + done_bytes, total_bytes,
+                                   skipped_files + done_files, len(files))
+
+            report(0, 0)
+            copy_files(pending, report, lambda: self._canceled, self.copy)
+
+            for _, dst, size in files:
+                name = self.relative(dst)
+                if name not in self.files:
+                    # Disalin oleh impor sebelumnya (dilewati) → belum punya checksum
+                    digests = file_digests(dst, self.algorithms, lambda: self._canceled)
+                    if digests is None:
+                        raise CopyCancelled()
+                    self.files[name] = digests
+                self.files[name]["size"] = size
+            self.verify_manifest()
+
+            (self.dest / MARKER_NAME).unlink()
+            self.finished.emit(str(self.dest))
+        except CopyCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def relative(self, dst):
+        return Path(dst).relative_to(self.dest).as_posix()
+
+    def copy(self, src, dst, on_bytes, should_cancel):
+        # Dipanggil paralel dari thread copier; tiap file punya key sendiri
+        if self.store is not None:
+            digests = {"sha256": self.store.materialize(src, dst, on_bytes, should_cancel)}
+        else:
+            hasher = MultiHash(self.algorithms)
+            copy_file(src, dst, on_bytes, should_cancel, hasher)
+            digests = hasher.hexdigests()
+        self.files[self.relative(dst)] = digests
+
+    def verify_manifest(self):
+        manifest = find_manifest(self.source)
+        if manifest is None:
+            return
+        bad = []
+        for name, digest in parse_manifest(manifest).items():
+            record = self.files.get(name)
+            if record is None:
+                bad.append(f"{name} (tidak ada)")
+            elif record["sha256"] != digest:
+                bad.append(name)
+                os.remove(self.dest / name)
+                del self.files[name]
+        if bad:
+            listed = "\n".join(bad[:10]) + (f"\n... dan {len(bad) - 10} lainnya" if len(bad) > 10 else "")
+            raise ChecksumError(f"Checksum tidak cocok dengan {manifest.name}:\n{listed}")
+
+    def write_marker(self):
+        marker = {"source": str(self.source), "started": time.time()}
+        with open(self.dest / MARKER_NAME, "w", encoding="utf-8") as f:
+            json.dump(marker, f)
@@ -0,0 +1,78 @@
+import os
+import json
+from catalog import CatalogStore, CatalogError, GameCatalog
+from config import CATALOG_PATH, JSON_PATH, STORE_DIR, ensure_dirs
+
+# Semua perubahan lewat objek ini; UI mendengarkan sinyalnya.
+# Masih kosong sampai load_catalog() (dipanggil setelah jendela tampil).
+catalog = GameCatalog()
+
+_blob_store = None
+
+
+def load_catalog():
+    """Buka catalog.db (migrasi data-games.json lama sekali) dan isi catalog"""
+    if catalog.loaded:
+        return catalog
+    ensure_dirs()
+    store = CatalogStore(CATALOG_PATH)
+    try:
+        store.migrate_from_json(JSON_PATH)
+    except (json.JSONDecodeError, OSError, CatalogError) as e:
+        print("Migrasi data-games.json gagal:", e)
+    catalog.load(store)
+    return catalog
+
+
+def get_blob_store():
+    """Store dedup (GAMES_DIR/.store), dibuat saat pertama kali dipakai"""
+    global _blob_store
+    if _blob_store is None:
+        from blobstore import BlobStore
+        _blob_store = BlobStore(STORE_DIR)
+    return _blob_store
+
+
+def apply_scan(result):
+    """Terapkan hasil scanner.scan_library ke catalog (di GUI thread).
+
+    Folder baru → game baru (nama = nama folder, cover = thumbnail.*),
+    folder yang berubah hanya mengisi cover yang kosong / hilang, folder
+    yang hilang → game-nya dihapus. Hanya entri itu yang ditulis, termasuk
+    mtime folder di tabel scan_dirs.
+    """
+    from importer import MARKER_NAME
+    from scanner import DEFAULT_DESCRIPTION, folder_key
+
+    by_folder = {folder_key(game["folder"]): game for game in catalog.games if game.get("folder")}
+    new_games = []
+    mtimes = {}
+    for info in result.found:
+        # Folder bisa dihapus / di-rename selagi ScanJob berjalan → jangan jadi game hantu
+        if not os.path.isdir(info["folder"]):
+            continue
+        game = by_folder.get(folder_key(info["folder"]))
+        if game is None:
+            # Impor dari panel admin bisa mulai setelah folder ini di-scan
+            if os.path.exists(os.path.join(info["folder"], MARKER_NAME)):
+                continue
+            new_games.append({
+                "name": info["name"],
+                "folder": info["folder"],
+                "thumbnail": info["thumbnail"],
+                "description": DEFAULT_DESCRIPTION,
+            })
+        elif info["thumbnail"] and not os.path.exists(game.get("thumbnail") or ""):
+            catalog.update(game["id"], {"thumbnail": info["thumbnail"]})
+        mtimes[info["folder"]] = info["mtime_ns"]
+    if new_games:
+        catalog.add_many(new_games)
+
+    removed = [folder for folder in result.removed if not os.path.isdir(folder)]
+    for folder in removed:
+        game = by_folder.get(folder_key(folder))
+        if game is not None and catalog.get(game["id"]) is game:
+            catalog.remove(game["id"])
+    catalog.store.save_scan_state(mtimes, removed)
+    return len(new_games), len(removed)
+
@@ -0,0 +1,99 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit, QFrame,
+    QMessageBox, QGraphicsDropShadowEffect
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+
+# ==================== Login Window (Modern Card Style) ====================
+class LoginWindow(QWidget):
+    def __init__(self, parent):
+        super().__init__()
+        self.setObjectName("loginPage") 
+        self.parent = parent
+        self.init_ui()
+
+    def init_ui(self):
+
+        # ====== CARD LOGIN ======
+        card = QFrame()
+        card.setFixedWidth(360)
+        card.setObjectName("loginCard")
+
+        # ====== SHADOW BIRU GLOW ======
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(45)     # besar cahaya
+        shadow.setXOffset(0)
+        shadow.setYOffset(0)
+        shadow.setColor(QColor(0, 170, 255))  # ✅ BIRU NEON
+
+        card.setGraphicsEffect(shadow)
+
+        # ====== LAYOUT ISIAN CARD ======
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(24, 24, 24, 24)
+        card_layout.setSpacing(20)
+
+        # ====== HEADER ======
+        title = QLabel("LOGIN DIBUTUHKAN")
+        title.setAlignment(Qt.AlignCenter)
+        title.setObjectName("loginTitle")
+
+        subtitle = QLabel("ADMIN ACCESS ONLY")
+        subtitle.setAlignment(Qt.AlignCenter)
+        subtitle.setObjectName("loginSubtitle")
+
+        # ====== INPUT USERNAME ======
+        self.user_edit = QLineEdit()
+        self.user_edit.setPlaceholderText("USERNAME")
+        self.user_edit.setFixedHeight(42)
+
+        # ====== INPUT PASSWORD ======
+        self.pass_edit = QLineEdit()
+        self.pass_edit.setPlaceholderText("ACCESS KEY")
+        self.pass_edit.setEchoMode(QLineEdit.Password)
+        self.pass_edit.setFixedHeight(42)
+
+        # ====== BUTTON LOGIN ======
+        login_btn = QPushButton("INITIATE CONNECTION")
+        login_btn.setFixedHeight(42)
+        login_btn.clicked.connect(self.check_login)
+
+        # ====== SUSUN KE CARD ======
+        card_layout.addWidget(title)
+        card_layout.addWidget(subtitle)
+        card_layout.addSpacing(10)
+        card_layout.addWidget(self.user_edit)
+        card_layout.addWidget(self.pass_edit)
+        card_layout.addSpacing(10)
+        card_layout.addWidget(login_btn)
+        
+        main_layout = QHBoxLayout(self)
+        main_layout.setAlignment(Qt.AlignCenter)
+
+        # ====== WRAPPER VERTICAL (AGAR LINK DI BAWAH FORM) ======
+        wrapper = QVBoxLayout()
+        wrapper.setAlignment(Qt.AlignCenter)
+
+        wrapper.addWidget(card)
+
+        # === LINK UPDATE DI BAWAH FORM LOGIN ===
+        update_label = QLabel('<a href="https://github.com/debotz-bot/apply_to_steam">🔗 New Update Check Github</a>')
+        update_label.setAlignment(Qt.AlignCenter)
+        update_label.setOpenExternalLinks(True)
+        update_label.setObjectName("updateLink")
+
+        wrapper.addWidget(update_label)
+
+        # Masukkan wrapper ke layout utama
+        main_layout.addLayout(wrapper)
+
+
+
+    # ================= LOGIN LOGIC =================
+    def check_login(self):
+        if self.user_edit.text() == "qq" and self.pass_edit.text() == "12":
+            self.parent.show_admin()
+        else:
+            QMessageBox.warning(self, "ACCESS DENIED", "Username atau password salah!")
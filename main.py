@@ -1,768 +1,126 @@
 import sys
-import ctypes
-import os
-import json
-import shutil
 import time
-import urllib.request
-from utils import copy_to_steam, restart_steam
+
+# Titik awal --profile-startup (sebelum import berat)
+_STARTED = time.perf_counter()
+
+import os
+import sqlite3
+import warnings
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QPushButton, QLabel, QLineEdit, QFrame,
-    QScrollArea, QGridLayout, QMessageBox, QFileDialog, QTextEdit,
-    QToolButton, QTableWidget, QTableWidgetItem, QDialog, QDialogButtonBox, QGraphicsDropShadowEffect,
-    QHeaderView, QProgressBar, QAbstractItemView
+    QScrollArea, QMessageBox, QFileDialog, QToolButton, QCompleter, QToolTip
 )
-from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal, QUrl
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QCursor, QDesktopServices, QColor
-import warnings
-
-myappid = u'DEGamesLauncher.degameslauncher.v1'
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QUrl, QEvent, QStringListModel, QObject, QTimer, QPoint, QRect
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QPainter, QRegion, QFont, QCursor, QDesktopServices
+from config import ASSETS_DIR, CATALOG_PATH, GAMES_DIR, STORE_DIR, STYLESHEET_PATH, THUMB_CACHE_DIR, TRASH_DIR
+from library import catalog, load_catalog, get_blob_store, apply_scan
+from thumbnails import init_loader, get_loader, thumbnail_key
+from search import SearchIndex
+from trash import PurgeJob, list_trash, LOCAL_TRASH_NAME
+from utils import copy_to_steam, restart_steam
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-BASE_DIR = Path(__file__).parent.resolve()
-DATA_DIR = BASE_DIR / "data"
-GAMES_DIR = DATA_DIR / "games"
-JSON_PATH = DATA_DIR / "data-games.json"
-ASSETS_DIR = BASE_DIR / "assets"
-
-DATA_DIR.mkdir(exist_ok=True)
-GAMES_DIR.mkdir(exist_ok=True)
-
-if not JSON_PATH.exists():
-    with open(JSON_PATH, 'w') as f:
-        json.dump([], f)
-
-try:
-    with open(JSON_PATH, 'r') as f:
-        raw = json.load(f)
-        games_data = raw if isinstance(raw, list) else []
-except (json.JSONDecodeError, OSError):
-    games_data = []
-
-
-# ==================== Edit Game Dialog ====================
-class EditGameDialog(QDialog):
-    def __init__(self, parent, game, row_index):
-        super().__init__(parent)
-        self.setWindowTitle("Edit Game")
-        self.game = game
-        self.row_index = row_index
-        self.original_name = game["name"]
-        self.original_folder = game["folder"]
-        self.original_thumbnail = game.get("thumbnail", "")
-        self.original_desc = game.get("description", "")
-        self.new_thumb_path = ""  # hanya diisi jika user upload baru
-        self.setModal(True)
-        self.resize(500, 400)
-        self.init_ui()
-
-    def init_ui(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #0f172a;
-                border-radius: 14px;
-            }
-
-            QLabel {
-                color: #e5e7eb;
-                font-weight: 600;
-            }
-
-            QLineEdit, QTextEdit {
-                background: #020617;
-                border: 1px solid #2563eb;
-                border-radius: 8px;
-                padding: 8px;
-                color: white;
-            }
-
-            QLineEdit:focus, QTextEdit:focus {
-                border: 1px solid #3b82f6;
-            }
-
-            QPushButton {
-                background: #2563eb;
-                color: white;
-                border-radius: 8px;
-                padding: 8px 14px;
-                font-weight: bold;
-            }
-
-            QPushButton:hover {
-                background: #1d4ed8;
-            }
-
-            QPushButton#danger {
-                background: #dc2626;
-            }
-
-            QPushButton#danger:hover {
-                background: #b91c1c;
-            }
-        """)
-
-        layout = QVBoxLayout()
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
-
-        # ===== TITLE =====
-        title = QLabel("✏️ Edit Data Game")
-        title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 18px; color: #60a5fa;")
-        layout.addWidget(title)
-
-        # ===== NAMA GAME =====
-        layout.addWidget(QLabel("Nama Game"))
-        self.name_edit = QLineEdit(self.original_name)
-        layout.addWidget(self.name_edit)
-
-        # ===== FOLDER =====
-        layout.addWidget(QLabel("Folder Game"))
-        self.folder_label = QLabel(self.original_folder)
-        self.folder_label.setStyleSheet("color: #94a3b8; font-size: 11px;")
-        layout.addWidget(self.folder_label)
-
-        # ===== THUMBNAIL =====
-        layout.addWidget(QLabel("Thumbnail"))
-
-        thumb_layout = QHBoxLayout()
-
-        self.current_thumb_label = QLabel()
-        self.current_thumb_label.setFixedSize(90, 90)
-        self.current_thumb_label.setAlignment(Qt.AlignCenter)
-        self.current_thumb_label.setStyleSheet("""
-            background: #020617;
-            border-radius: 10px;
-            border: 2px solid #2563eb;
-        """)
-
-        if self.original_thumbnail and os.path.exists(self.original_thumbnail):
-            pixmap = QPixmap(self.original_thumbnail).scaled(
-                90, 90, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
-            )
-            self.current_thumb_label.setPixmap(pixmap)
-
-        self.change_thumb_btn = QPushButton("Ganti Thumbnail")
-        self.change_thumb_btn.clicked.connect(self.select_new_thumbnail)
-
-        thumb_layout.addWidget(self.current_thumb_label)
-        thumb_layout.addWidget(self.change_thumb_btn)
-        thumb_layout.addStretch()
-
-        layout.addLayout(thumb_layout)
-
-        # ===== DESKRIPSI =====
-        layout.addWidget(QLabel("Deskripsi"))
-        self.desc_edit = QTextEdit(self.original_desc)
-        self.desc_edit.setMaximumHeight(110)
-        layout.addWidget(self.desc_edit)
-
-        # ===== TOMBOL BAWAH =====
-        btn_layout = QHBoxLayout()
-
-        cancel_btn = QPushButton("Batal")
-        cancel_btn.setObjectName("danger")
-        cancel_btn.clicked.connect(self.reject)
 
-        save_btn = QPushButton("Simpan")
-        save_btn.clicked.connect(self.validate_and_accept)
+# ==================== Startup Profile ====================
+class StartupProfile:
+    """Catat durasi tiap fase startup (aktif dengan --profile-startup)"""
 
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(save_btn)
-
-        layout.addLayout(btn_layout)
-
-        self.setLayout(layout)
-
-
-    def select_new_thumbnail(self):
-        file, _ = QFileDialog.getOpenFileName(self, "Pilih Thumbnail Baru", "", "Image Files (*.png *.jpg *.jpeg)")
-        if file:
-            self.new_thumb_path = file
-            # Update preview
-            pixmap = QPixmap(file).scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.current_thumb_label.setPixmap(pixmap)
-
-    def validate_and_accept(self):
-        new_name = self.name_edit.text().strip()
-        if not new_name:
-            QMessageBox.warning(self, "Error", "Nama game tidak boleh kosong!")
-            return
-
-        # Deteksi perubahan
-        name_changed = (new_name != self.original_name)
-        desc_changed = (self.desc_edit.toPlainText() != self.original_desc)
-        thumb_changed = (self.new_thumb_path != "")
-
-        if not (name_changed or desc_changed or thumb_changed):
-            # Tidak ada perubahan → tutup saja
-            self.reject()
-            return
-
-        global games_data
-
-        # 1. Rename folder jika nama berubah
-        if name_changed:
-            old_folder = Path(self.original_folder)
-            new_folder = GAMES_DIR / new_name
-            if old_folder.exists():
-                try:
-                    old_folder.rename(new_folder)
-                    games_data[self.row_index]["folder"] = str(new_folder)
-                    games_data[self.row_index]["name"] = new_name
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Gagal rename folder:\n{str(e)}")
-                    return
-            else:
-                games_data[self.row_index]["name"] = new_name
-                # Folder tidak ada → biarkan saja (mungkin sudah dihapus manual)
-
-        # 2. Ganti thumbnail jika ada yang baru
-        if thumb_changed:
-            ext = Path(self.new_thumb_path).suffix
-            new_thumb_name = f"thumbnail{ext}"
-            new_thumb_dest = Path(games_data[self.row_index]["folder"]) / new_thumb_name
-            try:
-                shutil.copy2(self.new_thumb_path, new_thumb_dest)
-                games_data[self.row_index]["thumbnail"] = str(new_thumb_dest)
-            except Exception as e:
-                QMessageBox.warning(self, "Peringatan", f"Gagal mengganti thumbnail:\n{str(e)}")
-
-        # 3. Perbarui deskripsi
-        if desc_changed:
-            games_data[self.row_index]["description"] = self.desc_edit.toPlainText()
-
-        # Simpan ke JSON
-        try:
-            with open(JSON_PATH, 'w') as f:
-                json.dump(games_data, f, indent=2)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal menyimpan data:\n{str(e)}")
-            return
+    def __init__(self):
+        self.enabled = False
+        self.last = _STARTED
+        self.phases = []
 
-        self.accept()
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
 
-    def accept(self):
-        global games_data
-        new_name = self.name_edit.text().strip()
-        if not new_name:
-            QMessageBox.warning(self, "Error", "Nama game tidak boleh kosong!")
+    def report(self):
+        if not self.enabled or not self.phases:
             return
+        print("Startup profile:", file=sys.stderr)
+        for phase, seconds in self.phases:
+            print(f"  {phase:<28}{seconds * 1000:8.1f} ms", file=sys.stderr)
+        print(f"  {'total':<28}{(self.last - _STARTED) * 1000:8.1f} ms", file=sys.stderr)
+        self.phases = []
 
-        old_name = games_data[self.row_index]["name"]
-        old_folder = Path(games_data[self.row_index]["folder"])
 
-        if new_name != old_name:
-            new_folder = GAMES_DIR / new_name
-            if old_folder.exists():
-                try:
-                    old_folder.rename(new_folder)
-                    games_data[self.row_index]["folder"] = str(new_folder)
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Gagal rename folder:\n{str(e)}")
-                    return
-            games_data[self.row_index]["name"] = new_name
+startup = StartupProfile()
 
-        games_data[self.row_index]["description"] = self.desc_edit.toPlainText()
 
-        with open(JSON_PATH, 'w') as f:
-            json.dump(games_data, f, indent=2)
+# Hasil pencarian per halaman; halaman berikutnya diminta saat grid di-scroll ke bawah
+SEARCH_PAGE = 200
 
-        super().accept()
 
+# ==================== Search Worker ====================
+class SearchWorker(QObject):
+    # Berjalan di thread sendiri; hanya query dengan generasi terbaru yang diproses.
+    # Index hanya diubah lewat slot di bawah (antrean thread ini), jadi urutan
+    # rebuild → update per game → query sama dengan urutan kirim dari GUI thread.
+    results = pyqtSignal(int, list, list)  # generasi, key hasil, saran
 
-# ==================== Login Window (Modern Card Style) ====================
-class LoginWindow(QWidget):
-    def __init__(self, parent):
+    def __init__(self, index):
         super().__init__()
-        self.setObjectName("loginPage") 
-        self.parent = parent
-        self.init_ui()
-
-    def init_ui(self):
-
-        # ====== CARD LOGIN ======
-        card = QFrame()
-        card.setFixedWidth(360)
-        card.setStyleSheet("""
-            QFrame {
-                background: #0d0d0d;
-                border-radius: 16px;
-               
-            }
-        """)
-
-        # ====== SHADOW BIRU GLOW ======
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(45)     # besar cahaya
-        shadow.setXOffset(0)
-        shadow.setYOffset(0)
-        shadow.setColor(QColor(0, 170, 255))  # ✅ BIRU NEON
-
-        card.setGraphicsEffect(shadow)
-
-        # ====== LAYOUT ISIAN CARD ======
-        card_layout = QVBoxLayout(card)
-        card_layout.setContentsMargins(24, 24, 24, 24)
-        card_layout.setSpacing(20)
-
-        # ====== HEADER ======
-        title = QLabel("LOGIN DIBUTUHKAN")
-        title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            letter-spacing: 2px;
-            color: #00f2ea;
-        """)
-
-        subtitle = QLabel("ADMIN ACCESS ONLY")
-        subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet("""
-            font-size: 10px;
-            color: #a855f7;
-            letter-spacing: 2px;
-        """)
-
-        # ====== INPUT USERNAME ======
-        self.user_edit = QLineEdit()
-        self.user_edit.setPlaceholderText("USERNAME")
-        self.user_edit.setFixedHeight(42)
-        self.user_edit.setStyleSheet("""
-            QLineEdit {
-                background: transparent;
-                border: none;
-                border-bottom: 2px solid rgba(0, 242, 234, 0.3);
-                color: white;
-                padding: 8px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-bottom: 2px solid #00f2ea;
-            }
-        """)
-
-        # ====== INPUT PASSWORD ======
-        self.pass_edit = QLineEdit()
-        self.pass_edit.setPlaceholderText("ACCESS KEY")
-        self.pass_edit.setEchoMode(QLineEdit.Password)
-        self.pass_edit.setFixedHeight(42)
-        self.pass_edit.setStyleSheet("""
-            QLineEdit {
-                background: transparent;
-                border: none;
-                border-bottom: 2px solid rgba(0, 242, 234, 0.3);
-                color: white;
-                padding: 8px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-bottom: 2px solid #00f2ea;
-            }
-        """)
-
-        # ====== BUTTON LOGIN ======
-        login_btn = QPushButton("INITIATE CONNECTION")
-        login_btn.setFixedHeight(42)
-        login_btn.clicked.connect(self.check_login)
-        login_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 2px solid #00f2ea;
-                color: #00f2ea;
-                font-weight: bold;
-                letter-spacing: 2px;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                background: #00f2ea;
-                color: #000;
-                box-shadow: 0 0 20px #00f2ea;
-            }
-            QPushButton:pressed {
-                background: #00cfc8;
-            }
-        """)
-
-        # ====== SUSUN KE CARD ======
-        card_layout.addWidget(title)
-        card_layout.addWidget(subtitle)
-        card_layout.addSpacing(10)
-        card_layout.addWidget(self.user_edit)
-        card_layout.addWidget(self.pass_edit)
-        card_layout.addSpacing(10)
-        card_layout.addWidget(login_btn)
-        
-        main_layout = QHBoxLayout(self)
-        main_layout.setAlignment(Qt.AlignCenter)
-
-        # ====== WRAPPER VERTICAL (AGAR LINK DI BAWAH FORM) ======
-        wrapper = QVBoxLayout()
-        wrapper.setAlignment(Qt.AlignCenter)
-
-        wrapper.addWidget(card)
-
-        # === LINK UPDATE DI BAWAH FORM LOGIN ===
-        update_label = QLabel('<a href="https://github.com/debotz-bot/apply_to_steam">🔗 New Update Check Github</a>')
-        update_label.setAlignment(Qt.AlignCenter)
-        update_label.setOpenExternalLinks(True)
-        update_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 17px;
-                margin-top: 20px;
-                text-decoration: none;
-
-            }
-            QLabel:hover {
-                color: #a855f7;
-                text-decoration: none;
-
-            }
-        """)
+        self.index = index
+        self.latest = 0  # di-set dari GUI thread setiap ada query baru
 
-        wrapper.addWidget(update_label)
+    def rebuild_index(self, entries):
+        self.index.rebuild(entries)
 
-        # Masukkan wrapper ke layout utama
-        main_layout.addLayout(wrapper)
+    def index_game(self, key, name, description):
+        self.index.add(key, name, description)
 
+    def unindex_game(self, key):
+        self.index.remove(key)
 
-
-    # ================= LOGIN LOGIC =================
-    def check_login(self):
-        if self.user_edit.text() == "qq" and self.pass_edit.text() == "12":
-            self.parent.show_admin()
-        else:
-            QMessageBox.warning(self, "ACCESS DENIED", "Username atau password salah!")
-
-
-
-# ==================== Admin Window ====================
-class AdminWindow(QWidget):
-    def __init__(self, parent):
-        super().__init__()
-        self.parent = parent
-        self.folder_path = ""
-        self.thumb_path = ""
-        self.init_ui()
-
-    def init_ui(self):
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(20)
-
-        # Header
-        header_layout = QHBoxLayout()
-        title = QLabel("🛠️ Panel Admin")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        title.setStyleSheet("color: #bb86fc;")
-        home_btn = QPushButton("🏠 Home")
-        home_btn.clicked.connect(self.go_to_home)
-        header_layout.addWidget(title)
-        header_layout.addStretch()
-        header_layout.addWidget(home_btn)
-        main_layout.addLayout(header_layout)
-
-        # Form
-        form_layout = QGridLayout()
-        form_layout.setSpacing(10)
-
-        self.name_edit = QLineEdit()
-        self.name_edit.setPlaceholderText("Nama Game")
-        self.folder_btn = QPushButton("📁 Pilih Folder Game")
-        self.folder_btn.clicked.connect(self.select_folder)
-        self.thumb_btn = QPushButton("🖼️ Upload Thumbnail")
-        self.thumb_btn.clicked.connect(self.select_thumbnail)
-        self.desc_edit = QTextEdit()
-        self.desc_edit.setPlaceholderText("Deskripsi game...")
-        self.desc_edit.setMaximumHeight(80)
-        save_btn = QPushButton("💾 Simpan Game")
-        save_btn.setObjectName("primary")
-        save_btn.clicked.connect(self.save_game)
-
-        form_layout.addWidget(QLabel("Nama Game:"), 0, 0)
-        form_layout.addWidget(self.name_edit, 0, 1)
-        form_layout.addWidget(QLabel("Folder Game:"), 1, 0)
-        form_layout.addWidget(self.folder_btn, 1, 1)
-        form_layout.addWidget(QLabel("Thumbnail:"), 2, 0)
-        form_layout.addWidget(self.thumb_btn, 2, 1)
-        form_layout.addWidget(QLabel("Deskripsi:"), 3, 0)
-        form_layout.addWidget(self.desc_edit, 3, 1)
-        form_layout.addWidget(save_btn, 4, 1, Qt.AlignRight)
-
-        # Table
-        table_label = QLabel("📋 Daftar Game yang Tersimpan")
-        table_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        table_label.setStyleSheet("color: #03dac6;")
-
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["No", "Nama Game", "Deskripsi", "Aksi"])
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setAlternatingRowColors(True)
-
-        main_layout.addLayout(form_layout)
-        main_layout.addWidget(table_label)
-        main_layout.addWidget(self.table)
-        self.setLayout(main_layout)
-        self.load_game_table()
-
-    def go_to_home(self):
-        self.parent.stack.setCurrentWidget(self.parent.home)
-
-    def select_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Pilih Folder Game")
-        if folder:
-            self.folder_path = folder
-            self.folder_btn.setText(f"📁 {os.path.basename(folder)}")
-
-    def select_thumbnail(self):
-        file, _ = QFileDialog.getOpenFileName(self, "Pilih Thumbnail", "", "Image Files (*.png *.jpg *.jpeg)")
-        if file:
-            self.thumb_path = file
-            self.thumb_btn.setText(f"🖼️ {os.path.basename(file)}")
-
-    def save_game(self):
-        name = self.name_edit.text().strip()
-        if not name or not self.folder_path:
-            QMessageBox.warning(self, "Error", "Nama game dan folder wajib diisi!")
+    def run_query(self, generation, text, limit):
+        if generation != self.latest:
             return
 
-        game_folder = GAMES_DIR / name
-        game_folder.mkdir(exist_ok=True)
-
-        for item in Path(self.folder_path).iterdir():
-            if item.is_file():
-                shutil.copy2(item, game_folder / item.name)
-            else:
-                shutil.copytree(item, game_folder / item.name, dirs_exist_ok=True)
-
-        thumb_dest = ""
-        if self.thumb_path:
-            ext = Path(self.thumb_path).suffix
-            thumb_dest = str(game_folder / f"thumbnail{ext}")
-            shutil.copy2(self.thumb_path, thumb_dest)
-
-        global games_data
-        games_data.append({
-            "name": name,
-            "folder": str(game_folder),
-            "thumbnail": thumb_dest,
-            "description": self.desc_edit.toPlainText() or "Tidak ada deskripsi."
-        })
-
-        with open(JSON_PATH, 'w') as f:
-            json.dump(games_data, f, indent=2)
+        keys = self.index.search(text, limit, should_cancel=lambda: generation != self.latest)
+        if keys is None or generation != self.latest:
+            return
+        suggestions = self.index.complete(text)
+        if generation == self.latest:
+            self.results.emit(generation, keys, suggestions)
 
-        msg = QMessageBox(self)
-        msg.setWindowTitle("✅ Berhasil")
-        msg.setText("🎮 Game berhasil ditambahkan!")
-        msg.setInformativeText("Game sekarang sudah tersedia di halaman Home.")
-        msg.setIcon(QMessageBox.Information)
-
-        msg.setStyleSheet("""
-        QMessageBox {
-            background-color: #020617;
-            color: #e5e7eb;
-            font-size: 11pt;
-        }
-
-        QLabel {
-            color: #e5e7eb;
-        }
-
-        QPushButton {
-            background-color: #3b82f6;
-            color: white;
-            border-radius: 10px;
-            padding: 8px 18px;
-            font-weight: bold;
-        }
-
-        QPushButton:hover {
-            background-color: #2563eb;
-        }
-
-        QPushButton:pressed {
-            background-color: #1d4ed8;
-        }
-        """)
-
-        msg.exec_()
-
-        self.clear_form()
-        self.load_game_table()
-        self.parent.refresh_home()
-
-    def clear_form(self):
-        self.name_edit.clear()
-        self.folder_path = ""
-        self.thumb_path = ""
-        self.folder_btn.setText("📁 Pilih Folder Game")
-        self.thumb_btn.setText("🖼️ Upload Thumbnail")
-        self.desc_edit.clear()
-
-    def load_game_table(self):
-        global games_data
-
-        self.table.setRowCount(len(games_data))
-        self.table.setObjectName("adminGameTable")
-        self.table.setAlternatingRowColors(True)  # ✅ biar lebih rapi
-        self.table.verticalHeader().setVisible(False)
-        self.table.setShowGrid(False)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.verticalHeader().setDefaultSectionSize(44)
-        self.table.horizontalHeader().setStretchLastSection(True)
-
-        for row, game in enumerate(games_data):
-            if not isinstance(game, dict):
-                continue
-
-            self.table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
-            self.table.setItem(row, 1, QTableWidgetItem(game.get("name", "")))
-
-            desc = game.get("description", "")[:60] + "..." if len(game.get("description", "")) > 60 else game.get("description", "")
-            self.table.setItem(row, 2, QTableWidgetItem(desc))
-
-            action_widget = QWidget()
-            action_layout = QHBoxLayout()
-            action_layout.setContentsMargins(6, 0, 6, 10)
-            action_layout.setSpacing(6)
-
-
-            edit_btn = QPushButton("Edit ✏️")
-            edit_btn.setFixedSize(100, 28)
-            edit_btn.setStyleSheet("""
-                QPushButton {
-                    background: #2563eb;
-                    color: white;
-                    border-radius: 6px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: #1d4ed8;
-                }
-            """)
-            edit_btn.clicked.connect(lambda _, r=row: self.edit_game(r))
-
-
-            delete_btn = QPushButton("Hapus 🗑️")
-            delete_btn.setFixedSize(100, 28)
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background: #dc2626;
-                    color: white;
-                    border-radius: 6px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: #b91c1c;
-                }
-            """)
-            delete_btn.clicked.connect(lambda _, r=row: self.delete_game(r))
-
-
-            action_layout.addWidget(edit_btn)
-            action_layout.addWidget(delete_btn)
-            action_layout.addStretch()
-            action_widget.setLayout(action_layout)
-            self.table.setCellWidget(row, 3, action_widget)
-
-    def edit_game(self, row):
-        global games_data
-        game = games_data[row]
-        dialog = EditGameDialog(self, game, row)
-        if dialog.exec_() == QDialog.Accepted:
-            self.load_game_table()
-            self.parent.refresh_home()
-
-    def delete_game(self, row):
-        global games_data
-        game = games_data[row]
-        reply = QMessageBox.question(
-            self, "Konfirmasi Hapus",
-            f"Yakin ingin menghapus game '{game['name']}'?\nIni akan menghapus folder game dan data.",
-            QMessageBox.Yes | QMessageBox.No
-        )
-        if reply == QMessageBox.Yes:
-            folder_path = Path(game["folder"])
-            if folder_path.exists():
-                shutil.rmtree(folder_path)
-
-            games_data.pop(row)
-            with open(JSON_PATH, 'w') as f:
-                json.dump(games_data, f, indent=2)
-
-            QMessageBox.information(self, "Sukses", "Game berhasil dihapus!")
-            self.load_game_table()
-            self.parent.refresh_home()
-
-# ==================== Download Worker ====================
-class DownloadWorker(QThread):
-    progress = pyqtSignal(int, int, float)  # downloaded, total, speed (KB/s)
-    finished = pyqtSignal(str)  # path file hasil download
-    error = pyqtSignal(str)
-
-    def __init__(self, url, save_path):
-        super().__init__()
-        self.url = url
-        self.save_path = save_path
-        self._canceled = False
 
-    def cancel(self):
-        self._canceled = True
+# Tambahan batas QPixmapCache (KB) untuk bitmap kartu, ~180 kartu 260x340
+CARD_FACE_CACHE_KB = 64 * 1024
 
-    def run(self):
-        try:
-            def reporthook(block_num, block_size, total_size):
-                if self._canceled:
-                    raise Exception("Download dibatalkan")
-                downloaded = block_num * block_size
-                if total_size > 0:
-                    percent = min(100, int(downloaded * 100 / total_size))
-                    speed = downloaded / (1024 * (time.time() - self.start_time + 0.001))
-                    self.progress.emit(downloaded, total_size, speed)
-                return not self._canceled
-
-            import time
-            self.start_time = time.time()
-            urllib.request.urlretrieve(self.url, self.save_path, reporthook)
-            if not self._canceled:
-                self.finished.emit(self.save_path)
-        except Exception as e:
-            self.error.emit(str(e))
 
 # ==================== Game Card (Tailwind Style) ====================
 class GameCard(QFrame):
-    def __init__(self, game_info):
+    """Kartu game di grid Home.
+
+    Dengan bitmap=True bagian statis kartu (cover, judul, deskripsi) tidak
+    digambar sebagai widget: sekali digambar ke QPixmap (di-cache per game &
+    ukuran kartu di QPixmapCache), setelah itu setiap paint cukup satu blit.
+    Latar kartu (termasuk hover), tombol info & tombol Add to Steam tetap
+    widget hidup.
+    """
+    face_keys = {}  # id game -> key bitmap di QPixmapCache
+
+    def __init__(self, game_info=None, bitmap=False):
         super().__init__()
-        self.game = game_info
+        self.game = None
+        self.thumb_key = ""
+        self.thumb_path = ""
+        self.thumb_pending = False  # cover masih dimuat → bitmap belum boleh di-cache
+        self.bitmap = bitmap
+        self.face = None
         self.setObjectName("gameCard")
         self.setFixedSize(260, 340)
-
-        # CARD STYLE (PUTIH + SHADOW)
-        self.setStyleSheet("""
-        QFrame#gameCard {
-            background: #ffffff;
-            border-radius: 20px;
-            border: none;
-        }
-        QFrame#gameCard:hover {
-            background: #f5f7ff;
-        }
-        """)
-
+        # Gaya kartu & isinya ada di styles.qss (#gameCard, #cardThumb, #cardTitle, ...)
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self.init_ui()
+        get_loader().ready.connect(self.on_thumbnail_ready)
+        if game_info is not None:
+            self.set_game(game_info)
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -779,28 +137,13 @@ class GameCard(QFrame):
         thumb_container_layout.setAlignment(Qt.AlignCenter)
 
         thumb_wrapper = QFrame()
+        thumb_wrapper.setObjectName("cardThumb")
         thumb_wrapper.setFixedSize(thumb_size, thumb_size)
-        thumb_wrapper.setStyleSheet("""
-            QFrame {
-                border-radius: 12px;
-                background: #e5e7eb;
-            }
-        """)
-
-        thumb_label = QLabel(thumb_wrapper)
-        thumb_label.setFixedSize(thumb_size, thumb_size)
-        thumb_label.setAlignment(Qt.AlignCenter)
-
-        if self.game.get("thumbnail") and os.path.exists(self.game["thumbnail"]):
-            pixmap = QPixmap(self.game["thumbnail"]).scaled(
-                thumb_size, thumb_size,
-                Qt.IgnoreAspectRatio,   # FULL TERISI
-                Qt.SmoothTransformation
-            )
-            thumb_label.setPixmap(pixmap)
-        else:
-            thumb_label.setText("No Image")
-            thumb_label.setStyleSheet("color: #64748b;")
+
+        self.thumb_label = QLabel(thumb_wrapper)
+        self.thumb_label.setObjectName("cardThumbImage")
+        self.thumb_label.setFixedSize(thumb_size, thumb_size)
+        self.thumb_label.setAlignment(Qt.AlignCenter)
 
         thumb_container_layout.addWidget(thumb_wrapper)
         thumb_container.setLayout(thumb_container_layout)
@@ -814,52 +157,26 @@ class GameCard(QFrame):
         body_layout.setSpacing(8)
 
         # JUDUL
-        full_name = self.game["name"]
-        name_label = QLabel(full_name)
-        name_label.setWordWrap(True)
-        name_label.setToolTip(full_name)
-        name_label.setStyleSheet("""
-            font-size: 19px;
-            font-weight: 700;
-            color: #0f172a;
-            qproperty-alignment: AlignCenter;
-        """)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("cardTitle")
+        self.name_label.setWordWrap(True)
+        self.name_label.setAlignment(Qt.AlignCenter)
 
        # ================= DESKRIPSI 1 BARIS + ICON INFO =================
-        full_desc = self.game.get("description", "Tidak ada deskripsi.")
-
         # Deskripsi dipaksa 1 baris saja
-        desc_label = QLabel(full_desc)
-        desc_label.setFixedHeight(20)
-        desc_label.setWordWrap(False)
-        desc_label.setStyleSheet("""
-            font-size: 14px;
-            color: #475569;
-        """)
-
-        # Potong otomatis jika kepanjangan
-        metrics = desc_label.fontMetrics()
-        elided_text = metrics.elidedText(full_desc, Qt.ElideRight, 170)
-        desc_label.setText(elided_text)
+        self.desc_label = QLabel()
+        self.desc_label.setObjectName("cardDescription")
+        self.desc_label.setFixedHeight(20)
+        self.desc_label.setWordWrap(False)
 
         # ================= ICON INFO =================
         # ================= ICON INFO PREMIUM =================
         info_btn = QToolButton()
+        info_btn.setObjectName("cardInfo")
         info_btn.setText("ⓘ")
         info_btn.setCursor(QCursor(Qt.PointingHandCursor))
         info_btn.setMouseTracking(True)
         info_btn.setFixedSize(18, 18)
-        info_btn.setStyleSheet("""
-            QToolButton {
-                border: none;
-                background: transparent;
-                font-size: 14px;
-                color: #64748b;
-            }
-            QToolButton:hover {
-                color: #3b82f6;
-            }
-        """)
 
         from PyQt5.QtWidgets import QToolTip
         from PyQt5.QtCore import QPoint
@@ -883,7 +200,7 @@ class GameCard(QFrame):
                 <div style="
                     color: #64748b;
                 ">
-                    {full_desc}
+                    {self.game.get("description", "Tidak ada deskripsi.")}
                 </div>
             </div>
             """
@@ -901,34 +218,18 @@ class GameCard(QFrame):
         desc_layout = QHBoxLayout()
         desc_layout.setContentsMargins(0, 0, 0, 0)
         desc_layout.setSpacing(6)
-        desc_layout.addWidget(desc_label)
+        desc_layout.addWidget(self.desc_label)
         desc_layout.addWidget(info_btn)
         desc_layout.addStretch()
 
 
         # ================= FOOTER BUTTON =================
         self.add_btn = QPushButton("Add to Steam")
+        self.add_btn.setObjectName("cardAddButton")
         self.add_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background: #3b82f6;
-                color: white;
-                border-radius: 10px;
-                padding: 10px;
-                font-size: 15px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: #2563eb;
-            }
-            QPushButton:pressed {
-                background: #1d4ed8;
-            }
-        """)
         self.add_btn.clicked.connect(self.add_to_steam)
 
-        body_layout.addWidget(name_label)
+        body_layout.addWidget(self.name_label)
         body_layout.addLayout(desc_layout)
         body_layout.addStretch()
         body_layout.addWidget(self.add_btn)
@@ -942,6 +243,120 @@ class GameCard(QFrame):
 
         self.setLayout(main_layout)
 
+        # Widget ini hanya dipakai untuk menggambar bitmap; ukurannya tetap
+        # dihitung layout supaya posisi tombol sama dengan kartu biasa
+        self.static_widgets = (thumb_container, self.name_label, self.desc_label)
+        if self.bitmap:
+            for widget in self.static_widgets:
+                policy = widget.sizePolicy()
+                policy.setRetainSizeWhenHidden(True)
+                widget.setSizePolicy(policy)
+                widget.hide()
+
+    def set_game(self, game_info, force=False):
+        """Isi ulang kartu dengan data game lain (kartu dipakai ulang oleh grid)"""
+        if game_info is self.game and not force:
+            return
+        self.game = game_info
+
+        full_name = game_info["name"]
+        self.name_label.setText(full_name)
+        self.name_label.setToolTip(full_name)
+
+        # Potong otomatis jika kepanjangan
+        full_desc = game_info.get("description", "Tidak ada deskripsi.")
+        # Font dari stylesheet aplikasi baru terpasang setelah polish
+        self.desc_label.ensurePolished()
+        metrics = self.desc_label.fontMetrics()
+        self.desc_label.setText(metrics.elidedText(full_desc, Qt.ElideRight, 170))
+
+        # Thumbnail di-decode di background, tampilkan placeholder dulu
+        loader = get_loader()
+        thumb_size = self.thumb_label.size()
+        if self.thumb_key:
+            loader.cancel(self.thumb_path, thumb_size)
+        self.thumb_key = ""
+        self.thumb_path = game_info.get("thumbnail") or ""
+        self.thumb_pending = False
+
+        if self.bitmap:
+            self.face = QPixmapCache.find(self.face_key())
+            self.update()
+            if self.face is not None and not self.face.isNull():
+                return  # cover sudah ada di bitmap, tidak perlu di-decode
+            self.face = None
+
+        if self.thumb_path and os.path.exists(self.thumb_path):
+            self.thumb_key = thumbnail_key(self.thumb_path, thumb_size)  # FULL TERISI
+            pixmap = loader.request(self.thumb_path, thumb_size)
+            if pixmap is not None:
+                self.thumb_label.setPixmap(pixmap)
+            else:
+                self.thumb_label.setText("Memuat...")
+                self.thumb_pending = True
+        else:
+            self.thumb_label.setText("No Image")
+
+    def on_thumbnail_ready(self, key, pixmap):
+        if key != self.thumb_key:
+            return
+        if pixmap.isNull():
+            self.thumb_label.setText("No Image")
+        else:
+            self.thumb_label.setPixmap(pixmap)
+        self.thumb_pending = False
+        if self.bitmap:
+            self.face = None
+            self.update()
+
+    # ---------- Bitmap kartu ----------
+    def face_key(self):
+        dpr = self.devicePixelRatioF()
+        return f"card:{self.game['id']}@{round(self.width() * dpr)}x{round(self.height() * dpr)}"
+
+    @classmethod
+    def forget_face(cls, game):
+        """Buang bitmap game ini (datanya berubah)"""
+        for key in cls.face_keys.pop(game["id"], ()):
+            QPixmapCache.remove(key)
+
+    def render_face(self):
+        self.layout().activate()
+        dpr = self.devicePixelRatioF()
+        face = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        face.setDevicePixelRatio(dpr)
+        face.fill(Qt.transparent)
+        painter = QPainter(face)
+        for widget in self.static_widgets:
+            # Tanpa latar jendela: latar (dan hover) kartu tetap digambar kartunya
+            widget.render(painter, widget.mapTo(self, QPoint()), QRegion(), QWidget.DrawChildren)
+        painter.end()
+        # "Memuat..." tidak di-cache, bitmap digambar ulang saat cover siap
+        if not self.thumb_pending:
+            key = self.face_key()
+            QPixmapCache.insert(key, face)
+            self.face_keys.setdefault(self.game["id"], set()).add(key)
+        return face
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.bitmap or self.game is None:
+            return
+        if self.face is None:
+            self.face = self.render_face()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.face)
+        painter.end()
+
+    def event(self, event):
+        # Judul tersembunyi di mode bitmap → tooltip nama ditangani kartu
+        if self.bitmap and event.type() == QEvent.ToolTip and self.game is not None:
+            title = QRect(self.name_label.mapTo(self, QPoint()), self.name_label.size())
+            if title.contains(event.pos()):
+                QToolTip.showText(event.globalPos(), self.game["name"], self)
+                return True
+        return super().event(event)
+
     def add_to_steam(self):
         success = copy_to_steam(self.game["folder"])
 
@@ -954,33 +369,7 @@ class GameCard(QFrame):
             confirm.setIcon(QMessageBox.Question)
             confirm.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
 
-            confirm.setStyleSheet("""
-            QMessageBox {
-                background-color: #020617;
-                color: #e5e7eb;
-                font-size: 11pt;
-            }
-
-            QLabel {
-                color: #e5e7eb;
-            }
-
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border-radius: 10px;
-                padding: 8px 18px;
-                font-weight: bold;
-            }
-
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-
-            QPushButton:pressed {
-                background-color: #1d4ed8;
-            }
-            """)
+            confirm.setProperty("tone", "info")
 
             reply = confirm.exec_()
 
@@ -993,25 +382,7 @@ class GameCard(QFrame):
                     msg.setText("Steam berhasil direstart!")
                     msg.setIcon(QMessageBox.Information)
 
-                    msg.setStyleSheet("""
-                    QMessageBox {
-                        background-color: #020617;
-                        color: #e5e7eb;
-                        font-size: 11pt;
-                    }
-
-                    QLabel {
-                        color: #00f2ea;
-                    }
-
-                    QPushButton {
-                        background-color: #00f2ea;
-                        color: black;
-                        border-radius: 10px;
-                        padding: 8px 18px;
-                        font-weight: bold;
-                    }
-                    """)
+                    msg.setProperty("tone", "success")
                     msg.exec_()
 
                 else:
@@ -1020,25 +391,7 @@ class GameCard(QFrame):
                     err.setText("Gagal merestart Steam.")
                     err.setIcon(QMessageBox.Critical)
 
-                    err.setStyleSheet("""
-                    QMessageBox {
-                        background-color: #020617;
-                        color: #e5e7eb;
-                        font-size: 11pt;
-                    }
-
-                    QLabel {
-                        color: #f87171;
-                    }
-
-                    QPushButton {
-                        background-color: #dc2626;
-                        color: white;
-                        border-radius: 10px;
-                        padding: 8px 18px;
-                        font-weight: bold;
-                    }
-                    """)
+                    err.setProperty("tone", "error")
                     err.exec_()
 
         # ===================== JIKA COPY GAGAL =====================
@@ -1048,84 +401,160 @@ class GameCard(QFrame):
             fail.setText("Gagal menambahkan file ke direktori Steam.")
             fail.setIcon(QMessageBox.Critical)
 
-            fail.setStyleSheet("""
-            QMessageBox {
-                background-color: #020617;
-                color: #e5e7eb;
-                font-size: 11pt;
-            }
-
-            QLabel {
-                color: #f87171;
-            }
-
-            QPushButton {
-                background-color: #dc2626;
-                color: white;
-                border-radius: 10px;
-                padding: 8px 18px;
-                font-weight: bold;
-            }
-            """)
+            fail.setProperty("tone", "error")
             fail.exec_()
 
 
 
 # ==================== Home Window ====================
 class HomeWindow(QWidget):
+    # Grid virtual: hanya baris yang terlihat yang punya GameCard,
+    # kartu yang keluar viewport dikembalikan ke pool untuk dipakai ulang
+    CARD_WIDTH = 260
+    CARD_HEIGHT = 340
+    COLUMNS = 4
+    SPACING = 25
+    MARGINS = (20, 10, 20, 20)  # kiri, atas, kanan, bawah
+    BUFFER_ROWS = 1  # baris cadangan di atas & bawah viewport
+    end_reached = pyqtSignal()  # baris terakhir masuk viewport (untuk memuat hasil berikutnya)
+    # Bagian statis kartu digambar dari bitmap yang di-cache (lihat GameCard).
+    # Opsional (--card-bitmaps): repaint ~15-20% lebih cepat, tapi render
+    # pertama ~1,7x lebih lambat dan QPixmapCache butuh +64 MB (bench_cards)
+    CARD_BITMAPS = False
+
     def __init__(self):
         super().__init__()
+        if self.CARD_BITMAPS:
+            QPixmapCache.setCacheLimit(QPixmapCache.cacheLimit() + CARD_FACE_CACHE_KB)
+        self.games = []
+        self.visible_cards = {}  # index game -> GameCard
+        self.detached_cards = {}  # key game -> GameCard yang menunggu posisi baru
+        self.card_pool = []
+
         self.no_game_label = QLabel("🔍 Game tidak tersedia")
+        self.no_game_label.setObjectName("noGameLabel")
         self.no_game_label.setAlignment(Qt.AlignCenter)
         self.no_game_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        self.no_game_label.setStyleSheet("color: #ff6b6b; margin-top: 40px;")
         self.no_game_label.setVisible(False)
 
-        self.cards_layout = QGridLayout()
-        self.cards_layout.setSpacing(25)
-        self.cards_layout.setContentsMargins(20, 10, 20, 20)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none;")
-        content = QWidget()
-        content.setLayout(self.cards_layout)
-        scroll.setWidget(content)
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.content = QWidget()
+        self.scroll.setWidget(self.content)
+        self.scroll.verticalScrollBar().valueChanged.connect(self.update_visible_cards)
+        self.scroll.viewport().installEventFilter(self)
 
 
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self.no_game_label)
-        main_layout.addWidget(scroll)
+        main_layout.addWidget(self.scroll)
         self.setLayout(main_layout)
-        self.refresh_cards(games_data)
+        # Kartu diisi oleh MainWindow.load_library setelah jendela tampil
 
-    def refresh_cards(self, game_list):
-        while self.cards_layout.count():
-            child = self.cards_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+    def update_game(self, game):
+        # Dict game diubah di tempat → kartu yang menampilkannya diisi ulang
+        GameCard.forget_face(game)
+        for card in self.visible_cards.values():
+            if card.game is game:
+                card.set_game(game, force=True)
+
+    def eventFilter(self, obj, event):
+        if obj is self.scroll.viewport() and event.type() == QEvent.Resize:
+            self.update_visible_cards()
+        return super().eventFilter(obj, event)
 
-        if not game_list:
-            self.no_game_label.setVisible(True)
+    @staticmethod
+    def card_key(game):
+        return game["id"]
+
+    def refresh_cards(self, game_list):
+        games = [game for game in game_list if isinstance(game, dict)]
+        if len(games) == len(self.games) and all(a is b for a, b in zip(games, self.games)):
+            return
+        self.games = games
+
+        # Kartu yang sedang tampil dilepas dari posisinya, tapi tetap terikat
+        # ke game-nya: kalau game itu masih terlihat, kartunya cukup dipindah
+        for card in self.visible_cards.values():
+            previous = self.detached_cards.pop(self.card_key(card.game), None)
+            if previous is not None:
+                previous.hide()
+                self.card_pool.append(previous)
+            self.detached_cards[self.card_key(card.game)] = card
+        self.visible_cards = {}
+
+        self.no_game_label.setVisible(not self.games)
+
+        left, top, right, bottom = self.MARGINS
+        rows = -(-len(self.games) // self.COLUMNS)
+        grid_width = self.COLUMNS * self.CARD_WIDTH + (self.COLUMNS - 1) * self.SPACING
+        grid_height = rows * self.CARD_HEIGHT + max(0, rows - 1) * self.SPACING
+        self.content.setMinimumSize(left + grid_width + right, top + grid_height + bottom)
+
+        self.update_visible_cards()
+
+    def update_visible_cards(self):
+        if not self.games:
+            self.release_detached_cards()
             return
-        else:
-            self.no_game_label.setVisible(False)
 
-        row, col = 0, 0
-        for game in game_list:
-            if not isinstance(game, dict):
-                continue
-            card = GameCard(game)
-            self.cards_layout.addWidget(card, row, col)
-            col += 1
-            if col == 4:
-                col = 0
-                row += 1
+        left, top, right, bottom = self.MARGINS
+        row_height = self.CARD_HEIGHT + self.SPACING
+        col_width = self.CARD_WIDTH + self.SPACING
+        viewport = self.scroll.viewport()
+        scroll_y = self.scroll.verticalScrollBar().value()
+
+        # Rentang baris yang masuk viewport (+ cadangan)
+        rows = -(-len(self.games) // self.COLUMNS)
+        first_row = max(0, (scroll_y - top) // row_height - self.BUFFER_ROWS)
+        last_row = min(rows - 1, (scroll_y + viewport.height() - top) // row_height + self.BUFFER_ROWS)
+        wanted = range(first_row * self.COLUMNS, min(len(self.games), (last_row + 1) * self.COLUMNS))
+
+        for index in [i for i in self.visible_cards if i not in wanted]:
+            card = self.visible_cards.pop(index)
+            card.hide()
+            self.card_pool.append(card)
+
+        # Grid di tengah viewport
+        grid_width = self.COLUMNS * col_width - self.SPACING
+        x0 = max(left, (viewport.width() - grid_width) // 2)
+
+        for index in wanted:
+            card = self.visible_cards.get(index)
+            if card is None:
+                card = self.detached_cards.pop(self.card_key(self.games[index]), None)
+                if card is None and self.card_pool:
+                    card = self.card_pool.pop()
+                elif card is None:
+                    card = GameCard(bitmap=self.CARD_BITMAPS)
+                    card.setParent(self.content)
+                # set_game tidak melakukan apa-apa jika game-nya sama
+                card.set_game(self.games[index])
+                self.visible_cards[index] = card
+            row, col = divmod(index, self.COLUMNS)
+            card.move(x0 + col * col_width, top + row * row_height)
+            card.show()
+
+        # Game yang tidak lagi terlihat → kartunya kembali ke pool
+        self.release_detached_cards()
+        if last_row == rows - 1:
+            self.end_reached.emit()
+
+    def release_detached_cards(self):
+        for card in self.detached_cards.values():
+            card.hide()
+            self.card_pool.append(card)
+        self.detached_cards = {}
 
 
 # ==================== Main Window ====================
 class MainWindow(QMainWindow):
+    search_requested = pyqtSignal(int, str, int)  # generasi, query, jumlah hasil maksimal
+    index_rebuild_requested = pyqtSignal(list)  # [(id, nama, deskripsi)]
+    index_game_requested = pyqtSignal(object, str, str)  # id, nama, deskripsi
+    unindex_game_requested = pyqtSignal(object)  # id
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("DEGamesLauncher v1.0")
@@ -1134,20 +563,42 @@ class MainWindow(QMainWindow):
             self.setWindowIcon(QIcon(str(ASSETS_DIR / "DEGamesLauncher.ico")))
 
         self.setGeometry(100, 100, 1100, 750)
+        init_loader(THUMB_CACHE_DIR)
+        self.search_index = SearchIndex()
+        self.search_indexed = False  # snapshot katalog sudah dikirim ke worker
+        self.search_generation = 0
+        self.search_limit = SEARCH_PAGE
+        self.search_has_more = False  # hasil terakhir terpotong search_limit
+        self.search_thread = QThread(self)
+        self.search_worker = SearchWorker(self.search_index)
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_requested.connect(self.search_worker.run_query)
+        self.index_rebuild_requested.connect(self.search_worker.rebuild_index)
+        self.index_game_requested.connect(self.search_worker.index_game)
+        self.unindex_game_requested.connect(self.search_worker.unindex_game)
+        self.search_worker.results.connect(self.on_search_results)
+        self.search_thread.start()
+
+        self.purge_job = None
+        self.purge_again = False
+        self.trash_dirs = {TRASH_DIR}  # + trash di drive lain (lihat trash.move_to_trash)
+        self.scan_job = None
+        self.scan_again = False
+        self.watcher = None
+        # Banyak perubahan katalog beruntun (misal hasil scan) → grid diperbarui sekali
+        self.catalog_timer = QTimer(self)
+        self.catalog_timer.setSingleShot(True)
+        self.catalog_timer.setInterval(0)
+        self.catalog_timer.timeout.connect(self.apply_catalog_change)
+        # Halaman yang jarang dibuka dibuat (dan modulnya di-import) saat pertama kali dibuka
+        self.login = None
+        self.downloads = None
+        self.downloads_manager = None
 
         # ==================== TOP BAR ====================
         top_bar = QWidget()
         top_bar.setObjectName("topBar")
         top_bar.setFixedHeight(70)
-        top_bar.setStyleSheet("""
-            QWidget#topBar {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0f172a,
-                    stop:1 #1e293b
-                );
-            }
-        """)
         top_bar.setAutoFillBackground(True)
 
 
@@ -1174,38 +625,37 @@ class MainWindow(QMainWindow):
             logo_label.setAlignment(Qt.AlignCenter)
 
         title_label = QLabel("DEGamesLauncher")
+        title_label.setObjectName("appTitle")
         title_label.setFont(QFont("Segoe UI", 20, QFont.Bold))
-        title_label.setStyleSheet("""
-            color: #ffffff;
-            letter-spacing: 1px;
-            font-size: 26px;
-        """)
 
         title_layout.addWidget(logo_label)
         title_layout.addWidget(title_label)
 
         # ================= SEARCH BAR =================
         self.main_search = QLineEdit()
+        self.main_search.setObjectName("mainSearch")
         self.main_search.setPlaceholderText("🔍 Cari game...")
         self.main_search.setMinimumWidth(360)
         self.main_search.setFixedHeight(38)
-        self.main_search.setStyleSheet("""
-            QLineEdit {
-                background: rgba(255,255,255,0.08);
-                border: 1px solid #3b82f6;
-                border-radius: 10px;
-                padding-left: 14px;
-                padding-right: 14px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #60a5fa;
-                background: rgba(255,255,255,0.12);
-            }
-        """)
         self.main_search.textChanged.connect(self.on_search)
 
+        # Debounce: query baru dijalankan setelah user berhenti mengetik sebentar
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.run_search)
+
+        # Saran kata (prefix) dari index pencarian
+        self.completer_model = QStringListModel(self)
+        self.completer = QCompleter(self.completer_model, self)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.main_search.setCompleter(self.completer)
+        self.completer.highlighted[str].connect(self.on_completion_highlighted)
+        self.completer.activated[str].connect(self.on_completion_activated)
+        self.highlighted_text = None  # saran yang sedang disorot dengan panah
+        self.show_suggestions = True
+
         # ================= FINAL COMPOSE =================
         top_layout.addLayout(title_layout)
         top_layout.addStretch()
@@ -1215,7 +665,9 @@ class MainWindow(QMainWindow):
 
 
         # ==================== SIDEBAR MODERN ====================
+        # Gaya tombol ikon: QWidget#sidebar QToolButton di styles.qss
         sidebar = QWidget()
+        sidebar.setObjectName("sidebar")
         sidebar.setFixedWidth(80)
 
 
@@ -1223,32 +675,11 @@ class MainWindow(QMainWindow):
         sidebar_layout.setContentsMargins(0, 20, 0, 20)
         sidebar_layout.setSpacing(18)
 
-        # ========== ICON STYLE BASE ==========
-        btn_style = """
-        QToolButton {
-            font-size: 26px;
-            color: #94a3b8;
-            background: transparent;
-            border: none;
-            border-radius: 14px;
-            padding: 12px;
-        }
-        QToolButton:hover {
-            background: rgba(59,130,246,0.2);
-            color: #ffffff;
-        }
-        QToolButton:checked {
-            background: rgba(59,130,246,0.35);
-            color: #3b82f6;
-        }
-        """
-
         # ================== HOME ==================
         home_btn = QToolButton()
         home_btn.setText("🏠")
         home_btn.setCheckable(True)
         home_btn.setChecked(True)
-        home_btn.setStyleSheet(btn_style)
         home_btn.setCursor(QCursor(Qt.PointingHandCursor))
         home_btn.clicked.connect(self.go_to_home_main)
 
@@ -1256,16 +687,22 @@ class MainWindow(QMainWindow):
         bypass_btn = QToolButton()
         bypass_btn.setText("⚡")
         bypass_btn.setCheckable(True)
-        bypass_btn.setStyleSheet(btn_style)
         bypass_btn.setCursor(QCursor(Qt.PointingHandCursor))
         bypass_btn.clicked.connect(self.start_bypass_download)
 
+        # ================== DOWNLOADS ==================
+        downloads_btn = QToolButton()
+        downloads_btn.setText("📥")
+        downloads_btn.setCheckable(True)
+        downloads_btn.setToolTip("Unduhan")
+        downloads_btn.setCursor(QCursor(Qt.PointingHandCursor))
+        downloads_btn.clicked.connect(self.show_downloads)
+
         # ================== DONATE ==================
         donate_btn = QToolButton()
         donate_btn.setText("💖")
         donate_btn.setCheckable(False)
         donate_btn.setToolTip("Support Developer via Saweria")
-        donate_btn.setStyleSheet(btn_style)
         donate_btn.setCursor(QCursor(Qt.PointingHandCursor))
         donate_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(
@@ -1277,7 +714,6 @@ class MainWindow(QMainWindow):
         github_btn.setText("🤖")  # ikon github
         github_btn.setCheckable(False)
         github_btn.setToolTip("Buka Repository GitHub")
-        github_btn.setStyleSheet(btn_style)
         github_btn.setCursor(QCursor(Qt.PointingHandCursor))
         github_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(
@@ -1288,7 +724,6 @@ class MainWindow(QMainWindow):
         settings_btn = QToolButton()
         settings_btn.setText("⚙️")
         settings_btn.setCheckable(True)
-        settings_btn.setStyleSheet(btn_style)
         settings_btn.setCursor(QCursor(Qt.PointingHandCursor))
         settings_btn.clicked.connect(self.show_login)
 
@@ -1297,17 +732,20 @@ class MainWindow(QMainWindow):
         def set_active(btn):
             home_btn.setChecked(False)
             bypass_btn.setChecked(False)
+            downloads_btn.setChecked(False)
             settings_btn.setChecked(False)
             btn.setChecked(True)
 
         home_btn.clicked.connect(lambda: set_active(home_btn))
         bypass_btn.clicked.connect(lambda: set_active(bypass_btn))
+        downloads_btn.clicked.connect(lambda: set_active(downloads_btn))
         settings_btn.clicked.connect(lambda: set_active(settings_btn))
 
         # ================== SUSUN LAYOUT ==================
         sidebar_layout.addStretch()
         sidebar_layout.addWidget(home_btn, alignment=Qt.AlignHCenter)
         sidebar_layout.addWidget(bypass_btn, alignment=Qt.AlignHCenter)
+        sidebar_layout.addWidget(downloads_btn, alignment=Qt.AlignHCenter)
         sidebar_layout.addWidget(donate_btn, alignment=Qt.AlignHCenter)   # ✅ DONATE DI TENGAH
         sidebar_layout.addWidget(github_btn, alignment=Qt.AlignHCenter)
         sidebar_layout.addWidget(settings_btn, alignment=Qt.AlignHCenter)
@@ -1319,11 +757,9 @@ class MainWindow(QMainWindow):
         # Stack
         self.stack = QStackedWidget()
         self.home = HomeWindow()
+        self.home.end_reached.connect(self.load_more_results)
         self.home.setObjectName("homePage")
-        self.login = LoginWindow(self)
-        self.login.setObjectName("loginPage")
         self.stack.addWidget(self.home)
-        self.stack.addWidget(self.login)
 
         main_layout = QHBoxLayout()
         main_layout.setSpacing(0)
@@ -1341,21 +777,180 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(container)
 
-        # Load stylesheet
-        qss_path = BASE_DIR / "styles.qss"
-        if qss_path.exists():
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
+        # Katalog & kartu dimuat setelah frame pertama tergambar (lihat eventFilter)
+        self.library_requested = False
+        top_bar.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not self.library_requested:
+            self.library_requested = True
+            obj.removeEventFilter(self)
+            startup.mark("frame pertama")
+            QTimer.singleShot(0, self.load_library)
+        return super().eventFilter(obj, event)
+
+    def load_library(self):
+        """Buka katalog lalu isi kartu; aman dipanggil berulang kali"""
+        if catalog.loaded:
+            return
+        load_catalog()
+        startup.mark("buka katalog")
+        catalog.game_added.connect(self.on_game_added)
+        catalog.game_updated.connect(self.on_game_updated)
+        catalog.game_removed.connect(self.on_game_removed)
+        self.apply_catalog_change()
+        startup.mark("kartu game")
+        startup.report()
+
+        if catalog.store.recovered:
+            QMessageBox.warning(
+                self, "Katalog Dipulihkan",
+                "Data katalog rusak (kemungkinan aplikasi tertutup paksa).\n"
+                "Katalog dipulihkan dari backup terakhir."
+            )
+        # Sisa trash dari sesi sebelumnya (aplikasi ditutup saat purge) dibersihkan,
+        # termasuk trash di sebelah folder game yang ada di drive lain
+        parents = {os.path.dirname(game["folder"]) for game in catalog.games if game.get("folder")}
+        for parent in parents:
+            trash_dir = Path(parent) / LOCAL_TRASH_NAME
+            if trash_dir.is_dir():
+                self.trash_dirs.add(trash_dir)
+        if any(list_trash(trash_dir) for trash_dir in self.trash_dirs):
+            self.purge_trash()
+        # Folder game yang disalin langsung ke data/games (di luar panel admin)
+        self.rescan_library()
+        self.watch_library()
+
+    def index_game(self, game):
+        # Sebelum pencarian pertama perubahan cukup ikut snapshot (lihat run_search)
+        if self.search_indexed:
+            self.index_game_requested.emit(game["id"], game["name"], game.get("description", ""))
+
+    def unindex_game(self, game_id):
+        if self.search_indexed:
+            self.unindex_game_requested.emit(game_id)
+
+    # ---------- Delta dari katalog (tanpa baca ulang disk) ----------
+    def on_game_added(self, game):
+        self.index_game(game)
+        self.catalog_timer.start()
+
+    def on_game_updated(self, game):
+        self.index_game(game)
+        self.home.update_game(game)
+        self.catalog_timer.start()
+
+    def on_game_removed(self, game):
+        self.unindex_game(game["id"])
+        GameCard.forget_face(game)
+        self.catalog_timer.start()
+
+    def apply_catalog_change(self):
+        if self.watcher is not None:
+            self.watcher.watch()  # folder & cover game baru ikut dipantau
+        # Dengan filter aktif query diulang, supaya urutan relevansi ikut berubah
+        if self.main_search.text().strip():
+            self.run_search(self.search_limit)
+        else:
+            self.home.refresh_cards(catalog.games)
 
     def on_search(self, text):
-        if isinstance(self.stack.currentWidget(), HomeWindow):
-            filtered = [
-                game for game in games_data
-                if isinstance(game, dict) and text.lower() in game.get("name", "").lower()
-            ]
-            self.stack.currentWidget().refresh_cards(filtered)
+        if not isinstance(self.stack.currentWidget(), HomeWindow):
+            return
+        # Menyorot saran dengan panah ikut mengubah teks; daftar saran jangan
+        # diganti di tengah navigasi. Saran yang dipilih dicari lewat
+        # on_completion_activated.
+        if text == self.highlighted_text and self.completer.popup().isVisible():
+            return
+        self.highlighted_text = None
+        self.show_suggestions = True
+        if not text.strip():
+            # Query kosong langsung diterapkan, hasil query lama dibuang
+            self.search_timer.stop()
+            self.search_generation += 1
+            self.search_worker.latest = self.search_generation
+            self.completer_model.setStringList([])
+            self.home.refresh_cards(catalog.games)
+            return
+        self.search_timer.start()
+
+    def on_completion_highlighted(self, text):
+        self.highlighted_text = text
+
+    def on_completion_activated(self, text):
+        # Saran dipilih (Enter / klik) → langsung difilter, tanpa menunggu debounce
+        self.highlighted_text = None
+        if not isinstance(self.stack.currentWidget(), HomeWindow) or not text.strip():
+            return
+        self.show_suggestions = False
+        self.search_timer.stop()
+        self.run_search()
+
+    def run_search(self, limit=SEARCH_PAGE):
+        if not catalog.loaded:
+            return  # diulang oleh load_library
+        if not self.search_indexed:
+            # Index dibangun di worker saat pencarian pertama, dari snapshot yang
+            # diambil di sini: game dict hanya diubah di GUI thread (catalog.sync)
+            self.search_indexed = True
+            self.index_rebuild_requested.emit(
+                [(game["id"], game["name"], game.get("description", "")) for game in catalog.games]
+            )
+        self.search_generation += 1
+        self.search_worker.latest = self.search_generation
+        self.search_limit = limit
+        self.search_has_more = False
+        self.search_requested.emit(self.search_generation, self.main_search.text(), limit)
+
+    def load_more_results(self):
+        # Grid di-scroll sampai hasil terakhir → minta halaman berikutnya
+        # (urutan top-k stabil, jadi hasil lama tetap di posisinya)
+        if not self.search_has_more or not self.main_search.text().strip():
+            return
+        self.show_suggestions = False
+        self.run_search(self.search_limit + SEARCH_PAGE)
+
+    def on_search_results(self, generation, keys, suggestions):
+        if generation != self.search_generation:
+            return
+        self.search_has_more = len(keys) >= self.search_limit
+        self.home.refresh_cards([catalog.by_id[key] for key in keys if key in catalog.by_id])
+        self.completer_model.setStringList(suggestions)
+        if suggestions and self.show_suggestions and self.main_search.hasFocus():
+            self.completer.complete()
+
+    def closeEvent(self, event):
+        # Download yang belum selesai dilanjutkan dari .part saat dibuka lagi
+        if self.downloads_manager is not None:
+            self.downloads_manager.shutdown()
+        if hasattr(self, 'admin'):
+            self.admin.cancel_import(wait=True)
+        if self.purge_job is not None:
+            # Sisa trash dilanjutkan saat aplikasi dibuka lagi
+            self.purge_job.cancel()
+            self.purge_job.wait()
+        if self.watcher is not None:
+            self.watcher.stop()
+        if self.scan_job is not None:
+            self.scan_job.cancel()
+            self.scan_job.wait()
+        self.search_worker.latest = -1
+        self.search_thread.quit()
+        self.search_thread.wait()
+        get_loader().shutdown()
+        if catalog.loaded:
+            try:
+                catalog.store.backup()
+            except Exception as e:
+                print("Backup katalog gagal:", e)
+        super().closeEvent(event)
 
     def show_login(self):
+        if self.login is None:
+            from login_page import LoginWindow
+            self.login = LoginWindow(self)
+            self.login.setObjectName("loginPage")
+            self.stack.addWidget(self.login)
         self.stack.setCurrentWidget(self.login)
 
     def start_bypass_download(self):
@@ -1382,64 +977,30 @@ class MainWindow(QMainWindow):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.No:
-                self.show_download_complete(str(save_path))
+                self.show_download_complete(str(save_path), str(save_path.parent))
                 return
 
-        # Buat dialog download
-        self.download_dialog = QDialog(self)
-        self.download_dialog.setWindowTitle("📥 Mengunduh Project Lightning")
-        self.download_dialog.setFixedSize(400, 180)
-        self.download_dialog.setModal(True)
-
-        layout = QVBoxLayout()
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setTextVisible(True)
-        self.status_label = QLabel("Memulai unduhan...")
-        self.speed_label = QLabel("Kecepatan: -")
-        self.open_folder_btn = QPushButton("Buka Folder")
-        self.open_folder_btn.setEnabled(False)
-        self.open_folder_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(str(save_path.parent))))
-
-        cancel_btn = QPushButton("Batal")
-        cancel_btn.clicked.connect(self.cancel_download)
-
-        layout.addWidget(self.status_label)
-        layout.addWidget(self.progress_bar)
-        layout.addWidget(self.speed_label)
-        layout.addWidget(self.open_folder_btn)
-        layout.addWidget(cancel_btn)
-        self.download_dialog.setLayout(layout)
-
-        # Mulai download
-        self.worker = DownloadWorker(url, str(save_path))
-        self.worker.progress.connect(self.update_download_progress)
-        self.worker.finished.connect(lambda path: self.on_download_finished(path, str(save_path.parent)))
-        self.worker.error.connect(self.on_download_error)
-        self.worker.start()
-
-        self.download_dialog.exec_()
-
-    def update_download_progress(self, downloaded, total, speed):
-        percent = int(downloaded * 100 / total) if total > 0 else 0
-        self.progress_bar.setValue(percent)
-        self.progress_bar.setMaximum(100)
-        self.status_label.setText(f"Mengunduh... {self.format_bytes(downloaded)} / {self.format_bytes(total)}")
-        self.speed_label.setText(f"Kecepatan: {speed:.1f} KB/s")
-
-    def on_download_finished(self, file_path, folder_path):
-        self.worker.quit()
-        self.download_dialog.accept()
-        self.show_download_complete(file_path, folder_path)
-
-    def on_download_error(self, error_msg):
-        self.worker.quit()
-        self.download_dialog.accept()
-        QMessageBox.critical(self, "Error Download", f"Gagal mengunduh:\n{error_msg}")
-
-    def cancel_download(self):
-        if hasattr(self, 'worker'):
-            self.worker.cancel()
-        self.download_dialog.accept()
+        # Masuk antrean download; halaman lain tetap bisa dipakai selama mengunduh
+        self.show_downloads()
+        self.downloads_manager.add(url, str(save_path))
+
+    def show_downloads(self):
+        if self.downloads is None:
+            from downloads import DownloadManager
+            from downloads_page import DownloadsPage
+            self.downloads_manager = DownloadManager(parent=self)
+            self.downloads_manager.job_finished.connect(self.on_download_finished)
+            self.downloads_manager.job_failed.connect(self.on_download_error)
+            self.downloads = DownloadsPage(self, self.downloads_manager)
+            self.downloads.setObjectName("downloadsPage")
+            self.stack.addWidget(self.downloads)
+        self.stack.setCurrentWidget(self.downloads)
+
+    def on_download_finished(self, job):
+        self.show_download_complete(job.path, str(Path(job.path).parent))
+
+    def on_download_error(self, job):
+        QMessageBox.critical(self, "Error Download", f"Gagal mengunduh {job.name}:\n{job.error}")
 
     def show_download_complete(self, file_path, folder_path):
         msg = QMessageBox(self)
@@ -1465,27 +1026,122 @@ class MainWindow(QMainWindow):
     
     def show_admin(self):
         if not hasattr(self, 'admin'):
+            from admin_page import AdminWindow
+            self.load_library()
             self.admin = AdminWindow(self)
             self.admin.setObjectName("adminPage")
-        self.stack.addWidget(self.admin)
+            self.stack.addWidget(self.admin)
         self.stack.setCurrentWidget(self.admin)
 
+    # ---------- Purge trash di background ----------
+    def purge_trash(self, trash_dir=None):
+        if trash_dir is not None:
+            self.trash_dirs.add(Path(trash_dir))
+        if self.purge_job is not None:
+            self.purge_again = True
+            return
+        self.purge_again = False
+        store = get_blob_store() if STORE_DIR.exists() else None
+        self.purge_job = PurgeJob(sorted(self.trash_dirs), store)
+        self.purge_job.progress.connect(self.on_purge_progress)
+        self.purge_job.finished.connect(self.on_purge_finished)
+        self.purge_job.start()
+
+    def on_purge_progress(self, done, total):
+        if hasattr(self, 'admin'):
+            self.admin.show_purge_progress(done, total)
+
+    def on_purge_finished(self, failed):
+        self.purge_job.wait()
+        self.purge_job = None
+        if hasattr(self, 'admin'):
+            self.admin.hide_purge_progress()
+        if failed:
+            print(f"Purge trash: {failed} entri belum bisa dihapus, dicoba lagi saat start berikutnya")
+        if self.purge_again:
+            self.purge_trash()
+
+    # ---------- Scan folder game di background ----------
+    def rescan_library(self):
+        if self.scan_job is not None:
+            self.scan_again = True
+            return
+        self.scan_again = False
+        from scanner import ScanJob
+        self.scan_job = ScanJob([GAMES_DIR], catalog.store)
+        self.scan_job.finished.connect(self.on_scan_finished)
+        self.scan_job.start()
+
+    def on_scan_finished(self, result):
+        self.scan_job.wait()
+        self.scan_job = None
+        if result is not None:
+            added, removed = apply_scan(result)
+            if added or removed:
+                print(f"Scan library: {added} game baru, {removed} game hilang")
+        if self.scan_again:
+            self.rescan_library()
+
+    # ---------- Perubahan dari luar aplikasi ----------
+    def watch_library(self):
+        # catalog.db dalam mode WAL: tulisan proses lain masuk ke file -wal dulu
+        from watcher import LibraryWatcher
+        wal_path = CATALOG_PATH.with_name(CATALOG_PATH.name + "-wal")
+        self.watcher = LibraryWatcher(
+            [CATALOG_PATH, wal_path], [GAMES_DIR],
+            covers=lambda: [game.get("thumbnail") for game in catalog.games], parent=self
+        )
+        self.watcher.catalog_changed.connect(self.sync_catalog)
+        self.watcher.library_changed.connect(self.rescan_library)
+        self.watcher.covers_changed.connect(self.reload_covers)
+
+    def sync_catalog(self):
+        try:
+            changed = catalog.sync()
+        except sqlite3.Error as e:
+            print("Sinkron katalog gagal:", e)
+            return
+        if changed:
+            print(f"Katalog diubah dari luar: {changed} game diperbarui")
+
+    def reload_covers(self, paths):
+        # Cover ditimpa dari luar (path sama, isi baru) → buang versi kecil lama
+        loader = get_loader()
+        for path in paths:
+            loader.invalidate(path)
+        paths = set(paths)
+        for game in catalog.games:
+            if game.get("thumbnail") in paths:
+                self.home.update_game(game)
+
     def go_to_home_main(self):
         """Kembali ke halaman utama dari mana saja"""
         self.stack.setCurrentWidget(self.home)
 
-    def refresh_home(self):
-        global games_data
-        with open(JSON_PATH, 'r') as f:
-            games_data = json.load(f)
-        self.home.refresh_cards(games_data)
-        self.stack.setCurrentWidget(self.home)
-
 
 # ==================== Main ====================
-if __name__ == "__main__":
+def main():
+    startup.enabled = "--profile-startup" in sys.argv
+    HomeWindow.CARD_BITMAPS = "--card-bitmaps" in sys.argv
+    startup.mark("import modul")
+    if sys.platform == "win32":
+        # Ikon taskbar terpisah dari python.exe
+        import ctypes
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(u'DEGamesLauncher.degameslauncher.v1')
+
     app = QApplication(sys.argv)
     app.setFont(QFont("Segoe UI", 9))
+    # Satu stylesheet untuk seluruh aplikasi, di-parse sekali; widget cukup
+    # memberi objectName/property, tidak ada setStyleSheet per widget
+    if STYLESHEET_PATH.exists():
+        with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+            app.setStyleSheet(f.read())
+    startup.mark("QApplication")
     window = MainWindow()
+    startup.mark("MainWindow (kerangka)")
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import os
+from PyQt5.QtCore import QThread, pyqtSignal
+from importer import MARKER_NAME
+
+# thumbnail.<ext> di folder game dipakai sebagai cover (urutan = prioritas)
+THUMBNAIL_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp")
+DEFAULT_DESCRIPTION = "Tidak ada deskripsi."
+
+
+def folder_key(path):
+    """Bentuk path folder yang bisa dibandingkan (abs + huruf besar/kecil di Windows)"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def read_game_folder(path):
+    """Info game dari isi folder, None jika belum siap (kosong / masih diimpor)"""
+    thumbnails = {}
+    has_files = False
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name == MARKER_NAME:
+                    return None
+                has_files = True
+                stem, ext = os.path.splitext(entry.name)
+                if stem.lower() == "thumbnail" and ext.lower() in THUMBNAIL_EXTENSIONS:
+                    thumbnails[ext.lower()] = entry.path
+    except OSError:
+        return None
+    if not has_files:
+        return None
+    thumbnail = next((thumbnails[ext] for ext in THUMBNAIL_EXTENSIONS if ext in thumbnails), "")
+    return {"folder": path, "name": os.path.basename(path), "thumbnail": thumbnail}
+
+
+class ScanResult:
+    def __init__(self):
+        self.found = []  # folder baru/berubah: {"folder", "name", "thumbnail", "mtime_ns"}
+        self.removed = []  # folder yang ada di scan sebelumnya tapi sekarang hilang
+        self.unavailable = []  # root yang tidak bisa dibaca (game-nya tidak dianggap hilang)
+        self.visited = 0  # folder yang isinya dibaca
+
+
+def scan_library(roots, state, should_cancel=None):
+    """Bandingkan folder game di roots dengan state scan sebelumnya.
+
+    Setiap subfolder langsung dari root (kecuali yang diawali titik, misal
+    .store dan .trash) adalah satu game. state = {path folder: mtime_ns};
+    folder yang mtime-nya sama dilewati tanpa dibaca isinya, jadi scan
+    ulang library yang tidak berubah hanya butuh satu scandir per root.
+    Folder yang kosong atau masih berisi penanda impor tidak dicatat dan
+    dicek lagi pada scan berikutnya. Mengembalikan None jika dibatalkan.
+    """
+    result = ScanResult()
+    for root in roots:
+        root = os.path.abspath(root)
+        seen = set()
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            # Drive dilepas / folder belum ada → jangan hapus game dari katalog
+            result.unavailable.append(root)
+            continue
+        with entries:
+            for entry in entries:
+                if should_cancel is not None and should_cancel():
+                    return None
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if not entry.is_dir():
+                        continue
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(entry.path)
+                if state.get(entry.path) == mtime_ns:
+                    continue
+                result.visited += 1
+                info = read_game_folder(entry.path)
+                if info is not None:
+                    info["mtime_ns"] = mtime_ns
+                    result.found.append(info)
+        result.removed.extend(path for path in state if os.path.dirname(path) == root and path not in seen)
+    return result
+
+
+# ==================== Scan Job ====================
+class ScanJob(QThread):
+    """Jalankan scan_library di background; state dibaca dari CatalogStore"""
+    finished = pyqtSignal(object)  # ScanResult (None jika dibatalkan)
+
+    def __init__(self, roots, store):
+        super().__init__()
+        self.roots = list(roots)
+        self.store = store
+        self._canceled = False
+
+    def cancel(self):
+        self._canceled = True
+
+    def run(self):
+        state = self.store.scan_state()
+        self.finished.emit(scan_library(self.roots, state, lambda: self._canceled))
@@ -0,0 +1,347 @@
+import re
+import heapq
+import bisect
+import threading
+from collections import OrderedDict
+from itertools import islice
+from operator import itemgetter
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Bobot relevansi per jenis kecocokan (semakin besar semakin atas)
+NAME_EXACT = 8.0
+NAME_PREFIX = 6.0
+DESC_EXACT = 3.0
+DESC_PREFIX = 2.0
+NAME_FUZZY = 1.5
+DESC_FUZZY = 0.5
+
+# Prefix sependek ini hanya dicari di nama (deskripsi terlalu ramai)
+MIN_DESC_PREFIX = 4
+# Prefix nama sepanjang ini atau kurang disimpan langsung saat indexing
+SHORT_PREFIX = 2
+# Kata sependek ini tidak dicari dengan fuzzy
+MIN_FUZZY_LENGTH = 4
+PREFIX_CACHE_SIZE = 256
+RESULT_CACHE_SIZE = 64
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.casefold()) if text else []
+
+
+def _deletes(token):
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+def _within_one_edit(a, b):
+    """True jika a dan b berbeda maksimal 1 edit (sisip/hapus/ganti/tukar)"""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    i = 0
+    while i < min(la, lb) and a[i] == b[i]:
+        i += 1
+    if la == lb:
+        if a[i + 1:] == b[i + 1:]:
+            return True
+        # Dua huruf bertukar tempat
+        return a[i:i + 2] == b[i:i + 2][::-1] and a[i + 2:] == b[i + 2:]
+    if la > lb:
+        return a[i + 1:] == b[i:]
+    return a[i:] == b[i + 1:]
+
+
+# ==================== Search Index ====================
+class SearchIndex:
+    """Index pencarian di memori untuk nama & deskripsi game.
+
+    Key dokumen bebas (hashable). Kata terakhir query diperlakukan sebagai
+    prefix (sedang diketik), kata lain harus cocok persis atau lewat
+    toleransi typo 1 edit. Hasil diurutkan menurut relevansi lalu urutan
+    masuk ke index.
+    """
+
+    def __init__(self, entries=()):
+        self.lock = threading.RLock()
+        self.keys = []  # doc id -> key (None jika sudah dihapus)
+        self.doc_ids = {}  # key -> doc id
+        self.doc_tokens = {}  # doc id -> (token nama, token deskripsi)
+        self.name_postings = {}  # token -> set(doc id)
+        self.desc_postings = {}
+        self.name_short_prefixes = {}  # prefix 1-2 huruf -> set(doc id)
+        self.vocab = []  # semua token, terurut (untuk prefix)
+        self.delete_index = {}  # varian hapus-1-huruf -> set(token)
+        self.prefix_cache = OrderedDict()
+        self.result_cache = OrderedDict()  # (query, limit) -> hasil
+        for key, name, description in entries:
+            self.add(key, name, description)
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    # ---------- Mutasi ----------
+    def add(self, key, name, description=""):
+        with self.lock:
+            doc = self.doc_ids.get(key)
+            if doc is None:
+                doc = len(self.keys)
+                self.keys.append(key)
+                self.doc_ids[key] = doc
+            else:
+                # Update: posisi (urutan) dokumen dipertahankan
+                self._unindex(doc)
+            name_tokens = set(tokenize(name))
+            desc_tokens = set(tokenize(description)) - name_tokens
+            self.doc_tokens[doc] = (name_tokens, desc_tokens)
+            for token in name_tokens:
+                self._post(self.name_postings, token, doc)
+                for size in range(1, min(SHORT_PREFIX, len(token)) + 1):
+                    self.name_short_prefixes.setdefault(token[:size], set()).add(doc)
+            for token in desc_tokens:
+                self._post(self.desc_postings, token, doc)
+            self._invalidate_caches()
+
+    def update(self, key, name, description=""):
+        self.add(key, name, description)
+
+    def remove(self, key):
+        with self.lock:
+            doc = self.doc_ids.pop(key, None)
+            if doc is None:
+                return
+            self.keys[doc] = None
+            self._unindex(doc)
+            self._invalidate_caches()
+
+    def clear(self):
+        with self.lock:
+            self.__init__()
+
+    def rebuild(self, entries):
+        """Isi ulang seluruh index (key, nama, deskripsi) dalam satu lock"""
+        with self.lock:
+            self.__init__(entries)
+
+    def _invalidate_caches(self):
+        self.prefix_cache.clear()
+        self.result_cache.clear()
+
+    def _unindex(self, doc):
+        name_tokens, desc_tokens = self.doc_tokens.pop(doc)
+        for token in name_tokens:
+            self._unpost(self.name_postings, token, doc)
+            for size in range(1, min(SHORT_PREFIX, len(token)) + 1):
+                docs = self.name_short_prefixes.get(token[:size])
+                if docs is not None:
+                    docs.discard(doc)
+                    if not docs:
+                        del self.name_short_prefixes[token[:size]]
+        for token in desc_tokens:
+            self._unpost(self.desc_postings, token, doc)
+
+    def _post(self, postings, token, doc):
+        docs = postings.get(token)
+        if docs is None:
+            docs = postings[token] = set()
+            other = self.desc_postings if postings is self.name_postings else self.name_postings
+            if token not in other:
+                self._add_vocab(token)
+        docs.add(doc)
+
+    def _unpost(self, postings, token, doc):
+        docs = postings[token]
+        docs.discard(doc)
+        if not docs:
+            del postings[token]
+            if token not in self.name_postings and token not in self.desc_postings:
+                self._remove_vocab(token)
+
+    def _add_vocab(self, token):
+        i = bisect.bisect_left(self.vocab, token)
+        if i < len(self.vocab) and self.vocab[i] == token:
+            return
+        self.vocab.insert(i, token)
+        for variant in _deletes(token):
+            self.delete_index.setdefault(variant, set()).add(token)
+
+    def _remove_vocab(self, token):
+        i = bisect.bisect_left(self.vocab, token)
+        if i < len(self.vocab) and self.vocab[i] == token:
+            del self.vocab[i]
+        for variant in _deletes(token):
+            tokens = self.delete_index.get(variant)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self.delete_index[variant]
+
+    # ---------- Query ----------
+    def search(self, query, limit=None, should_cancel=None):
+        """Kembalikan list key yang cocok, paling relevan di depan"""
+        with self.lock:
+            cache_key = (query, limit)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.result_cache.move_to_end(cache_key)
+                return list(cached)
+
+            results = self._search(query, limit, should_cancel)
+            if results is not None:
+                self.result_cache[cache_key] = results
+                if len(self.result_cache) > RESULT_CACHE_SIZE:
+                    self.result_cache.popitem(last=False)
+                results = list(results)
+            return results
+
+    def _search(self, query, limit, should_cancel):
+        terms = tokenize(query)
+        if not terms:
+            keys = [key for key in self.keys if key is not None]
+            return keys[:limit] if limit else keys
+
+        typing = not query[-1:].isspace()
+        tiers_per_term = []
+        for i, term in enumerate(terms):
+            if should_cancel is not None and should_cancel():
+                return None
+            tiers = self._match_term(term, prefix=typing and i == len(terms) - 1)
+            if not tiers:
+                return []
+            tiers_per_term.append(tiers)
+
+        if len(tiers_per_term) == 1:
+            ranked = self._rank_single(tiers_per_term[0], limit)
+        else:
+            ranked = self._rank_multi(tiers_per_term, limit)
+        if len(ranked) == 1:
+            return [self.keys[ranked[0]]]
+        return list(itemgetter(*ranked)(self.keys)) if ranked else []
+
+    def complete(self, query, limit=8):
+        """Saran query: kata terakhir dilengkapi dengan token yang ada di index"""
+        with self.lock:
+            terms = tokenize(query)
+            if not terms or query[-1:].isspace():
+                return []
+            head = query[:list(TOKEN_RE.finditer(query))[-1].start()]
+            candidates = [
+                token for token in self._vocab_range(terms[-1])
+                if token != terms[-1]
+            ]
+            candidates.sort(key=lambda t: (
+                -len(self.name_postings.get(t, ())) * 4 - len(self.desc_postings.get(t, ())), t
+            ))
+            return [head + token for token in candidates[:limit]]
+
+    def _vocab_range(self, prefix):
+        lo = bisect.bisect_left(self.vocab, prefix)
+        hi = bisect.bisect_left(self.vocab, prefix + "\U0010ffff", lo)
+        return self.vocab[lo:hi]
+
+    def _prefix_docs(self, prefix, field):
+        """Gabungan posting semua token berawalan prefix (di-cache per prefix)"""
+        if field == "name" and len(prefix) <= SHORT_PREFIX:
+            return self.name_short_prefixes.get(prefix, set())
+        postings = self.name_postings if field == "name" else self.desc_postings
+        cache_key = (field, prefix)
+        docs = self.prefix_cache.get(cache_key)
+        if docs is not None:
+            self.prefix_cache.move_to_end(cache_key)
+            return docs
+        docs = set().union(*[postings[t] for t in self._vocab_range(prefix) if t in postings])
+        self.prefix_cache[cache_key] = docs
+        if len(self.prefix_cache) > PREFIX_CACHE_SIZE:
+            self.prefix_cache.popitem(last=False)
+        return docs
+
+    def _match_term(self, term, prefix):
+        """List (bobot, set doc) untuk satu kata query, bobot menurun"""
+        tiers = []
+        empty = set()
+        name_exact = self.name_postings.get(term, empty)
+        desc_exact = self.desc_postings.get(term, empty)
+        if name_exact:
+            tiers.append((NAME_EXACT, name_exact))
+        if prefix:
+            name_prefix = self._prefix_docs(term, "name")
+            if name_prefix:
+                tiers.append((NAME_PREFIX, name_prefix))
+        if desc_exact:
+            tiers.append((DESC_EXACT, desc_exact))
+        if prefix and len(term) >= MIN_DESC_PREFIX:
+            desc_prefix = self._prefix_docs(term, "description")
+            if desc_prefix:
+                tiers.append((DESC_PREFIX, desc_prefix))
+        if tiers or len(term) < MIN_FUZZY_LENGTH:
+            return tiers
+
+        # Tidak ada yang cocok → coba toleransi typo 1 edit
+        candidates = set(self.delete_index.get(term, ()))
+        for variant in _deletes(term) | {term}:
+            if variant in self.name_postings or variant in self.desc_postings:
+                candidates.add(variant)
+            candidates.update(self.delete_index.get(variant, ()))
+        candidates = [t for t in candidates if _within_one_edit(term, t)]
+        name_fuzzy = set().union(*[self.name_postings.get(t, empty) for t in candidates])
+        desc_fuzzy = set().union(*[self.desc_postings.get(t, empty) for t in candidates])
+        if name_fuzzy:
+            tiers.append((NAME_FUZZY, name_fuzzy))
+        if desc_fuzzy:
+            tiers.append((DESC_FUZZY, desc_fuzzy))
+        return tiers
+
+    def _rank_single(self, tiers, limit):
+        # Satu kata: urutkan per tingkat, dalam tingkat menurut urutan masuk
+        ranked = []
+        seen = set()
+        for _, docs in tiers:
+            need = limit - len(ranked) if limit else 0
+            if not limit or len(docs) <= 4 * need:
+                fresh = docs - seen if seen else docs
+                if limit and len(fresh) >= need:
+                    ranked.extend(heapq.nsmallest(need, fresh))
+                    return ranked
+                ranked.extend(sorted(fresh))
+                seen |= fresh
+                continue
+            # Tingkat besar (misal prefix 1-3 huruf): cukup ambil `need` doc
+            # terkecil, tanpa menyalin / mengurutkan seluruh set
+            picked = self._smallest(docs, need, seen)
+            ranked.extend(picked)
+            if len(ranked) >= limit:
+                return ranked
+            seen.update(picked)
+        return ranked
+
+    def _smallest(self, docs, count, seen):
+        """count doc id terkecil di docs yang belum ada di seen, terurut"""
+        total = len(self.keys)
+        if count * total < len(docs) * len(docs):
+            # Set padat: jalan dari doc 0, rata-rata hanya ~count * total / len(docs) langkah
+            fresh = (doc for doc in range(total) if doc in docs and doc not in seen)
+            return list(islice(fresh, count))
+        return heapq.nsmallest(count, docs - seen if seen else docs)
+
+    @staticmethod
+    def _rank_multi(tiers_per_term, limit):
+        # Banyak kata: semua kata harus cocok, skor = jumlah bobot terbaik per kata
+        # Satu tingkat → set posting dipakai langsung (tanpa salinan); irisan dari yang terkecil
+        matches = [tiers[0][1] if len(tiers) == 1 else set().union(*[docs for _, docs in tiers])
+                   for tiers in tiers_per_term]
+        matches.sort(key=len)
+        candidates = matches[0].intersection(*matches[1:])
+        scores = {}
+        for doc in candidates:
+            score = 0.0
+            for tiers in tiers_per_term:
+                for weight, docs in tiers:
+                    if doc in docs:
+                        score += weight
+                        break
+            scores[doc] = score
+        if limit:
+            return heapq.nsmallest(limit, scores, key=lambda doc: (-scores[doc], doc))
+        return sorted(scores, key=lambda doc: (-scores[doc], doc))
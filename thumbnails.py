@@ -0,0 +1,227 @@
+import os
+import hashlib
+import threading
+from pathlib import Path
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+# Cache pixmap di memori (KB), cukup untuk beberapa layar kartu 200x200
+PIXMAP_CACHE_KB = 64 * 1024
+# Batas ukuran cache thumbnail di disk
+DISK_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def thumbnail_key(path, size, mode=Qt.IgnoreAspectRatio):
+    return f"{path}@{size.width()}x{size.height()}/{int(mode)}"
+
+
+# ==================== Disk Cache ====================
+class ThumbnailDiskCache:
+    """Thumbnail yang sudah diperkecil, disimpan sebagai PNG kecil di disk.
+
+    Nama file = hash(path sumber) + hash(mtime, ukuran file, ukuran target),
+    jadi cover yang berubah otomatis dapat entri baru. Evict LRU berdasarkan
+    mtime file cache (di-touch setiap kali dipakai).
+    """
+
+    def __init__(self, root, max_bytes=DISK_CACHE_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.total_bytes = None  # dihitung saat pertama kali menulis
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _source_prefix(source):
+        return hashlib.sha1(os.path.normcase(os.path.abspath(source)).encode("utf-8")).hexdigest()[:16]
+
+    def entry_path(self, source, width, height, mode):
+        try:
+            st = os.stat(source)
+        except OSError:
+            return None
+        variant = f"{st.st_mtime_ns}:{st.st_size}:{width}x{height}:{mode}"
+        digest = hashlib.sha1(variant.encode("utf-8")).hexdigest()[:16]
+        return self.root / f"{self._source_prefix(source)}_{digest}.png"
+
+    def lookup(self, entry):
+        try:
+            os.utime(entry)
+            return entry
+        except OSError:
+            return None
+
+    def commit(self, tmp_path, entry):
+        """Pindahkan file sementara ke entri cache lalu evict jika melebihi batas"""
+        os.replace(tmp_path, entry)
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(e.stat().st_size for e in self._entries())
+            else:
+                self.total_bytes += entry.stat().st_size
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def invalidate(self, source):
+        prefix = self._source_prefix(source) + "_"
+        with self.lock:
+            for entry in self._entries():
+                if entry.name.startswith(prefix):
+                    self._remove(entry)
+
+    def _entries(self):
+        try:
+            return [e for e in os.scandir(self.root) if e.is_file() and e.name.endswith(".png")]
+        except FileNotFoundError:
+            return []
+
+    def _remove(self, entry):
+        try:
+            size = entry.stat().st_size
+            os.remove(entry.path)
+        except OSError:
+            return
+        if self.total_bytes is not None:
+            self.total_bytes -= size
+
+    def _evict(self):
+        # Buang yang paling lama tidak dipakai sampai tersisa 90% dari batas
+        target = self.max_bytes * 9 // 10
+        for entry in sorted(self._entries(), key=lambda e: e.stat().st_mtime):
+            if self.total_bytes <= target:
+                break
+            self._remove(entry)
+
+
+# ==================== Decode Task ====================
+class _DecodeSignals(QObject):
+    done = pyqtSignal(str, QImage)
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, key, path, size, mode, signals, disk_cache=None):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.size = size
+        self.mode = mode
+        self.signals = signals
+        self.disk_cache = disk_cache
+        self.setAutoDelete(False)
+
+    def run(self):
+        entry = None
+        if self.disk_cache is not None:
+            entry = self.disk_cache.entry_path(self.path, self.size.width(), self.size.height(), int(self.mode))
+            if entry is not None and self.disk_cache.lookup(entry):
+                image = QImageReader(str(entry)).read()
+                if not image.isNull():
+                    self.signals.done.emit(self.key, image)
+                    return
+
+        image = self.decode()
+        if entry is not None and not image.isNull():
+            self.store(entry, image)
+        self.signals.done.emit(self.key, image)
+
+    def store(self, entry, image):
+        tmp_path = entry.with_name(f"{entry.stem}.{threading.get_ident()}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            if image.save(str(tmp_path), "PNG"):
+                self.disk_cache.commit(tmp_path, entry)
+        except OSError:
+            pass
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def decode(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid():
+            # Decode langsung ke ukuran kecil (JPEG bisa skip sebagian besar data)
+            reader.setScaledSize(source_size.scaled(self.size, self.mode))
+        else:
+            reader.setScaledSize(self.size)
+        return reader.read()
+
+
+# ==================== Thumbnail Loader ====================
+class ThumbnailLoader(QObject):
+    """Decode & scale thumbnail di thread pool, hasil dikirim lewat sinyal ready"""
+    ready = pyqtSignal(str, QPixmap)  # key, pixmap (null jika gagal)
+
+    def __init__(self, cache_dir=None, parent=None):
+        super().__init__(parent)
+        self.disk_cache = ThumbnailDiskCache(cache_dir) if cache_dir else None
+        self.memory_keys = {}  # path -> key yang ada di QPixmapCache
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_KB))
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount() - 1))
+        self.pending = {}  # key -> _DecodeTask
+        self.signals = _DecodeSignals()
+        self.signals.done.connect(self._on_decoded)
+
+    def request(self, path, size, mode=Qt.IgnoreAspectRatio):
+        """Kembalikan pixmap jika sudah ada di cache, selain itu jadwalkan decode"""
+        if isinstance(size, int):
+            size = QSize(size, size)
+        key = thumbnail_key(path, size, mode)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        if key not in self.pending:
+            task = _DecodeTask(key, path, size, mode, self.signals, self.disk_cache)
+            self.pending[key] = task
+            self.pool.start(task)
+        return None
+
+    def cancel(self, path, size, mode=Qt.IgnoreAspectRatio):
+        """Batalkan decode yang belum mulai (misal kartu sudah keluar layar)"""
+        if isinstance(size, int):
+            size = QSize(size, size)
+        key = thumbnail_key(path, size, mode)
+        task = self.pending.get(key)
+        if task is not None and self.pool.tryTake(task):
+            del self.pending[key]
+
+    def shutdown(self):
+        """Buang antrean decode & tunggu yang sedang berjalan (saat aplikasi ditutup)"""
+        self.pool.clear()
+        self.pool.waitForDone()
+        self.pending.clear()
+
+    def invalidate(self, path):
+        """Buang semua versi thumbnail dari path ini (memori & disk)"""
+        for key in self.memory_keys.pop(path, ()):
+            QPixmapCache.remove(key)
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(path)
+
+    def _on_decoded(self, key, image):
+        task = self.pending.pop(key, None)
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+            if task is not None:
+                self.memory_keys.setdefault(task.path, set()).add(key)
+        self.ready.emit(key, pixmap)
+
+
+_loader = None
+
+
+def init_loader(cache_dir):
+    global _loader
+    if _loader is None:
+        _loader = ThumbnailLoader(cache_dir)
+    return _loader
+
+
+def get_loader():
+    global _loader
+    if _loader is None:
+        _loader = ThumbnailLoader()
+    return _loader
@@ -0,0 +1,118 @@
+import os
+import stat
+import errno
+import time
+from pathlib import Path
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# Nama trash di drive lain; khusus aplikasi ini, jadi folder ".trash" milik orang lain tidak ikut di-purge
+LOCAL_TRASH_NAME = ".degames-trash"
+
+
+def move_to_trash(folder, trash_dir):
+    """Pindahkan folder ke trash (rename, instan di drive yang sama).
+
+    Folder di drive / file system lain tidak bisa di-rename ke trash_dir
+    (EXDEV); untuk folder itu dipakai trash LOCAL_TRASH_NAME di sebelahnya,
+    yang pasti satu drive. Mengembalikan path baru folder di dalam trash.
+    """
+    folder, trash_dir = Path(folder), Path(trash_dir)
+    name = f"{time.time_ns()}-{folder.name}"
+    trash_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        os.rename(folder, trash_dir / name)
+        return trash_dir / name
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    local_trash = folder.parent / LOCAL_TRASH_NAME
+    local_trash.mkdir(exist_ok=True)
+    os.rename(folder, local_trash / name)
+    return local_trash / name
+
+
+def list_trash(trash_dir):
+    try:
+        return [Path(entry.path) for entry in os.scandir(trash_dir)]
+    except FileNotFoundError:
+        return []
+
+
+def _remove(path, is_dir):
+    try:
+        os.rmdir(path) if is_dir else os.remove(path)
+    except PermissionError:
+        # File read-only (Windows) → buka proteksi lalu coba lagi
+        os.chmod(path, stat.S_IWRITE)
+        os.rmdir(path) if is_dir else os.remove(path)
+
+
+# ==================== Purge Job ====================
+class PurgeJob(QThread):
+    """Hapus isi satu atau beberapa folder trash di background.
+
+    Folder yang masuk trash selagi job berjalan ikut dibersihkan (trash
+    di-scan ulang sampai kosong). File yang gagal dihapus (misal masih
+    dipakai) dibiarkan dan dicoba lagi saat aplikasi dibuka berikutnya.
+    """
+    progress = pyqtSignal(int, int)  # file terhapus, total file
+    finished = pyqtSignal(int)  # jumlah file yang gagal dihapus
+
+    def __init__(self, trash_dirs, store=None):
+        super().__init__()
+        self.trash_dirs = [Path(trash_dir) for trash_dir in trash_dirs]
+        self.store = store
+        self._canceled = False
+
+    def cancel(self):
+        self._canceled = True
+
+    def run(self):
+        failed = set()
+        while not self._canceled:
+            entries = [e for trash_dir in self.trash_dirs for e in list_trash(trash_dir) if e not in failed]
+            if not entries:
+                break
+            for entry in entries:
+                if self._canceled:
+                    return
+                if not self.purge(entry):
+                    failed.add(entry)
+
+        if self.store is not None and not self._canceled:
+            # Blob dedup yang tidak di-link game mana pun lagi
+            self.store.collect(lambda: self._canceled)
+        if not self._canceled:
+            self.finished.emit(len(failed))
+
+    def purge(self, entry):
+        """Hapus satu entri trash, True jika bersih"""
+        if entry.is_file() or entry.is_symlink():
+            try:
+                _remove(entry, False)
+                return True
+            except OSError:
+                return False
+
+        paths = []
+        for root, dirs, files in os.walk(entry, topdown=False):
+            paths.extend((os.path.join(root, name), False) for name in files)
+            paths.extend((os.path.join(root, name), True) for name in dirs
+                         if not os.path.islink(os.path.join(root, name)))
+            # Symlink ke folder dihapus sebagai file, isinya tidak disentuh
+            paths.extend((os.path.join(root, name), False) for name in dirs
+                         if os.path.islink(os.path.join(root, name)))
+        paths.append((str(entry), True))
+
+        total = len(paths)
+        clean = True
+        for done, (path, is_dir) in enumerate(paths, 1):
+            if self._canceled:
+                return False
+            try:
+                _remove(path, is_dir)
+            except OSError:
+                clean = False
+            if done % 256 == 0 or done == total:
+                self.progress.emit(done, total)
+        return clean
@@ -8,6 +8,19 @@ STEAM_CONFIG = Path("C:/Program Files (x86)/Steam/config")
 DEPOTCACHE = STEAM_CONFIG / "depotcache"
 STPLUGIN = STEAM_CONFIG / "stplug-in"
 
+def replace_atomic(tmp_path, path):
+    """fsync file sementara lalu rename ke tujuan, jadi tujuan tidak pernah setengah jadi"""
+    with open(tmp_path, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if os.name != "nt":
+        # Rename baru aman setelah entri direktori ikut di-fsync
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
 def copy_to_steam(game_folder):
     DEPOTCACHE.mkdir(parents=True, exist_ok=True)
     STPLUGIN.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,166 @@
+import os
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+# Rentetan event (misal satu transaksi SQLite, salin banyak folder) digabung jadi satu
+DEBOUNCE_MS = 300
+# Interval cek mtime untuk path yang tidak bisa dipantau QFileSystemWatcher
+POLL_MS = 2000
+# Watch baru dipasang bertahap (per giliran event loop) supaya library besar tidak membekukan UI
+WATCH_BATCH = 500
+
+
+def path_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def game_dirs(root):
+    """Subfolder langsung dari root (satu folder = satu game, lihat scanner)"""
+    try:
+        with os.scandir(root) as entries:
+            return [entry.path for entry in entries if not entry.name.startswith(".") and entry.is_dir()]
+    except OSError:
+        return []
+
+
+# ==================== Library Watcher ====================
+class LibraryWatcher(QObject):
+    """Pantau file katalog, folder library & cover game, umumkan perubahan setelah reda.
+
+    Yang dipantau: catalog_files, setiap folder di library_dirs beserta
+    subfolder langsungnya (folder game), dan file cover dari covers()
+    (dipanggil ulang setiap watch(), misal setelah katalog berubah).
+    QFileSystemWatcher (inotify / ReadDirectoryChangesW) dipakai jika bisa;
+    path yang tidak bisa dipantau (belum ada, batas watch OS habis, file
+    system jaringan, atau polling=True) dicek lewat mtime & ukuran setiap
+    POLL_MS. Semua event di-debounce DEBOUNCE_MS, lalu catalog_changed /
+    library_changed / covers_changed dikirim sekali. File katalog dipasang
+    ulang setiap kali, karena file yang diganti lewat rename atomik tidak
+    lagi terpantau.
+
+    Batasan: folder game hanya melaporkan file/subfolder yang dibuat, dihapus
+    atau di-rename langsung di dalamnya. Isi file yang ditimpa di tempat
+    (selain cover) dan perubahan di subfolder yang lebih dalam tidak terlihat.
+    """
+    catalog_changed = pyqtSignal()
+    library_changed = pyqtSignal()
+    covers_changed = pyqtSignal(list)  # path cover yang isinya berubah
+
+    def __init__(self, catalog_files, library_dirs, covers=None, polling=False, parent=None):
+        super().__init__(parent)
+        self.catalog_files = [str(path) for path in catalog_files]
+        self.library_dirs = [str(path) for path in library_dirs]
+        self.covers = covers
+        self.kinds = {}  # path yang dipantau -> "catalog" / "library" / "cover"
+        self.signatures = {}
+        self.pending = set()
+        self.pending_covers = set()
+        self.polled = set()
+        self.queue = []  # path yang belum sempat dipasang (lihat WATCH_BATCH)
+
+        self.watcher = None if polling else QFileSystemWatcher(self)
+        if self.watcher is not None:
+            self.watcher.fileChanged.connect(self.on_path_changed)
+            self.watcher.directoryChanged.connect(self.on_path_changed)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.flush)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(POLL_MS)
+        self.poll_timer.timeout.connect(self.poll)
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setSingleShot(True)
+        self.watch_timer.setInterval(0)
+        self.watch_timer.timeout.connect(self.watch_more)
+        self.watch()
+
+    def targets(self):
+        # Urutan = urutan pemasangan: katalog & root library dulu, lalu folder game & cover
+        kinds = {path: "catalog" for path in self.catalog_files}
+        for root in self.library_dirs:
+            kinds[root] = "library"
+        for root in self.library_dirs:
+            for path in game_dirs(root):
+                kinds[path] = "library"
+        for path in self.covers() if self.covers is not None else ():
+            if path:
+                kinds.setdefault(str(path), "cover")
+        return kinds
+
+    def watch(self):
+        """Samakan daftar watch dengan isi library & daftar cover saat ini"""
+        self.kinds = self.targets()
+        self.polled = set()
+        self.signatures = {}
+        if self.watcher is None:
+            self.queue = []
+            self.poll_later(self.kinds)
+            return
+        watched = set(self.watcher.files() + self.watcher.directories())
+        stale = [path for path in watched if self.kinds.get(path) in (None, "catalog")]
+        if stale:
+            self.watcher.removePaths(stale)
+            watched.difference_update(stale)
+        self.queue = [path for path in self.kinds if path not in watched]
+        self.watch_more()
+
+    def watch_more(self):
+        batch, self.queue = self.queue[:WATCH_BATCH], self.queue[WATCH_BATCH:]
+        missing = {path for path in batch if not os.path.exists(path)}
+        added = [path for path in batch if path not in missing]
+        failed = self.watcher.addPaths(added) if added else []
+        self.poll_later(missing.union(failed))
+        if self.queue:
+            self.watch_timer.start()
+
+    def poll_later(self, paths):
+        # Snapshot baru; perubahan sebelum ini sudah ditangani (atau sedang di-flush)
+        for path in paths:
+            self.polled.add(path)
+            self.signatures[path] = path_signature(path)
+        if self.polled:
+            self.poll_timer.start()
+        else:
+            self.poll_timer.stop()
+
+    def stop(self):
+        self.debounce_timer.stop()
+        self.watch_timer.stop()
+        self.poll_timer.stop()
+        self.queue = []
+        self.pending.clear()
+        self.pending_covers.clear()
+        if self.watcher is not None:
+            watched = self.watcher.files() + self.watcher.directories()
+            if watched:
+                self.watcher.removePaths(watched)
+
+    def on_path_changed(self, path):
+        kind = self.kinds.get(path, "library")
+        self.pending.add(kind)
+        if kind == "cover":
+            self.pending_covers.add(path)
+        self.debounce_timer.start()
+
+    def poll(self):
+        for path in self.polled:
+            signature = path_signature(path)
+            if signature != self.signatures.get(path):
+                self.signatures[path] = signature
+                self.on_path_changed(path)
+
+    def flush(self):
+        kinds, self.pending = self.pending, set()
+        covers, self.pending_covers = sorted(self.pending_covers), set()
+        self.watch()
+        if "catalog" in kinds:
+            self.catalog_changed.emit()
+        if "library" in kinds:
+            self.library_changed.emit()
+        if covers:
+            self.covers_changed.emit(covers)